@@ -0,0 +1,105 @@
+"""Microbenchmarks: bytes-level FSAPI parser vs. the previous ElementTree parsing.
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py
+
+Only the standard library is needed; parser.py is loaded straight from the
+integration directory.
+"""
+import importlib.util
+from pathlib import Path
+import timeit
+import xml.etree.ElementTree as ET
+
+PARSER_PATH = Path(__file__).resolve().parents[1] / "custom_components" / "frontier_silicon_advanced" / "parser.py"
+_spec = importlib.util.spec_from_file_location("fsapi_parser", PARSER_PATH)
+parser = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parser)
+
+SCALAR = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b"<fsapiResponse>\n<status>FS_OK</status>\n"
+    b"<value><c8_array>Radio 1 - The Best Music &amp; News</c8_array></value>\n"
+    b"</fsapiResponse>\n"
+)
+
+
+def _list_body(count: int) -> bytes:
+    items = b"".join(
+        b'<item key="%d">'
+        b'<field name="name"><c8_array>Station %d &amp; Friends</c8_array></field>'
+        b'<field name="type"><u8>1</u8></field>'
+        b'<field name="subtype"><u8>0</u8></field>'
+        b"</item>\n" % (i, i)
+        for i in range(count)
+    )
+    return b'<?xml version="1.0" encoding="UTF-8"?>\n<fsapiResponse>\n<status>FS_OK</status>\n' + items + b"<listend/>\n</fsapiResponse>\n"
+
+
+LIST_SMALL = _list_body(40)
+LIST_LARGE = _list_body(1000)
+
+
+def et_scalar(body: bytes):
+    """Previous FrontierSiliconAPI.get_value parsing."""
+    root = ET.fromstring(body.decode())
+    status = root.find("status").text.strip()
+    value_elem = root.find(".//value")
+    for child in value_elem:
+        if child.text is not None:
+            return child.text, status
+    return value_elem.text, status
+
+
+def et_list(body: bytes):
+    """Previous FrontierSiliconAPI.list_get_next parsing."""
+    root = ET.fromstring(body.decode())
+    items = []
+    for item in root.findall(".//item"):
+        item_data = {}
+        item_key = item.get("key")
+        if item_key is not None:
+            item_data["key"] = item_key
+        for field in item.findall("field"):
+            name = field.get("name", "")
+            for value_type in ("c8_array", "u8", "u16", "u32", "s8", "s16", "s32"):
+                v = field.find(value_type)
+                if v is not None and v.text is not None:
+                    item_data[name] = v.text
+                    break
+        items.append(item_data)
+    return items
+
+
+def fast_scalar(body: bytes):
+    return parser.parse_value(body), parser.parse_status(body)
+
+
+def fast_list(body: bytes):
+    return list(parser.iter_list_items(body))
+
+
+def _bench(func, body: bytes, number: int) -> float:
+    """Return the best time per call in microseconds."""
+    return min(timeit.repeat(lambda: func(body), number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    assert et_scalar(SCALAR)[0] == fast_scalar(SCALAR)[0]
+    assert len(et_list(LIST_LARGE)) == len(fast_list(LIST_LARGE))
+
+    cases = [
+        ("scalar GET", et_scalar, fast_scalar, SCALAR, 20000),
+        ("list, 40 items", et_list, fast_list, LIST_SMALL, 500),
+        ("list, 1000 items", et_list, fast_list, LIST_LARGE, 20),
+    ]
+    print(f"{'case':<18}{'ElementTree':>14}{'bytes parser':>15}{'speedup':>10}")
+    for name, old, new, body, number in cases:
+        old_us = _bench(old, body, number)
+        new_us = _bench(new, body, number)
+        print(f"{name:<18}{old_us:>11.1f} us{new_us:>12.1f} us{old_us / new_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """My Frontier Silicon Integration for Home Assistant."""
 import logging
+from typing import Optional
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .coordinator import FrontierSiliconCoordinator
+from .const import DEFAULT_PORT, DOMAIN, STORAGE_KEY, STORAGE_VERSION
+from .coordinator import FrontierSiliconCoordinator, async_get_shared_session
+from .discovery import async_probe_host
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,11 +27,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up My Frontier Silicon from a config entry."""
     _LOGGER.info("Setting up My Frontier Silicon integration")
     
-    # Create coordinator
+    # Create coordinator from the cached catalog; nothing is read from the radio yet
     coordinator = FrontierSiliconCoordinator(hass, entry)
-    
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_restore()
     
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
@@ -36,6 +38,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # First load runs in the background so startup doesn't wait for the radio;
+    # it is cancelled if the entry is unloaded first
+    entry.async_create_background_task(
+        hass, coordinator.async_first_load(), f"{DOMAIN} first load {entry.title}"
+    )
+    
     return True
 
 
@@ -57,3 +65,47 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id)
     
     return unload_ok
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry.
+
+    Version 1 entries were keyed by friendly name (or host); version 2 keys
+    them by radio id. The radio id comes from the cached catalog, else from
+    the radio's /device descriptor; if neither is available the entry stays
+    at version 1 and is migrated on a later start.
+    """
+    if entry.version > 2:
+        return False  # created by a newer version of the integration
+    if entry.version == 1:
+        radio_id = await _async_read_radio_id(hass, entry)
+        if radio_id is None:
+            _LOGGER.warning("Could not read the radio id of %s; its config entry will be migrated later", entry.title)
+            return True
+        if any(
+            other.unique_id == radio_id
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            _LOGGER.warning("%s is configured twice (radio id %s); keeping its old unique id", entry.title, radio_id)
+            hass.config_entries.async_update_entry(entry, version=2)
+        else:
+            _LOGGER.info("Migrating unique id of %s from %s to radio id %s", entry.title, entry.unique_id, radio_id)
+            hass.config_entries.async_update_entry(entry, unique_id=radio_id, version=2)
+    return True
+
+
+async def _async_read_radio_id(hass: HomeAssistant, entry: ConfigEntry) -> Optional[str]:
+    """Return the radio id of an entry's radio without a PIN, if it can be found."""
+    stored = await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_load()
+    if stored and stored.get("radio_id"):
+        return stored["radio_id"]
+    radio = await async_probe_host(
+        async_get_shared_session(hass), entry.data[CONF_HOST], entry.data.get(CONF_PORT, DEFAULT_PORT)
+    )
+    return radio.radio_id if radio is not None else None
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached modes and presets when the radio is removed."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
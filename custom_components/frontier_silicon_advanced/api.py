@@ -1,41 +1,168 @@
 """API client for Frontier Silicon devices."""
 import asyncio
+from contextlib import aclosing
 import logging
-from typing import Any, Optional
-import xml.etree.ElementTree as ET
+import re
+import time
+from typing import Any, AsyncIterator, Callable, Optional
 from urllib.parse import quote
 
 import aiohttp
 
+from .circuit_breaker import CIRCUIT_HALF_OPEN, CircuitBreaker
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_PROBE_INTERVAL,
+    CIRCUIT_PROBE_INTERVAL_MAX,
+    CIRCUIT_PROBE_TIMEOUT,
+    ENDPOINT_MODE,
+    ENDPOINT_NAV_NAVIGATE,
+    ENDPOINT_NAV_SELECT_ITEM,
+    ENDPOINT_NAV_STATE,
+    ENDPOINT_SELECT_PRESET,
+    GET_MULTIPLE_MAX_NODES,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+    HTTP_POOL_LIMIT,
+    LIST_PAGE_SIZE,
+    NOTIFY_MAX_FAILURES,
+    NOTIFY_RETRY_DELAY,
+    NOTIFY_TIMEOUT,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_REFRESH,
+    SESSION_REFRESH_INTERVAL,
+)
+from .parser import (
+    STATUS_PARSE_ERROR,
+    as_text,
+    is_fsapi,
+    iter_list_items,
+    parse_list_end,
+    parse_multiple,
+    parse_notifies,
+    parse_session_id,
+    parse_status,
+    parse_value,
+)
+from .metrics import STATUS_CIRCUIT_OPEN, STATUS_CONNECTION_ERROR, STATUS_TIMEOUT, RequestMetrics
+from .request_scheduler import RequestScheduler, current_priority, request_priority
+from .transport import HttpTransport, Transport
+
 _LOGGER = logging.getLogger(__name__)
 
+# Statuses meaning the session id is no longer accepted by the device
+SESSION_EXPIRED_STATUSES = ("FS_INVALID_SID", "FS_SESSION_TIMEOUT")
+# Statuses of requests that got no answer at all, as opposed to an FSAPI rejection
+TRANSPORT_FAILURE_STATUSES = (STATUS_TIMEOUT, STATUS_CONNECTION_ERROR, STATUS_CIRCUIT_OPEN)
+# Nodes whose writes move the radio's menu position (see navigator.py)
+NAV_MOVING_NODES = frozenset(
+    node.lower()
+    for node in (ENDPOINT_NAV_STATE, ENDPOINT_NAV_NAVIGATE, ENDPOINT_NAV_SELECT_ITEM, ENDPOINT_SELECT_PRESET, ENDPOINT_MODE)
+)
+_SID_RE = re.compile(r"sid=[^&]*")
+
+
+class ListReadError(Exception):
+    """A list read stopped on a failed request instead of at the end of the list."""
+
+    def __init__(self, path: str, status: str) -> None:
+        """Initialize with the list node and the status of the failed request."""
+        super().__init__(f"Reading {path} failed: {status}")
+        self.path = path
+        self.status = status
+
+
+def create_client_session() -> aiohttp.ClientSession:
+    """Create an HTTP client sized for the radios' small embedded web servers.
+
+    Connections are kept alive and DNS lookups cached, so one client can be
+    shared by every radio.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
 
 class FrontierSiliconAPI:
     """API client for Frontier Silicon devices."""
 
-    def __init__(self, host: str, port: int, pin: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        pin: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        min_request_interval: float = 0.0,
+        request_limiter: Optional[asyncio.Semaphore] = None,
+        transport: Optional[Transport] = None,
+    ) -> None:
+        """Initialize the API client.
+
+        When an HTTP session is passed in it is shared and never closed here.
+        Requests to the device start at least min_request_interval seconds apart,
+        and request_limiter (shared by several radios) caps them across devices.
+        Requests go over HTTP unless another transport (recording, replay; see
+        transport.py) is given.
+        """
         self.host = host
         self.port = port
         self.pin = pin
         self.session_id: Optional[str] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_used_at = 0.0  # monotonic time the session id last got an answer
+        self._session_create_task: Optional[asyncio.Task] = None  # shared by concurrent callers
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self.transport: Transport = transport if transport is not None else HttpTransport(self._get_session)
+        self._scheduler = RequestScheduler(min_interval=min_request_interval)
+        self._request_limiter = request_limiter
+        self.metrics = RequestMetrics()
+        self._breaker = CircuitBreaker(
+            name=host,
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            probe_interval=CIRCUIT_PROBE_INTERVAL,
+            probe_interval_max=CIRCUIT_PROBE_INTERVAL_MAX,
+        )
+        # None = not probed yet, False = firmware rejected GET_MULTIPLE
+        self._get_multiple_supported: Optional[bool] = None
+        self._notify_task: Optional[asyncio.Task] = None
+        # None = not probed yet, False = firmware never answered GET_NOTIFIES
+        self._notify_supported: Optional[bool] = None
+        # Bumped by every write to NAV_MOVING_NODES, whoever makes it
+        self.nav_generation = 0
 
         if port == 80:
             self.base_url = f"http://{host}/fsapi"
         else:
             self.base_url = f"http://{host}:{port}/fsapi"
 
+    @property
+    def circuit(self) -> CircuitBreaker:
+        """Return the device's circuit breaker."""
+        return self._breaker
+
+    @property
+    def reachable(self) -> bool:
+        """Return False once a request to the device has failed at the transport level."""
+        return self._breaker.failures == 0
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
             _LOGGER.debug("Creating aiohttp ClientSession")
-            self._session = aiohttp.ClientSession()
+            self._session = create_client_session()
+            self._owns_session = True
         return self._session
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
+        """Close the aiohttp session unless it is shared."""
+        await self.stop_notify_listener()
+        await self.transport.async_close()
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
 
     async def clear_session(self, context: str = "clear_session") -> None:
@@ -43,55 +170,131 @@ class FrontierSiliconAPI:
         if self.session_id:
             _LOGGER.info("Clearing FSAPI session; context=%s", context)
         self.session_id = None
+        await self.stop_notify_listener()
 
     def _mask_url(self, url: str) -> str:
         """Mask pin and sid in logs."""
         masked = url.replace(f"pin={self.pin}", "pin=****")
-        if self.session_id:
-            masked = masked.replace(f"sid={self.session_id}", f"sid={self.session_id}")
-        return masked
-
-    async def _request(self, url: str, timeout: int = 5, context: str = "request") -> tuple[Optional[ET.Element], str]:
-        """Make HTTP request and parse XML response."""
+        return _SID_RE.sub("sid=****", masked)
+
+    async def _request(
+        self, url: str, timeout: int = 5, context: str = "request", *, queued: bool = True
+    ) -> tuple[Optional[bytes], str]:
+        """Make HTTP request and return the raw FSAPI XML body and its status.
+
+        The status is the FSAPI status of the response, or what went wrong
+        instead (TIMEOUT, CONNECTION_ERROR, HTTP_<code>...). Requests wait for
+        the device's slot in priority order; queued=False bypasses it (only
+        for the GET_NOTIFIES long-poll, which would hold the slot for its
+        whole window). While the circuit is open requests return
+        (None, CIRCUIT_OPEN) at once; the first one after the probe interval
+        checks that the device answers before it is sent.
+        """
+        if not self._breaker.allow_request():
+            self.metrics.record_short_circuit()
+            _LOGGER.debug("FSAPI circuit open for %s; skipping request [%s]", self.host, context)
+            return None, STATUS_CIRCUIT_OPEN
+        if self._breaker.state == CIRCUIT_HALF_OPEN and not await self._probe_device():
+            return None, STATUS_CIRCUIT_OPEN
+        if not queued:
+            return await self._request_now(url, timeout, context, long_poll=True)
+        return await self._scheduler.run(lambda: self._request_limited(url, timeout, context))
+
+    async def _probe_device(self) -> bool:
+        """Check that the device answers at all with a cheap, PIN-less GET /device."""
+        url = self.base_url[: -len("/fsapi")] + "/device"
+        started = time.monotonic()
+        try:
+            http_status, _ = await self.transport.get(url, CIRCUIT_PROBE_TIMEOUT, "circuit_probe")
+            status = f"HTTP_{http_status}"
+        except asyncio.TimeoutError:
+            status = STATUS_TIMEOUT
+        except (aiohttp.ClientError, OSError):
+            status = STATUS_CONNECTION_ERROR
+        except asyncio.CancelledError:
+            self._breaker.abort_probe()
+            raise
+        self.metrics.record("device", "circuit_probe", time.monotonic() - started, status)
+        if status in (STATUS_TIMEOUT, STATUS_CONNECTION_ERROR):
+            self._breaker.record_failure()
+            return False
+        self._breaker.record_success()
+        return True
+
+    async def _request_limited(self, url: str, timeout: int, context: str) -> tuple[Optional[bytes], str]:
+        """Send one HTTP request once a request slot shared with other radios is free."""
+        if self._request_limiter is None:
+            return await self._request_now(url, timeout, context)
+        async with self._request_limiter:
+            return await self._request_now(url, timeout, context)
+
+    async def _request_now(
+        self, url: str, timeout: int, context: str, *, long_poll: bool = False
+    ) -> tuple[Optional[bytes], str]:
+        """Send one HTTP request right away and record it in the metrics and circuit breaker.
+
+        A long-poll timing out is not a sign of a dead device, so it never
+        counts towards opening the circuit, and its metrics are kept apart.
+        """
+        if self._breaker.is_open:
+            # Opened while this request waited for its slot
+            self.metrics.record_short_circuit()
+            return None, STATUS_CIRCUIT_OPEN
+        started = time.monotonic()
+        body, status = None, STATUS_CONNECTION_ERROR
         try:
-            session = await self._get_session()
             _LOGGER.debug("FSAPI request [%s]: %s", context, self._mask_url(url))
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-                if response.status != 200:
-                    _LOGGER.debug("FSAPI HTTP %d [%s]", response.status, context)
-                    return None, ""
-
-                text = await response.text()
-                if not text or not text.strip():
-                    _LOGGER.debug("FSAPI empty response [%s]", context)
-                    return None, ""
-
-                try:
-                    root = ET.fromstring(text)
-                    _LOGGER.debug("FSAPI XML OK [%s]", context)
-                    return root, text
-                except ET.ParseError as err:
-                    _LOGGER.debug("FSAPI XML parse error [%s]: %s; response=%s", context, err, text[:120])
-                    return None, text
+            try:
+                body, status = await self._fetch(url, timeout, context)
+            except aiohttp.ServerDisconnectedError:
+                # The radio dropped an idle keep-alive connection; retry once on a fresh one
+                _LOGGER.debug("FSAPI keep-alive connection closed by device [%s]; retrying", context)
+                body, status = await self._fetch(url, timeout, context)
 
         except asyncio.TimeoutError:
             _LOGGER.debug("FSAPI timeout [%s]", context)
-            return None, ""
+            status = STATUS_TIMEOUT
         except aiohttp.ClientError as err:
             _LOGGER.debug("FSAPI connection error [%s]: %s", context, err)
-            return None, ""
         except Exception as err:
             _LOGGER.error("FSAPI unexpected request error [%s]: %s", context, err)
-            return None, ""
 
-    def _get_status(self, root: Optional[ET.Element]) -> str:
-        """Extract status from XML root."""
-        if root is None:
-            return "XML_PARSE_ERROR"
-        status_elem = root.find("status")
-        if status_elem is not None and status_elem.text:
-            return status_elem.text.strip()
-        return "UNKNOWN"
+        endpoint, nodes = self._split_url(url)
+        self.metrics.record(endpoint, context, time.monotonic() - started, status, nodes, long_poll=long_poll)
+        if status not in (STATUS_TIMEOUT, STATUS_CONNECTION_ERROR):
+            self._breaker.record_success()
+        elif not long_poll:
+            self._breaker.record_failure()
+        return body, status
+
+    def _split_url(self, url: str) -> tuple[str, list[str]]:
+        """Return the endpoint of an FSAPI URL and the nodes it addresses."""
+        path, _, query = url[len(self.base_url) + 1:].partition("?")
+        endpoint, _, node = path.partition("/")
+        if node:
+            return endpoint, [node.split("/", 1)[0]]
+        return endpoint, [param[5:] for param in query.split("&") if param.startswith("node=")]
+
+    async def _fetch(self, url: str, timeout: int, context: str) -> tuple[Optional[bytes], str]:
+        """Perform one HTTP GET; returns the body if it is an FSAPI response, and its status."""
+        http_status, body = await self.transport.get(url, timeout, context)
+        if http_status != 200:
+            _LOGGER.debug("FSAPI HTTP %d [%s]", http_status, context)
+            return None, f"HTTP_{http_status}"
+
+        if not body or not body.strip():
+            _LOGGER.debug("FSAPI empty response [%s]", context)
+            return None, "EMPTY_RESPONSE"
+
+        if not is_fsapi(body):
+            _LOGGER.debug("FSAPI XML parse error [%s]; response=%r", context, body[:120])
+            return None, STATUS_PARSE_ERROR
+        _LOGGER.debug("FSAPI XML OK [%s]", context)
+        return body, self._get_status(body)
+
+    def _get_status(self, body: Optional[bytes]) -> str:
+        """Extract status from an FSAPI response body."""
+        return parse_status(body)
 
     async def create_session(self, context: str = "create_session") -> Optional[str]:
         """Create a new API session."""
@@ -99,106 +302,381 @@ class FrontierSiliconAPI:
             "FSAPI CREATE_SESSION requested; context=%s. If radio wakes now, this is the trigger.",
             context,
         )
+        self.metrics.record_session_creation(context)
         url = f"{self.base_url}/CREATE_SESSION?pin={self.pin}"
-        root, _ = await self._request(url, context=f"CREATE_SESSION:{context}")
-
-        status = self._get_status(root)
-        if status == "FS_OK" and root is not None:
-            sid_elem = root.find("sessionId")
-            if sid_elem is not None and sid_elem.text:
-                self.session_id = sid_elem.text.strip()
+        body, status = await self._request(url, context=f"CREATE_SESSION:{context}")
+        if status == "FS_OK" and body is not None:
+            session_id = parse_session_id(body)
+            if session_id:
+                self.session_id = session_id
+                self._session_used_at = time.monotonic()
                 _LOGGER.info("FSAPI session created successfully; context=%s", context)
                 return self.session_id
 
         _LOGGER.warning("Failed to create FSAPI session: status=%s; context=%s", status, context)
         return None
 
+    async def _create_session_once(self, context: str) -> Optional[str]:
+        """Create a session, joining a creation already in flight instead of starting another.
+
+        Every CREATE_SESSION replaces the previous session on the device, so
+        concurrent callers must share one.
+        """
+        if self._session_create_task is None or self._session_create_task.done():
+            self._session_create_task = asyncio.create_task(self.create_session(context=context))
+        else:
+            _LOGGER.debug("FSAPI session creation already in flight; context=%s joins it", context)
+        # shield: one caller being cancelled must not cancel the creation for the others
+        return await asyncio.shield(self._session_create_task)
+
+    def _session_stale(self) -> bool:
+        """Return True when the session has been idle long enough that the device may have dropped it."""
+        return time.monotonic() - self._session_used_at > SESSION_REFRESH_INTERVAL
+
+    def _invalidate_session(self, session_id: Optional[str], context: str) -> None:
+        """Drop a session id the device rejected, unless another caller already replaced it."""
+        if session_id is not None and self.session_id == session_id:
+            _LOGGER.info("FSAPI session expired; context=%s", context)
+            self.session_id = None
+
     async def _ensure_session(self, allow_create: bool = True, context: str = "ensure_session") -> bool:
-        """Ensure we have a valid session."""
-        if self.session_id:
+        """Ensure we have a valid session.
+
+        A session idle for longer than SESSION_REFRESH_INTERVAL is renewed
+        before use rather than spending a request on a likely FS_INVALID_SID.
+        """
+        if self.session_id and (not allow_create or not self._session_stale()):
             return True
         if not allow_create:
             _LOGGER.debug("No FSAPI session and session creation not allowed; context=%s", context)
             return False
-        return await self.create_session(context=context) is not None
-
-    async def get_value(self, path: str, *, allow_session_create: bool = True, context: str = "get_value") -> tuple[Optional[str], str]:
-        """GET a scalar value from the device."""
+        if self.session_id:
+            _LOGGER.debug("FSAPI session idle for over %ss; renewing; context=%s", SESSION_REFRESH_INTERVAL, context)
+            self.session_id = None
+        return await self._create_session_once(context) is not None
+
+    async def _session_request(
+        self,
+        make_url: Callable[[str], str],
+        *,
+        allow_session_create: bool = True,
+        timeout: int = 5,
+        queued: bool = True,
+        context: str,
+    ) -> tuple[Optional[bytes], str]:
+        """Send a request that needs a session id, re-authenticating once if it expired.
+
+        make_url builds the URL for a given sid. Returns (body, status).
+        """
         if not await self._ensure_session(allow_create=allow_session_create, context=context):
             return None, "NO_SESSION"
 
-        url = f"{self.base_url}/GET/{path}?pin={self.pin}&sid={self.session_id}"
-        root, _ = await self._request(url, context=context)
-        status = self._get_status(root)
-
-        if root is None:
+        session_id = self.session_id
+        body, status = await self._request(make_url(session_id), timeout=timeout, context=context, queued=queued)
+        if status in SESSION_EXPIRED_STATUSES:
+            self._invalidate_session(session_id, context)
+            if not allow_session_create or not await self._ensure_session(context=f"{context}:reauth"):
+                return body, status
+            session_id = self.session_id
+            body, status = await self._request(
+                make_url(session_id), timeout=timeout, context=f"{context}:retry", queued=queued
+            )
+        if body is not None and status not in SESSION_EXPIRED_STATUSES and self.session_id == session_id:
+            self._session_used_at = time.monotonic()
+        return body, status
+
+    async def get_value(
+        self, path: str, *, allow_session_create: bool = True, context: str = "get_value", typed: bool = False
+    ) -> tuple[Any, str]:
+        """GET a scalar value from the device.
+
+        Values are returned as text unless typed=True, which returns ints for
+        the numeric FSAPI types.
+        """
+        body, status = await self._session_request(
+            lambda sid: f"{self.base_url}/GET/{path}?pin={self.pin}&sid={sid}",
+            allow_session_create=allow_session_create,
+            context=context,
+        )
+        if body is None:
             return None, status
 
-        value_elem = root.find(".//value")
-        if value_elem is not None:
-            for child in value_elem:
-                if child.text is not None:
-                    _LOGGER.debug("FSAPI GET %s => %s; status=%s; context=%s", path, child.text, status, context)
-                    return child.text, status
-            if value_elem.text:
-                _LOGGER.debug("FSAPI GET %s => %s; status=%s; context=%s", path, value_elem.text, status, context)
-                return value_elem.text, status
+        value = parse_value(body)
+        if not typed:
+            value = as_text(value)
+        if value is not None:
+            _LOGGER.debug("FSAPI GET %s => %s; status=%s; context=%s", path, value, status, context)
+            return value, status
 
         _LOGGER.debug("FSAPI GET %s returned no value; status=%s; context=%s", path, status, context)
         return None, status
 
+    async def _get_multiple(
+        self, paths: list[str], *, allow_session_create: bool = True, context: str
+    ) -> tuple[Optional[dict[str, tuple[Any, str]]], str]:
+        """Read a chunk of nodes with one GET_MULTIPLE request; values are typed.
+
+        Returns (results, status); results is None when the response is not a
+        usable GET_MULTIPLE reply, and status then tells why.
+        """
+        nodes = "&".join(f"node={path}" for path in paths)
+        body, status = await self._session_request(
+            lambda sid: f"{self.base_url}/GET_MULTIPLE?pin={self.pin}&sid={sid}&{nodes}",
+            allow_session_create=allow_session_create,
+            context=context,
+        )
+        if body is None:
+            return None, status
+
+        results = parse_multiple(body)
+        if not results:
+            _LOGGER.debug("FSAPI GET_MULTIPLE returned no node responses; status=%s; context=%s", status, context)
+            return None, status
+
+        # Node names are echoed back; match them case-insensitively to the request
+        by_lower = {node.lower(): result for node, result in results.items()}
+        return {path: by_lower.get(path.lower(), (None, "FS_NODE_DOES_NOT_EXIST")) for path in paths}, status
+
+    async def get_values(
+        self,
+        paths: list[str],
+        *,
+        allow_session_create: bool = True,
+        context: str = "get_values",
+        typed: bool = False,
+    ) -> dict[str, tuple[Any, str]]:
+        """GET several scalar values, batched through GET_MULTIPLE when the firmware supports it.
+
+        Returns {path: (value, status)}. Falls back to one GET per node when
+        the firmware rejects GET_MULTIPLE. Once batching is known to work, a
+        chunk that gets no answer at all fails as a whole instead, since single
+        GETs would only time out one after another. Values are text unless
+        typed=True.
+        """
+        if not paths:
+            return {}
+        if not await self._ensure_session(allow_create=allow_session_create, context=context):
+            return {path: (None, "NO_SESSION") for path in paths}
+
+        results: dict[str, tuple[Any, str]] = {}
+        if self._get_multiple_supported is not False:
+            for start in range(0, len(paths), GET_MULTIPLE_MAX_NODES):
+                chunk = paths[start:start + GET_MULTIPLE_MAX_NODES]
+                chunk_results, status = await self._get_multiple(
+                    chunk, allow_session_create=allow_session_create, context=f"{context}:multiple"
+                )
+                if chunk_results is None:
+                    if self._get_multiple_supported and status in TRANSPORT_FAILURE_STATUSES:
+                        results.update((path, (None, status)) for path in chunk)
+                        continue
+                    break
+                results.update(chunk_results)
+            else:
+                if self._get_multiple_supported is None:
+                    _LOGGER.info("FSAPI GET_MULTIPLE supported by device; context=%s", context)
+                self._get_multiple_supported = True
+                if typed:
+                    return results
+                return {path: (as_text(value), status) for path, (value, status) in results.items()}
+
+        if not typed:
+            results = {path: (as_text(value), status) for path, (value, status) in results.items()}
+        batched = bool(results)
+        fallback_ok = False
+        for path in paths:
+            if path in results:
+                continue
+            results[path] = await self.get_value(
+                path, allow_session_create=False, context=f"{context}:{path}", typed=typed
+            )
+            fallback_ok = fallback_ok or results[path][1] == "FS_OK"
+
+        # Only give up on GET_MULTIPLE when the device answers single GETs fine,
+        # so a timeout on an unreachable radio does not disable batching.
+        if fallback_ok and not batched and self._get_multiple_supported is None:
+            _LOGGER.info("FSAPI GET_MULTIPLE rejected by device; using single GETs; context=%s", context)
+            self._get_multiple_supported = False
+        return results
+
     async def set_value(self, path: str, value: str, *, context: str = "set_value") -> str:
         """SET a value on the device."""
-        if not await self._ensure_session(allow_create=True, context=context):
-            return "NO_SESSION"
-
         _LOGGER.warning("FSAPI SET %s=%s; context=%s", path, value, context)
+        if path.lower() in NAV_MOVING_NODES:
+            # Counted before sending: even a write that times out may have moved the menu
+            self.nav_generation += 1
         encoded_value = quote(str(value))
-        url = f"{self.base_url}/SET/{path}?pin={self.pin}&sid={self.session_id}&value={encoded_value}"
-        root, _ = await self._request(url, context=context)
-        status = self._get_status(root)
-
-        if status in ("FS_SESSION_TIMEOUT", "FS_INVALID_SID"):
-            self.session_id = None
-            if await self.create_session(context=f"{context}:retry"):
-                url = f"{self.base_url}/SET/{path}?pin={self.pin}&sid={self.session_id}&value={encoded_value}"
-                root, _ = await self._request(url, context=f"{context}:retry")
-                status = self._get_status(root)
+        # Writes are user commands unless a background loader issued them
+        priority = current_priority()
+        with request_priority(PRIORITY_INTERACTIVE if priority == PRIORITY_REFRESH else priority):
+            _, status = await self._session_request(
+                lambda sid: f"{self.base_url}/SET/{path}?pin={self.pin}&sid={sid}&value={encoded_value}",
+                context=context,
+            )
 
         _LOGGER.info("FSAPI SET result %s=%s; status=%s; context=%s", path, value, status, context)
         return status
 
-    async def list_get_next(self, path: str, max_items: int = 100, *, context: str = "list_get_next") -> list[dict[str, str]]:
-        """Get a list of items from the device."""
-        if not await self._ensure_session(allow_create=True, context=context):
-            return []
-
-        _LOGGER.info("FSAPI LIST_GET_NEXT %s; max_items=%s; context=%s", path, max_items, context)
-        url = f"{self.base_url}/LIST_GET_NEXT/{path}/-1?pin={self.pin}&sid={self.session_id}&maxItems={max_items}"
-        root, _ = await self._request(url, context=context)
-
-        if root is None:
-            return []
-
+    async def iter_list(
+        self,
+        path: str,
+        *,
+        page_size: int = LIST_PAGE_SIZE,
+        start: int = -1,
+        context: str = "iter_list",
+        typed: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the items of a list after the item keyed start, page by page until its end.
+
+        Each LIST_GET_NEXT asks for page_size items after the last key seen and
+        items are yielded as each page is parsed, so only one page is held at
+        a time. Stop iterating to stop reading. A page that cannot be read
+        (timeout, no session, an FSAPI error) raises ListReadError, so a
+        failed read is never mistaken for the end of the list. Item keys are
+        always text; field values are text unless typed=True.
+        """
+        pages = 0
+        while True:
+            cursor = start
+            body, status = await self._session_request(
+                lambda sid: f"{self.base_url}/LIST_GET_NEXT/{path}/{cursor}?pin={self.pin}&sid={sid}&maxItems={page_size}",
+                context=f"{context}:page{pages}" if pages else context,
+            )
+            pages += 1
+            if status == "FS_LIST_END":
+                # The previous page ended exactly at the end of the list
+                return
+            if body is None or status != "FS_OK":
+                _LOGGER.debug("FSAPI LIST_GET_NEXT %s failed; status=%s; context=%s", path, status, context)
+                raise ListReadError(path, status)
+
+            count = 0
+            for item in iter_list_items(body):
+                count += 1
+                if "key" in item:
+                    start = int(item["key"])
+                yield item if typed else {name: as_text(value) for name, value in item.items()}
+            if not count or parse_list_end(body) or cursor == start:
+                return
+
+    async def list_get_next(
+        self,
+        path: str,
+        max_items: Optional[int] = None,
+        *,
+        page_size: int = LIST_PAGE_SIZE,
+        start: int = -1,
+        context: str = "list_get_next",
+        typed: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get the items of a list after the item keyed start: all of them, or the first max_items.
+
+        A failed read ends the list early with the items read so far; use
+        iter_list to tell the two apart. Item keys are always text; field
+        values are text unless typed=True.
+        """
+        _LOGGER.info("FSAPI LIST_GET_NEXT %s; start=%s; max_items=%s; context=%s", path, start, max_items, context)
+        if max_items is not None:
+            page_size = min(page_size, max_items)
         items = []
-        for item in root.findall(".//item"):
-            item_data = {}
-            item_key = item.get("key")
-            if item_key is not None:
-                item_data["key"] = item_key
-
-            for field in item.findall("field"):
-                name = field.get("name", "")
-                for value_type in ("c8_array", "u8", "u16", "u32", "s8", "s16", "s32"):
-                    v = field.find(value_type)
-                    if v is not None and v.text is not None:
-                        item_data[name] = v.text
+        try:
+            async with aclosing(
+                self.iter_list(path, page_size=page_size, start=start, context=context, typed=typed)
+            ) as stream:
+                async for item in stream:
+                    items.append(item)
+                    if max_items is not None and len(items) >= max_items:
                         break
-            items.append(item_data)
+        except ListReadError as err:
+            _LOGGER.debug("FSAPI LIST_GET_NEXT %s ended early: %s; context=%s", path, err.status, context)
 
         _LOGGER.info("FSAPI LIST_GET_NEXT %s returned %d items; context=%s", path, len(items), context)
         return items
 
+    async def get_notifies(self, *, context: str = "get_notifies") -> tuple[dict[str, Optional[str]], str]:
+        """Long-poll GET_NOTIFIES for changed nodes.
+
+        Never creates a session: notifications only make sense while one is
+        already open. Returns ({node: value}, status); node names are lower-case
+        as sent by the device.
+        """
+        body, status = await self._session_request(
+            lambda sid: f"{self.base_url}/GET_NOTIFIES?pin={self.pin}&sid={sid}",
+            allow_session_create=False,
+            timeout=NOTIFY_TIMEOUT,
+            queued=False,
+            context=context,
+        )
+        if body is None:
+            return {}, status
+
+        changes = {node: as_text(value) for node, value in parse_notifies(body).items()}
+        if changes:
+            _LOGGER.debug("FSAPI GET_NOTIFIES => %s; context=%s", changes, context)
+        return changes, status
+
+    @property
+    def notify_listener_active(self) -> bool:
+        """Return True while the GET_NOTIFIES listener task is running."""
+        return self._notify_task is not None and not self._notify_task.done()
+
+    def start_notify_listener(
+        self,
+        on_notify: Callable[[dict[str, Optional[str]]], None],
+        on_stop: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Start the GET_NOTIFIES long-poll task if it is not already running."""
+        if self.notify_listener_active or self._notify_supported is False:
+            return
+        _LOGGER.info("Starting FSAPI notify listener for %s", self.host)
+        self._notify_task = asyncio.create_task(self._notify_loop(on_notify, on_stop))
+
+    async def stop_notify_listener(self) -> None:
+        """Cancel the GET_NOTIFIES long-poll task."""
+        task, self._notify_task = self._notify_task, None
+        if task is None or task.done() or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _notify_loop(
+        self,
+        on_notify: Callable[[dict[str, Optional[str]]], None],
+        on_stop: Optional[Callable[[], None]],
+    ) -> None:
+        """Consume GET_NOTIFIES until the session ends or the device stops answering."""
+        failures = 0
+        try:
+            while self.session_id:
+                changes, status = await self.get_notifies(context="notify_listener")
+                if status in ("FS_OK", "FS_TIMEOUT"):
+                    # FS_TIMEOUT: long-poll window elapsed without changes
+                    self._notify_supported = True
+                    failures = 0
+                    if changes:
+                        on_notify(changes)
+                    continue
+                if status in ("NO_SESSION", "FS_INVALID_SID", "FS_SESSION_TIMEOUT"):
+                    _LOGGER.info("FSAPI notify listener stopping: session ended (status=%s)", status)
+                    break
+                if self._breaker.is_open:
+                    _LOGGER.info("FSAPI notify listener stopping: %s is unreachable", self.host)
+                    break
+                failures += 1
+                if failures >= NOTIFY_MAX_FAILURES:
+                    _LOGGER.info("FSAPI notify listener stopping after %d failures (status=%s)", failures, status)
+                    if self._notify_supported is None:
+                        _LOGGER.info("FSAPI GET_NOTIFIES not supported by device; using polling only")
+                        self._notify_supported = False
+                    break
+                await asyncio.sleep(NOTIFY_RETRY_DELAY)
+        finally:
+            if on_stop is not None and self._notify_task is asyncio.current_task():
+                self._notify_task = None
+                on_stop()
+
     async def get_device_info(self) -> dict[str, Any]:
         """Get device information."""
         info = {}
@@ -212,11 +690,15 @@ class FrontierSiliconAPI:
         return await self.list_get_next("netRemote.sys.caps.validModes", context="get_modes")
 
     async def get_presets(self) -> list[dict[str, str]]:
-        """Get saved presets/favorites for the current mode."""
+        """Get saved presets/favorites for the current mode.
+
+        Raises ListReadError when the list cannot be read to its end, so an
+        empty result always means the mode has no presets.
+        """
         _LOGGER.warning("FSAPI preset read changes navigation state first; this may wake/change some radios")
         await self.set_value("netRemote.nav.state", "1", context="get_presets:navigate")
         await asyncio.sleep(0.3)
-        presets = await self.list_get_next("netRemote.nav.presets", max_items=40, context="get_presets:list")
+        presets = [item async for item in self.iter_list("netRemote.nav.presets", context="get_presets:list")]
         _LOGGER.info("Found %d presets", len(presets))
         return presets
 
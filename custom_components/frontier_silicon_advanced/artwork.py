@@ -0,0 +1,206 @@
+"""In-memory cache for station and album art (graphicUri).
+
+The media player serves its artwork through Home Assistant instead of
+handing dashboards the radio's URL, so every client load would otherwise be
+an upstream fetch. Images are kept in an LRU cache bounded by total bytes
+and shared by all radios (stations are often on several of them). An entry
+is served without any upstream request while fresh; after that it is
+revalidated with If-None-Match / If-Modified-Since, so an unchanged logo
+costs a 304. Large images are scaled down to thumbnails once, when fetched,
+if Pillow is available.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import io
+import logging
+import time
+from typing import Any, Callable, Optional
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Artwork:
+    """One cached image and its validators."""
+
+    __slots__ = ("content", "content_type", "etag", "last_modified", "checked_at")
+
+    def __init__(
+        self, content: bytes, content_type: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        self.content = content
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.checked_at = time.monotonic()
+
+
+def _make_thumbnail(content: bytes, size: int) -> Optional[tuple[bytes, str]]:
+    """Scale an image to fit size x size; None if Pillow is missing or scaling doesn't help."""
+    try:
+        from PIL import Image  # optional: Home Assistant usually ships Pillow
+    except ImportError:
+        return None
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            if max(image.size) <= size:
+                return None
+            image.thumbnail((size, size))
+            has_alpha = image.mode in ("RGBA", "LA", "P")
+            if not has_alpha and image.mode != "RGB":
+                image = image.convert("RGB")
+            out = io.BytesIO()
+            if has_alpha:
+                image.save(out, format="PNG", optimize=True)
+                return out.getvalue(), "image/png"
+            image.save(out, format="JPEG", quality=85)
+            return out.getvalue(), "image/jpeg"
+    except Exception as err:
+        _LOGGER.debug("Could not scale artwork: %s", err)
+        return None
+
+
+async def _read_capped(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Read a response body, giving up as soon as it exceeds limit bytes.
+
+    Content-Length is optional (chunked responses), so the read itself is capped.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        size += len(chunk)
+        if size > limit:
+            raise ValueError(f"image larger than {limit} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class ArtworkCache:
+    """Byte-budgeted LRU cache of images by URI, with HTTP revalidation."""
+
+    def __init__(
+        self,
+        get_session: Callable[[], aiohttp.ClientSession],
+        *,
+        max_bytes: int,
+        max_image_bytes: int,
+        fresh_for: float,
+        retry_failed_after: float,
+        thumbnail_size: int,
+        timeout: float,
+    ) -> None:
+        """Initialize an empty cache; get_session returns the HTTP client to fetch with."""
+        self._get_session = get_session
+        self._max_bytes = max_bytes
+        self._max_image_bytes = max_image_bytes
+        self._fresh_for = fresh_for
+        self._retry_failed_after = retry_failed_after
+        self._thumbnail_size = thumbnail_size
+        self._timeout = timeout
+        self._entries: OrderedDict[str, _Artwork] = OrderedDict()
+        self._bytes = 0
+        self._failed: dict[str, float] = {}  # url -> monotonic time of the last failed fetch
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.fetches = 0
+
+    async def async_get(self, url: str) -> Optional[tuple[bytes, str]]:
+        """Return (content, content type) for url, fetching or revalidating only when needed."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+            if time.monotonic() - entry.checked_at < self._fresh_for:
+                self.hits += 1
+                return entry.content, entry.content_type
+        elif time.monotonic() - self._failed.get(url, -self._retry_failed_after) < self._retry_failed_after:
+            return None
+
+        # Concurrent dashboard loads of the same image share one upstream request
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._async_fetch(url, entry))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(url, None))
+        return await asyncio.shield(task)
+
+    async def _async_fetch(self, url: str, entry: Optional[_Artwork]) -> Optional[tuple[bytes, str]]:
+        """Fetch url, conditionally when a cached copy exists."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        self.fetches += 1
+        try:
+            async with self._get_session().get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=self._timeout)
+            ) as response:
+                if response.status == 304 and entry is not None:
+                    self.revalidated += 1
+                    entry.checked_at = time.monotonic()
+                    return entry.content, entry.content_type
+                if response.status != 200:
+                    raise aiohttp.ClientResponseError(
+                        response.request_info, response.history, status=response.status
+                    )
+                if (response.content_length or 0) > self._max_image_bytes:
+                    raise ValueError(f"image larger than {self._max_image_bytes} bytes")
+                content = await _read_capped(response, self._max_image_bytes)
+                content_type = response.headers.get("Content-Type", "image/jpeg").split(";")[0]
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as err:
+            _LOGGER.debug("Could not fetch artwork %s: %s", url, err)
+            if entry is not None:
+                # Serve the stale copy rather than nothing; try again after the fresh window
+                entry.checked_at = time.monotonic()
+                return entry.content, entry.content_type
+            self._failed[url] = time.monotonic()
+            return None
+
+        if not content_type.startswith("image/"):
+            self._failed[url] = time.monotonic()
+            return None
+
+        thumbnail = await asyncio.get_running_loop().run_in_executor(
+            None, _make_thumbnail, content, self._thumbnail_size
+        )
+        if thumbnail is not None:
+            content, content_type = thumbnail
+        self._store(url, _Artwork(content, content_type, etag, last_modified))
+        return content, content_type
+
+    def _store(self, url: str, artwork: _Artwork) -> None:
+        """Insert an entry and evict the least recently used ones over the byte budget."""
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._bytes -= len(old.content)
+        self._failed.pop(url, None)
+        self._entries[url] = artwork
+        self._bytes += len(artwork.content)
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.content)
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        self._entries.clear()
+        self._failed.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            "images": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "fetches": self.fetches,
+        }
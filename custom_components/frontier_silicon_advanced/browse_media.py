@@ -0,0 +1,131 @@
+"""Media browser for the radio's station directory (netRemote.nav.list).
+
+Content ids carry the mode they belong to and the directory keys from the
+root, so any level can be opened (or played from) directly:
+
+    nav:<mode>:                  root directory of <mode>
+    nav:<mode>:<k1>/<k2>         a subdirectory
+    nav:<mode>:<k1>/<k2>@<start> the page after item key <start>
+    navitem:<mode>:<k1>/<k2>:<key>  a playable item
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+from homeassistant.components.media_player import BrowseMedia, MediaClass, MediaType
+from homeassistant.components.media_player.errors import BrowseError
+
+from .catalog import CatalogIndex
+from .const import NAV_ITEM_DIRECTORY, NAV_ITEM_PLAYABLE
+from .navigator import NavNavigator
+
+NAV_CONTENT_TYPE = "frontier_silicon_nav"
+NAV_PREFIX = "nav:"
+NAV_ITEM_PREFIX = "navitem:"
+
+
+def nav_root_id(mode: str) -> str:
+    """Return the content id of a mode's root directory."""
+    return f"{NAV_PREFIX}{mode}:"
+
+
+def _path_text(path: tuple[str, ...]) -> str:
+    return "/".join(path)
+
+
+def _parse_path(text: str) -> tuple[str, ...]:
+    keys = tuple(key for key in text.split("/") if key)
+    if not all(key.isdigit() for key in keys):
+        raise BrowseError(f"Invalid directory path: {text}")
+    return keys
+
+
+def _parse_nav_id(content_id: str) -> tuple[str, tuple[str, ...], int]:
+    """Split a directory content id into (mode, path, start)."""
+    mode, _, rest = content_id[len(NAV_PREFIX):].partition(":")
+    rest, _, start = rest.partition("@")
+    if not mode or (start and not start.isdigit()):
+        raise BrowseError(f"Invalid media id: {content_id}")
+    return mode, _parse_path(rest), int(start) if start else -1
+
+
+def parse_nav_item_id(content_id: str) -> Optional[tuple[str, tuple[str, ...], str]]:
+    """Split a playable item content id into (mode, path, key); None if it is not one."""
+    if not content_id.startswith(NAV_ITEM_PREFIX):
+        return None
+    mode, _, rest = content_id[len(NAV_ITEM_PREFIX):].partition(":")
+    path, _, key = rest.rpartition(":")
+    if not mode or not key.isdigit():
+        return None
+    return mode, _parse_path(path), key
+
+
+async def async_browse_nav(
+    navigator: NavNavigator,
+    catalog: CatalogIndex,
+    current_mode: Optional[str],
+    content_id: Optional[str],
+) -> BrowseMedia:
+    """Return one page of one directory of the radio's menu."""
+    if not content_id:
+        if current_mode is None:
+            raise BrowseError("The radio is not reporting a mode")
+        content_id = nav_root_id(current_mode)
+    if not content_id.startswith(NAV_PREFIX):
+        raise BrowseError(f"Unknown media id: {content_id}")
+
+    mode, path, start = _parse_nav_id(content_id)
+    try:
+        page = await navigator.async_get_page(mode, path, start)
+    except ValueError as err:
+        raise BrowseError(str(err)) from err
+
+    children = []
+    for item in page.items:
+        item_type = item.get("type")
+        name = item.get("name") or f"Item {item['key']}"
+        if item_type == NAV_ITEM_DIRECTORY:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_id=f"{NAV_PREFIX}{mode}:{_path_text(path + (item['key'],))}",
+                    media_content_type=NAV_CONTENT_TYPE,
+                    title=name,
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+        elif item_type == NAV_ITEM_PLAYABLE:
+            children.append(
+                BrowseMedia(
+                    media_class=MediaClass.CHANNEL,
+                    media_content_id=f"{NAV_ITEM_PREFIX}{mode}:{_path_text(path)}:{item['key']}",
+                    media_content_type=MediaType.CHANNEL,
+                    title=name,
+                    can_play=True,
+                    can_expand=False,
+                )
+            )
+    if page.more and page.items:
+        children.append(
+            BrowseMedia(
+                media_class=MediaClass.DIRECTORY,
+                media_content_id=f"{NAV_PREFIX}{mode}:{_path_text(path)}@{page.items[-1]['key']}",
+                media_content_type=NAV_CONTENT_TYPE,
+                title="More…",
+                can_play=False,
+                can_expand=True,
+            )
+        )
+
+    title = navigator.title(mode, path) if path else None
+    return BrowseMedia(
+        media_class=MediaClass.DIRECTORY,
+        media_content_id=content_id,
+        media_content_type=NAV_CONTENT_TYPE,
+        title=title or catalog.mode_label(mode),
+        can_play=False,
+        can_expand=True,
+        children=children,
+        children_media_class=MediaClass.CHANNEL,
+    )
@@ -6,10 +6,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FrontierSiliconCoordinator
+from .entity import FrontierSiliconEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,11 +28,12 @@ async def async_setup_entry(
     ])
 
 
-class FrontierSiliconRefreshPresetsButton(CoordinatorEntity, ButtonEntity):
+class FrontierSiliconRefreshPresetsButton(FrontierSiliconEntity, ButtonEntity):
     """Button to refresh the preset list."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "refresh_presets"
+    _watched_fields: frozenset[str] = frozenset()  # no state of its own
 
     def __init__(self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry) -> None:
         """Initialize the button."""
@@ -57,12 +58,13 @@ class FrontierSiliconRefreshPresetsButton(CoordinatorEntity, ButtonEntity):
         await self.coordinator.async_request_refresh()
 
 
-class FrontierSiliconForcePowerProbeButton(CoordinatorEntity, ButtonEntity):
+class FrontierSiliconForcePowerProbeButton(FrontierSiliconEntity, ButtonEntity):
     """Button to force a power/status refresh for testing."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "force_power_probe"
     _attr_name = "Force Power Probe"
+    _watched_fields: frozenset[str] = frozenset()  # no state of its own
 
     def __init__(self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry) -> None:
         """Initialize the button."""
@@ -0,0 +1,92 @@
+"""Lookups derived from a radio's mode and preset catalogs.
+
+Entities ask for mode labels, sorted preset options and the preset matching
+the current station on every state write. The coordinator keeps one
+CatalogIndex, stamped with the catalog version it was built from, and
+rebuilds it only when modes or presets change, so those lookups are dict
+reads however long the preset lists are.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+# Mode ID to name mapping, used to label presets by the mode they belong to
+MODE_NAMES = {
+    "0": "Radio",
+    "1": "Spotify",
+    "2": "Music",
+    "3": "DAB+",
+    "4": "FM",
+    "5": "Bluetooth",
+    "6": "AUX",
+}
+
+_UNNAMED_PRESETS = ("", "unnamed")
+
+
+class CatalogIndex:
+    """Mode and preset lookups for one version of the catalogs."""
+
+    __slots__ = (
+        "version",
+        "mode_labels",
+        "mode_keys",
+        "source_list",
+        "preset_options",
+        "presets_by_option",
+        "_presets_by_mode",
+        "_stations",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        modes: list[dict[str, str]],
+        all_presets: dict[str, list[dict[str, str]]],
+    ) -> None:
+        """Build the lookups from the coordinator's modes and per-mode presets."""
+        self.version = version
+
+        self.mode_labels: dict[str, str] = {}  # mode key -> label
+        self.mode_keys: dict[str, str] = {}  # label -> mode key
+        for mode in modes:
+            key = mode.get("key", "")
+            label = mode.get("label") or mode.get("name") or f"Mode {key}"
+            self.mode_labels.setdefault(key, label)
+            self.mode_keys.setdefault(label, key)
+        self.source_list = list(self.mode_keys)
+
+        # Display name "[Radio] 1LIVE" -> (mode key, preset key); only named presets
+        self.presets_by_option: dict[str, tuple[str, str]] = {}
+        self._presets_by_mode: dict[str, list[str]] = {}  # mode -> options, in preset order
+        self._stations: dict[tuple[str, str], Optional[str]] = {}  # (mode, station) -> option
+        for mode_id, presets in all_presets.items():
+            mode_name = MODE_NAMES.get(mode_id, f"Mode {mode_id}")
+            for preset in presets:
+                preset_name = preset.get("name", "").strip()
+                if preset_name.lower() in _UNNAMED_PRESETS:
+                    continue
+                option = f"[{mode_name}] {preset_name}"
+                if option not in self.presets_by_option:
+                    self._presets_by_mode.setdefault(mode_id, []).append(option)
+                self.presets_by_option[option] = (mode_id, preset.get("key", ""))
+        self.preset_options = sorted(self.presets_by_option)
+
+    def mode_label(self, mode_id: str) -> str:
+        """Return the label of a mode key ("Mode <key>" when the mode is unknown)."""
+        label = self.mode_labels.get(mode_id)
+        return label if label is not None else f"Mode {mode_id}"
+
+    def preset_for_station(self, mode_id: str, station: str) -> Optional[str]:
+        """Return the first preset option of mode_id that contains station, if any.
+
+        The scan runs once per station; the answer is remembered until the
+        catalog changes.
+        """
+        key = (mode_id, station)
+        if key not in self._stations:
+            self._stations[key] = next(
+                (option for option in self._presets_by_mode.get(mode_id, ()) if station in option),
+                None,
+            )
+        return self._stations[key]
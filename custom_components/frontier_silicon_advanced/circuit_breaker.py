@@ -0,0 +1,110 @@
+"""Per-device circuit breaker for unreachable radios.
+
+An unplugged radio makes every request wait for the full HTTP timeout. After
+CIRCUIT_FAILURE_THRESHOLD consecutive transport failures the circuit opens and
+requests fail immediately without touching the network. Once the probe
+interval has passed, the next request is let through as a probe (half-open);
+a success closes the circuit, a failure opens it again for twice as long.
+Any HTTP answer counts as a success: the breaker tracks reachability, not
+FSAPI errors.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track consecutive transport failures of one device and gate its requests."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        failure_threshold: int,
+        probe_interval: float,
+        probe_interval_max: float,
+    ) -> None:
+        """Initialize a closed circuit; intervals are in seconds."""
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._probe_interval = probe_interval
+        self._probe_interval_max = probe_interval_max
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0  # consecutive
+        self.opened = 0  # times the circuit has opened
+        self._current_interval = probe_interval
+        self._retry_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being short-circuited."""
+        return self.state == CIRCUIT_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until an open circuit lets a probe through (0 when not open)."""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent; turns a due open circuit half-open."""
+        if self.state == CIRCUIT_CLOSED:
+            return True
+        if self.state == CIRCUIT_OPEN and time.monotonic() >= self._retry_at:
+            _LOGGER.debug("Circuit for %s half-open; probing", self._name)
+            self.state = CIRCUIT_HALF_OPEN
+            return True
+        return False  # open, or a probe is already in flight
+
+    def record_success(self) -> None:
+        """The device answered: close the circuit."""
+        if self.state != CIRCUIT_CLOSED:
+            _LOGGER.info("%s is reachable again; circuit closed", self._name)
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self._current_interval = self._probe_interval
+
+    def record_failure(self) -> None:
+        """The device did not answer: count it, and open the circuit if needed."""
+        self.failures += 1
+        if self.state == CIRCUIT_HALF_OPEN:
+            self._current_interval = min(self._current_interval * 2, self._probe_interval_max)
+            self._open()
+        elif self.state == CIRCUIT_CLOSED and self.failures >= self._failure_threshold:
+            _LOGGER.warning(
+                "%s did not answer %d requests in a row; failing requests fast and probing every %ds",
+                self._name,
+                self.failures,
+                self._current_interval,
+            )
+            self.opened += 1
+            self._open()
+
+    def abort_probe(self) -> None:
+        """A probe was cancelled before it finished: let the next request probe instead."""
+        if self.state == CIRCUIT_HALF_OPEN:
+            self.state = CIRCUIT_OPEN
+            self._retry_at = time.monotonic()
+
+    def _open(self) -> None:
+        self.state = CIRCUIT_OPEN
+        self._retry_at = time.monotonic() + self._current_interval
+        _LOGGER.debug("Circuit for %s open; next probe in %.0fs", self._name, self._current_interval)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.opened,
+            "retry_in": round(self.retry_in, 1),
+        }
@@ -0,0 +1,89 @@
+"""Latest-wins coalescing of rapid writes to one FSAPI node."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandCoalescer:
+    """Send only the latest requested value for a node, at most once per min_interval.
+
+    Dragging a slider or holding a volume key produces many targets in quick
+    succession. Each call replaces the pending target; a single drain task sends
+    whatever is pending when the rate limit allows. Every caller waits until its
+    value, or a newer one that replaced it, has been sent and gets that status.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Awaitable[str]],
+        *,
+        min_interval: float,
+        name: str,
+    ) -> None:
+        """Initialize with the coroutine that writes one value and returns its FSAPI status."""
+        self._send = send
+        self._min_interval = min_interval
+        self._name = name
+        self._pending: Optional[Any] = None
+        self._in_flight: Optional[Any] = None
+        self._waiters: list[asyncio.Future] = []
+        self._task: Optional[asyncio.Task] = None
+        self._last_sent_at = 0.0
+
+    @property
+    def target(self) -> Optional[Any]:
+        """Return the value most recently requested but not yet confirmed, if any."""
+        if self._pending is not None:
+            return self._pending
+        return self._in_flight
+
+    async def async_set(self, value: Any) -> str:
+        """Request value and wait until it (or a newer value) has been sent."""
+        if self._pending is not None:
+            _LOGGER.debug("Coalescing %s: %s replaces %s", self._name, value, self._pending)
+        self._pending = value
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+        return await asyncio.shield(waiter)
+
+    async def _drain(self) -> None:
+        """Send pending values until none are left, spacing sends by min_interval."""
+        while self._pending is not None:
+            delay = self._last_sent_at + self._min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            value, waiters = self._pending, self._waiters
+            self._pending, self._waiters = None, []
+            self._in_flight = value
+            try:
+                status = await self._send(value)
+            except Exception as err:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+                continue
+            finally:
+                self._in_flight = None
+                self._last_sent_at = time.monotonic()
+
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(status)
+
+    def cancel(self) -> None:
+        """Drop pending values and stop the drain task."""
+        self._pending = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiters = []
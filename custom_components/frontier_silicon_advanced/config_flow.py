@@ -1,53 +1,108 @@
 """Config flow for My Frontier Silicon integration."""
+import ipaddress
 import logging
-from typing import Any
+from typing import Any, Optional
+from urllib.parse import urlparse
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network, ssdp
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 
 from .api import FrontierSiliconAPI
-from .const import DOMAIN, CONF_PIN, DEFAULT_PORT, DEFAULT_PIN
+from .const import (
+    DOMAIN,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_FORCE_PRESET_LOAD,
+    CONF_HOSTS,
+    CONF_MAX_REQUEST_RATE,
+    CONF_NETWORK,
+    CONF_PIN,
+    CONF_POLL_EVERY_N,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CORE_POLL_FIELDS,
+    DEFAULT_PORT,
+    DEFAULT_MAX_REQUEST_RATE,
+    DEFAULT_PIN,
+    DEFAULT_POLL_EVERY_N,
+    DEFAULT_POLL_TIERS,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    DEFAULT_SCAN_INTERVAL_PUSH,
+    POLL_TIERS,
+)
+from .coordinator import async_get_shared_session
+from .discovery import (
+    DiscoveredRadio,
+    async_probe_host,
+    async_scan_network,
+    async_validate_pins,
+    create_scan_session,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Import flows started by the scan step carry the radio's unique id next to the entry data
+IMPORT_UNIQUE_ID = "unique_id"
+
 
 class FrontierSiliconConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Frontier Silicon."""
 
-    VERSION = 1
+    # 2: unique ids are radio ids (1: friendly names); see async_migrate_entry
+    VERSION = 2
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, DiscoveredRadio] = {}
+        self._discovery_pin = DEFAULT_PIN
+        self._ssdp_radio: Optional[DiscoveredRadio] = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Handle the initial step: scan the network or enter a host."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add one radio by IP address."""
         errors = {}
 
         if user_input is not None:
+            # Entries not migrated to radio ids yet are only recognised by host
+            self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
+
             # Test connection
             api = FrontierSiliconAPI(
                 host=user_input[CONF_HOST],
                 port=user_input.get(CONF_PORT, DEFAULT_PORT),
                 pin=user_input.get(CONF_PIN, DEFAULT_PIN),
+                session=async_get_shared_session(self.hass),
             )
 
             try:
                 # Try to create session
                 session_id = await api.create_session(context="config_flow_test")
                 if session_id:
-                    # Get device name for unique_id
+                    # Get device name for the title and radio id for unique_id
                     device_name, _ = await api.get_value(
                         "netRemote.sys.info.friendlyName",
                         context="config_flow_device_name"
                     )
-                    
-                    await api.close()
+                    radio_id, _ = await api.get_value(
+                        "netRemote.sys.info.radioId",
+                        context="config_flow_radio_id"
+                    )
 
-                    # Use device name or host as unique_id
-                    unique_id = device_name or user_input[CONF_HOST]
+                    # Use radio id or host as unique_id; names are often left at the default
+                    unique_id = radio_id or user_input[CONF_HOST]
                     await self.async_set_unique_id(unique_id)
                     self._abort_if_unique_id_configured()
 
@@ -71,7 +126,7 @@ class FrontierSiliconConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await api.close()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_HOST): str,
@@ -83,6 +138,155 @@ class FrontierSiliconConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a subnet for radios and check the PIN on all of them."""
+        errors = {}
+
+        if user_input is not None:
+            radios: list[DiscoveredRadio] = []
+            # Not the radios' shared session: a scan would fill its connection pool with dead hosts
+            async with create_scan_session() as session:
+                try:
+                    radios = await async_scan_network(session, user_input[CONF_NETWORK], user_input[CONF_PORT])
+                except ValueError as err:
+                    _LOGGER.warning("Invalid network for scan: %s", err)
+                    errors[CONF_NETWORK] = "invalid_network"
+                else:
+                    configured = {entry.data.get(CONF_HOST) for entry in self._async_current_entries()}
+                    radios = [radio for radio in radios if radio.host not in configured]
+                    if radios:
+                        await async_validate_pins(session, radios, user_input[CONF_PIN])
+                    else:
+                        errors["base"] = "no_devices_found"
+            if radios:
+                self._discovered = {radio.host: radio for radio in radios}
+                self._discovery_pin = user_input[CONF_PIN]
+                return await self.async_step_select()
+
+        source_ip = await network.async_get_source_ip(self.hass)
+        default_network = str(ipaddress.ip_network(f"{source_ip}/24", strict=False))
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=default_network): str,
+                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+                    vol.Optional(CONF_PIN, default=DEFAULT_PIN): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick which discovered radios to add; each becomes its own entry."""
+        errors = {}
+        accepted = {host: radio for host, radio in self._discovered.items() if radio.pin_valid}
+
+        if user_input is not None:
+            selected = [accepted[host] for host in user_input[CONF_HOSTS] if host in accepted]
+            if selected:
+                # A flow creates one entry; the others are added through import flows
+                first, *others = selected
+                for radio in others:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": config_entries.SOURCE_IMPORT},
+                            data={
+                                **self._radio_entry_data(radio, self._discovery_pin),
+                                IMPORT_UNIQUE_ID: radio.unique_id,
+                            },
+                        )
+                    )
+                return await self._async_create_radio_entry(
+                    self._radio_entry_data(first, self._discovery_pin), first.unique_id
+                )
+            errors["base"] = "no_selection"
+
+        rejected = [radio.name or host for host, radio in self._discovered.items() if not radio.pin_valid]
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS, default=list(accepted)): cv.multi_select(
+                        {host: f"{radio.name or host} ({host})" for host, radio in accepted.items()}
+                    ),
+                }
+            ),
+            description_placeholders={
+                "found": str(len(self._discovered)),
+                "rejected": ", ".join(rejected) or "-",
+            },
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a radio already validated by the scan step."""
+        data = dict(import_data)
+        unique_id = data.pop(IMPORT_UNIQUE_ID, None) or data[CONF_HOST]
+        return await self._async_create_radio_entry(data, unique_id)
+
+    async def async_step_ssdp(self, discovery_info: ssdp.SsdpServiceInfo) -> FlowResult:
+        """Handle a radio announcing itself over SSDP."""
+        host = urlparse(discovery_info.ssdp_location).hostname
+        if not host:
+            return self.async_abort(reason="not_supported")
+        self._async_abort_entries_match({CONF_HOST: host})
+
+        radio = await async_probe_host(async_get_shared_session(self.hass), host)
+        if radio is None:
+            return self.async_abort(reason="not_supported")
+
+        await self.async_set_unique_id(radio.unique_id)
+        self._abort_if_unique_id_configured(updates={CONF_HOST: host})
+        self._ssdp_radio = radio
+        self.context["title_placeholders"] = {"name": radio.name or host}
+        return await self.async_step_confirm()
+
+    async def async_step_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Ask for the PIN of a radio found over SSDP."""
+        errors = {}
+        radio = self._ssdp_radio
+
+        if user_input is not None:
+            await async_validate_pins(async_get_shared_session(self.hass), [radio], user_input[CONF_PIN])
+            if radio.pin_valid:
+                return await self._async_create_radio_entry(
+                    self._radio_entry_data(radio, user_input[CONF_PIN]), radio.unique_id
+                )
+            errors["base"] = "cannot_connect"
+
+        return self.async_show_form(
+            step_id="confirm",
+            data_schema=vol.Schema({vol.Optional(CONF_PIN, default=DEFAULT_PIN): str}),
+            description_placeholders={"name": radio.name or radio.host, "host": radio.host},
+            errors=errors,
+        )
+
+    @staticmethod
+    def _radio_entry_data(radio: DiscoveredRadio, pin: str) -> dict[str, Any]:
+        """Return config entry data for a discovered radio, shaped like the manual step's."""
+        data = {CONF_HOST: radio.host, CONF_PORT: radio.port, CONF_PIN: pin}
+        if radio.name:
+            data[CONF_NAME] = radio.name
+        return data
+
+    async def _async_create_radio_entry(self, data: dict[str, Any], unique_id: str) -> FlowResult:
+        """Create the entry, keyed like manual entries (radio id, else host)."""
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=data.get(CONF_NAME) or f"Frontier Silicon {data[CONF_HOST]}",
+            data=data,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -102,6 +306,16 @@ class FrontierSiliconOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = self.config_entry.options
+        poll_tier_schema = {
+            vol.Optional(
+                f"poll_{field}",
+                default=options.get(f"poll_{field}", tier),
+            ): vol.In(POLL_TIERS)
+            for field, tier in DEFAULT_POLL_TIERS.items()
+            if field not in CORE_POLL_FIELDS
+        }
+
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
@@ -114,6 +328,10 @@ class FrontierSiliconOptionsFlowHandler(config_entries.OptionsFlow):
                         "auto_load_presets",
                         default=self.config_entry.options.get("auto_load_presets", True),
                     ): bool,
+                    vol.Optional(
+                        CONF_FORCE_PRESET_LOAD,
+                        default=options.get(CONF_FORCE_PRESET_LOAD, False),
+                    ): bool,
                     vol.Optional(
                         "scan_interval_off",
                         default=self.config_entry.options.get("scan_interval_off", 60),
@@ -122,6 +340,35 @@ class FrontierSiliconOptionsFlowHandler(config_entries.OptionsFlow):
                         "scan_interval_on",
                         default=self.config_entry.options.get("scan_interval_on", 15),
                     ): vol.All(vol.Coerce(int), vol.Range(min=10, max=60)),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MIN,
+                        default=options.get(CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL_MAX,
+                        default=options.get(CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
+                    vol.Optional(
+                        "push_updates",
+                        default=self.config_entry.options.get("push_updates", True),
+                    ): bool,
+                    vol.Optional(
+                        "scan_interval_push",
+                        default=self.config_entry.options.get("scan_interval_push", DEFAULT_SCAN_INTERVAL_PUSH),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=900)),
+                    vol.Optional(
+                        CONF_MAX_REQUEST_RATE,
+                        default=options.get(CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        CONF_POLL_EVERY_N,
+                        default=options.get(CONF_POLL_EVERY_N, DEFAULT_POLL_EVERY_N),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+                    **poll_tier_schema,
+                    vol.Optional(
+                        CONF_CAPTURE_TRAFFIC,
+                        default=options.get(CONF_CAPTURE_TRAFFIC, False),
+                    ): bool,
                 }
             ),
         )
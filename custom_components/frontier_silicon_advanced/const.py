@@ -7,13 +7,145 @@ DEFAULT_NAME = "Frontier Silicon Radio"
 
 # Config flow
 CONF_PIN = "pin"
+CONF_NETWORK = "network"
+CONF_HOSTS = "hosts"
+
+# LAN discovery (see discovery.py)
+DISCOVERY_TIMEOUT = 1.5  # seconds per host probe
+DISCOVERY_CONCURRENCY = 64  # host probes in flight
+DISCOVERY_MAX_HOSTS = 1024  # largest subnet a scan accepts (a /22)
 
 # Update intervals
 SCAN_INTERVAL = 30  # seconds
 SESSION_REFRESH_INTERVAL = 540  # 9 minutes (sessions last ~10 min)
 
+# Circuit breaker for unreachable radios (see circuit_breaker.py)
+CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive timeouts/connection errors before the circuit opens
+CIRCUIT_PROBE_INTERVAL = 10  # seconds before the first probe of an open circuit
+CIRCUIT_PROBE_INTERVAL_MAX = 300  # probe spacing doubles after each failed probe, up to this
+CIRCUIT_PROBE_TIMEOUT = 2  # seconds; the probe is a PIN-less GET /device
+
+# Shared HTTP transport (one client for all radios)
+DATA_SESSION = "http_session"  # hass.data[DOMAIN] key
+DATA_FLEET = "fleet"  # hass.data[DOMAIN] key for the FleetScheduler
+DATA_ARTWORK = "artwork"  # hass.data[DOMAIN] key for the ArtworkCache
+HTTP_POOL_LIMIT = 64  # connections across all radios
+HTTP_LIMIT_PER_HOST = 2  # one for requests, one for the GET_NOTIFIES long-poll
+HTTP_KEEPALIVE_TIMEOUT = 30  # seconds an idle connection is kept open
+HTTP_DNS_CACHE_TTL = 300  # seconds
+
+# Artwork cache shared by all radios (see artwork.py)
+ARTWORK_CACHE_MAX_BYTES = 8 * 1024 * 1024  # total budget for cached images
+ARTWORK_MAX_IMAGE_BYTES = 2 * 1024 * 1024  # larger images are not cached
+ARTWORK_FRESH_SECONDS = 3600  # served without revalidation for this long
+ARTWORK_RETRY_FAILED_SECONDS = 60  # a URL that failed is not fetched again sooner
+ARTWORK_THUMBNAIL_SIZE = 500  # pixels; larger images are scaled down (needs Pillow)
+ARTWORK_FETCH_TIMEOUT = 10  # seconds
+
+# Fleet-wide scheduling (see fleet.py)
+FLEET_MAX_CONCURRENT_REQUESTS = 8  # device requests in flight across all radios
+FLEET_LATE_TOLERANCE = 2.0  # seconds a poll may start after its slot before it counts as late
+
+# Persistent catalog cache (modes, presets, device info), one file per entry
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.catalog"
+CATALOG_SAVE_DELAY = 10  # seconds
+
+# Preset harvesting: presets are read for the mode the radio is already in,
+# so loading them never switches modes (unless forced loading is enabled)
+PRESET_MODES = ("0", "3", "4")  # Internet Radio, DAB+, FM
+PRESET_HARVEST_INTERVAL = 6 * 3600  # seconds before a mode's presets are read again
+PRESET_HARVEST_RETRY_DELAY = 300  # seconds before a failed read is retried (not persisted)
+CONF_FORCE_PRESET_LOAD = "force_preset_load"
+
+# Push updates (GET_NOTIFIES long-poll)
+NOTIFY_TIMEOUT = 45  # seconds; the device holds the request open until something changes
+NOTIFY_RETRY_DELAY = 5  # seconds between retries after a failed long-poll
+NOTIFY_MAX_FAILURES = 3  # consecutive failures before falling back to polling
+DEFAULT_SCAN_INTERVAL_PUSH = 120  # safety-net poll while push updates are flowing
+
+# Activity-adaptive polling (see scheduler.py)
+CONF_SCAN_INTERVAL_MIN = "scan_interval_min"
+CONF_SCAN_INTERVAL_MAX = "scan_interval_max"
+DEFAULT_SCAN_INTERVAL_MIN = 5  # seconds; used right after commands
+DEFAULT_SCAN_INTERVAL_MAX = 300  # seconds; ceiling for idle and powered-off radios
+POLL_BACKOFF_FACTOR = 1.5  # growth per unchanged poll
+COMMAND_BURST_SECONDS = 20  # fast polling after a command
+PLAYING_MAX_BACKOFF = 2  # a playing radio polls at most this many times slower than the ON interval
+
+# Per-device request priorities (see request_scheduler.py); lower runs first
+PRIORITY_INTERACTIVE = 0  # user commands
+PRIORITY_REFRESH = 1  # state polls
+PRIORITY_BACKGROUND = 2  # catalog loads (presets, modes); preempted by commands
+CONF_MAX_REQUEST_RATE = "max_request_rate"
+DEFAULT_MAX_REQUEST_RATE = 10  # requests per second per radio
+
+# Slider/volume command coalescing (see coalescer.py)
+COMMAND_MIN_INTERVAL = 0.25  # seconds between coalesced SETs to the same node
+
+# Masked traffic capture for bug reports (see transport.py)
+CONF_CAPTURE_TRAFFIC = "capture_traffic"
+CAPTURE_DIR = "my_frontier_silicon_captures"  # under the Home Assistant config directory
+CAPTURE_MAX_EXCHANGES = 20000  # recording stops after this many requests
+
+# Pseudo-field set in FrontierSiliconCoordinator.changed_mask when the
+# mode or preset catalog changed (see entity.py)
+FIELD_CATALOG = "catalog"
+
+# Fields whose changes count as activity
+ACTIVITY_FIELDS = (
+    "power",
+    "mode",
+    "play_status",
+    "volume",
+    "mute",
+    "station_name",
+    "station_text",
+    "artist",
+    "album",
+    "graphic_uri",
+)
+STATIC_MODES = ("8",)  # AUX: no metadata to follow
+
+# Per-field poll tiers (options key: poll_<field>)
+POLL_TIER_ALWAYS = "always"  # every cycle
+POLL_TIER_EVERY_N = "every_n"  # every poll_every_n cycles
+POLL_TIER_POWER_ON = "power_on"  # once after each power-on
+POLL_TIER_NEVER = "never"
+POLL_TIERS = [POLL_TIER_ALWAYS, POLL_TIER_EVERY_N, POLL_TIER_POWER_ON, POLL_TIER_NEVER]
+CONF_POLL_EVERY_N = "poll_every_n"
+DEFAULT_POLL_EVERY_N = 4
+DEFAULT_POLL_TIERS = {
+    "volume": POLL_TIER_ALWAYS,
+    "mute": POLL_TIER_ALWAYS,
+    "mode": POLL_TIER_ALWAYS,
+    "play_status": POLL_TIER_ALWAYS,
+    "station_name": POLL_TIER_ALWAYS,
+    "station_text": POLL_TIER_ALWAYS,
+    "artist": POLL_TIER_ALWAYS,
+    "album": POLL_TIER_ALWAYS,
+    "graphic_uri": POLL_TIER_ALWAYS,
+    "sleep_timer": POLL_TIER_ALWAYS,
+    "eq_preset": POLL_TIER_EVERY_N,
+    "wifi_rssi": POLL_TIER_EVERY_N,
+    "volume_steps": POLL_TIER_POWER_ON,
+    "wifi_ssid": POLL_TIER_POWER_ON,
+    "ip_address": POLL_TIER_POWER_ON,
+    "mac_address": POLL_TIER_POWER_ON,
+}
+# Fields the media player needs every cycle are not user-configurable
+CORE_POLL_FIELDS = ("volume", "mute", "mode", "play_status")
+
+# Lists (LIST_GET_NEXT) are read in pages of this many items, following the cursor to the end
+LIST_PAGE_SIZE = 100
+
+# Batched reads
+GET_MULTIPLE_MAX_NODES = 10  # nodes per GET_MULTIPLE request
+
 # Endpoints
 ENDPOINT_CREATE_SESSION = "CREATE_SESSION"
+ENDPOINT_GET_MULTIPLE = "GET_MULTIPLE"
+ENDPOINT_GET_NOTIFIES = "GET_NOTIFIES"
 ENDPOINT_POWER = "netRemote.sys.power"
 ENDPOINT_MODE = "netRemote.sys.mode"
 ENDPOINT_VOLUME = "netRemote.sys.audio.volume"
@@ -34,6 +166,18 @@ ENDPOINT_SELECT_PRESET = "netRemote.nav.action.selectPreset"
 ENDPOINT_EQ_PRESET = "netRemote.sys.audio.eqPreset"
 ENDPOINT_SLEEP = "netRemote.sys.sleep"
 ENDPOINT_NAV_LIST = "netRemote.nav.list"
+ENDPOINT_NAV_STATE = "netRemote.nav.state"
+ENDPOINT_NAV_STATUS = "netRemote.nav.status"
+ENDPOINT_NAV_NAVIGATE = "netRemote.nav.action.navigate"
+ENDPOINT_NAV_SELECT_ITEM = "netRemote.nav.action.selectItem"
+
+# Media browsing of nav.list (see browse_media.py)
+NAV_PAGE_SIZE = 100  # items per LIST_GET_NEXT page; "More…" opens the next page
+NAV_CACHE_TTL = 60  # seconds a listed page is reused
+NAV_CACHE_MAX_PAGES = 64  # pages kept per radio
+NAV_READY_TIMEOUT = 5  # seconds to wait for nav.status to report ready after navigating
+NAV_ITEM_DIRECTORY = 0
+NAV_ITEM_PLAYABLE = 1
 
 # Play control values
 PLAY_CONTROL_STOP = "0"
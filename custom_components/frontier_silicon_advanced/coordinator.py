@@ -1,21 +1,74 @@
 """Data coordinator for My Frontier Silicon integration - FIXED VERSION."""
 import asyncio
 import logging
+import time
 from datetime import timedelta
-from typing import Any
+from typing import Any, Optional
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import aiohttp
 
-from .api import FrontierSiliconAPI
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import FrontierSiliconAPI, ListReadError, create_client_session
+from .artwork import ArtworkCache
+from .catalog import CatalogIndex
+from .coalescer import CommandCoalescer
+from .fleet import FleetScheduler
+from .request_scheduler import request_priority
+from .scheduler import PollScheduler
+from .snapshot import FIELD_BITS, RadioSnapshot, decode_field
+from .transport import RecordingTransport
 from .const import (
+    ARTWORK_CACHE_MAX_BYTES,
+    ARTWORK_FETCH_TIMEOUT,
+    ARTWORK_FRESH_SECONDS,
+    ARTWORK_MAX_IMAGE_BYTES,
+    ARTWORK_RETRY_FAILED_SECONDS,
+    ARTWORK_THUMBNAIL_SIZE,
+    CAPTURE_DIR,
+    CAPTURE_MAX_EXCHANGES,
+    CONF_CAPTURE_TRAFFIC,
+    DATA_ARTWORK,
+    FIELD_CATALOG,
     DOMAIN,
+    CATALOG_SAVE_DELAY,
+    COMMAND_MIN_INTERVAL,
+    DATA_FLEET,
+    CONF_FORCE_PRESET_LOAD,
+    CONF_MAX_REQUEST_RATE,
+    DATA_SESSION,
+    DEFAULT_SCAN_INTERVAL_MAX,
+    DEFAULT_SCAN_INTERVAL_MIN,
+    DEFAULT_SCAN_INTERVAL_PUSH,
+    FLEET_LATE_TOLERANCE,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+    CONF_POLL_EVERY_N,
+    CONF_SCAN_INTERVAL_MAX,
+    CONF_SCAN_INTERVAL_MIN,
+    CORE_POLL_FIELDS,
+    DEFAULT_POLL_EVERY_N,
+    DEFAULT_POLL_TIERS,
+    POLL_TIER_ALWAYS,
+    POLL_TIER_EVERY_N,
+    POLL_TIER_POWER_ON,
+    PRESET_HARVEST_INTERVAL,
+    PRESET_HARVEST_RETRY_DELAY,
+    PRIORITY_BACKGROUND,
+    PRESET_MODES,
     SCAN_INTERVAL,
+    STORAGE_KEY,
+    STORAGE_VERSION,
     CONF_PIN,
     DEFAULT_PORT,
+    DEFAULT_MAX_REQUEST_RATE,
     DEFAULT_PIN,
+    ENDPOINT_SLEEP,
+    ENDPOINT_VOLUME,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +94,90 @@ DEFAULT_OFF_DATA: dict[str, Any] = {
     "mac_address": None,
 }
 
+# Coordinator data field -> FSAPI node, read in one GET_MULTIPLE batch per cycle
+DETAIL_NODES: dict[str, str] = {
+    "volume": "netRemote.sys.audio.volume",
+    "mute": "netRemote.sys.audio.mute",
+    "mode": "netRemote.sys.mode",
+    "play_status": "netRemote.play.status",
+    "station_name": "netRemote.play.info.name",
+    "station_text": "netRemote.play.info.text",
+    "artist": "netRemote.play.info.artist",
+    "album": "netRemote.play.info.album",
+    "graphic_uri": "netRemote.play.info.graphicUri",
+    "volume_steps": "netRemote.sys.caps.volumeSteps",
+    "sleep_timer": "netRemote.sys.sleep",
+    "eq_preset": "netRemote.sys.audio.eqPreset",
+    "wifi_rssi": "netRemote.sys.net.wlan.rssi",
+    "wifi_ssid": "netRemote.sys.net.wlan.connectedSSID",
+    "ip_address": "netRemote.sys.net.ipConfig.address",
+    "mac_address": "netRemote.sys.net.wlan.macAddress",
+}
+
+# GET_NOTIFIES reports node names in lower case
+NOTIFY_FIELDS: dict[str, str] = {node.lower(): field for field, node in DETAIL_NODES.items()}
+NOTIFY_NODE_POWER = "netremote.sys.power"
+
+NODE_FIRMWARE_VERSION = "netRemote.sys.info.version"
+NODE_FRIENDLY_NAME = "netRemote.sys.info.friendlyName"
+NODE_RADIO_ID = "netRemote.sys.info.radioId"
+NODE_MODE = "netRemote.sys.mode"
+
+
+@callback
+def async_get_shared_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the keep-alive HTTP client shared by all radios and the config flow."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(DATA_SESSION)
+    if session is None or session.closed:
+        _LOGGER.debug("Creating shared HTTP client for all radios")
+        session = create_client_session()
+        domain_data[DATA_SESSION] = session
+
+        async def _async_close_session(event: Event) -> None:
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return session
+
+
+@callback
+def async_get_fleet_scheduler(hass: HomeAssistant) -> FleetScheduler:
+    """Return the scheduler that staggers polls and caps requests across all radios."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    fleet: FleetScheduler | None = domain_data.get(DATA_FLEET)
+    if fleet is None:
+        fleet = FleetScheduler(
+            max_concurrent_requests=FLEET_MAX_CONCURRENT_REQUESTS,
+            late_tolerance=FLEET_LATE_TOLERANCE,
+        )
+        domain_data[DATA_FLEET] = fleet
+    return fleet
+
+
+@callback
+def async_get_artwork_cache(hass: HomeAssistant) -> ArtworkCache:
+    """Return the album art cache shared by all radios.
+
+    Artwork is mostly hosted on the internet, so it is fetched with Home
+    Assistant's general client session rather than the one tuned for (and
+    kept free for) the radios.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    artwork: ArtworkCache | None = domain_data.get(DATA_ARTWORK)
+    if artwork is None:
+        artwork = ArtworkCache(
+            lambda: async_get_clientsession(hass),
+            max_bytes=ARTWORK_CACHE_MAX_BYTES,
+            max_image_bytes=ARTWORK_MAX_IMAGE_BYTES,
+            fresh_for=ARTWORK_FRESH_SECONDS,
+            retry_failed_after=ARTWORK_RETRY_FAILED_SECONDS,
+            thumbnail_size=ARTWORK_THUMBNAIL_SIZE,
+            timeout=ARTWORK_FETCH_TIMEOUT,
+        )
+        domain_data[DATA_ARTWORK] = artwork
+    return artwork
+
 
 class FrontierSiliconCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Frontier Silicon device."""
@@ -48,26 +185,87 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize coordinator."""
         self.entry = entry
+        self._fleet = async_get_fleet_scheduler(hass)
+        self._fleet.register(entry.entry_id)
         self.api = FrontierSiliconAPI(
             host=entry.data[CONF_HOST],
             port=entry.data.get(CONF_PORT, DEFAULT_PORT),
             pin=entry.data.get(CONF_PIN, DEFAULT_PIN),
+            session=async_get_shared_session(hass),
+            min_request_interval=1 / entry.options.get(CONF_MAX_REQUEST_RATE, DEFAULT_MAX_REQUEST_RATE),
+            request_limiter=self._fleet.request_limiter,
         )
+        if entry.options.get(CONF_CAPTURE_TRAFFIC, False):
+            capture_path = hass.config.path(
+                CAPTURE_DIR, f"{entry.entry_id}-{time.strftime('%Y%m%d-%H%M%S')}.jsonl.gz"
+            )
+            _LOGGER.warning("Recording masked FSAPI traffic of %s to %s", entry.data[CONF_HOST], capture_path)
+            self.api.transport = RecordingTransport(
+                self.api.transport, capture_path, max_exchanges=CAPTURE_MAX_EXCHANGES
+            )
+        self._base_interval: Optional[float] = None  # scheduler's choice before phase alignment
         self._device_info: dict[str, Any] = {}
         self._modes: list[dict[str, str]] = []
         self._all_presets: dict[str, list[dict[str, str]]] = {}
         self._presets: list[dict[str, str]] = []
+        self._preset_harvested_at: dict[str, float] = {}  # mode -> wall-clock time presets were read
+        self._preset_harvest_failed_at: dict[str, float] = {}  # mode -> monotonic time of a failed read
+        self._harvest_task: Optional[asyncio.Task] = None
+        self._radio_id: Optional[str] = None
+        self._identity_verified = False  # radioId/firmware checked since last power-on
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
+
+        # Bitmask (snapshot.FIELD_BITS) of fields that differ from the last data
+        # published to the entities; None = unknown (first update, availability
+        # change), so everything writes
+        self.changed_mask: Optional[int] = None
+        self._published: Optional[RadioSnapshot] = None
+        self._published_success = True
+        self._catalog_version = 0  # bumped whenever modes or presets change
+        self._catalog_index: Optional[CatalogIndex] = None
+        self._published_catalog_version = 0
+
+        # Fields written by commands: field -> monotonic time the radio confirmed the SET
+        self._written_at: dict[str, float] = {}
+
+        # Rapid volume / sleep timer changes collapse into the latest target
+        self._volume_commands = CommandCoalescer(
+            lambda level: self._async_set_field("volume", ENDPOINT_VOLUME, level),
+            min_interval=COMMAND_MIN_INTERVAL,
+            name="volume",
+        )
+        self._sleep_commands = CommandCoalescer(
+            lambda seconds: self._async_set_field("sleep_timer", ENDPOINT_SLEEP, seconds),
+            min_interval=COMMAND_MIN_INTERVAL,
+            name="sleep_timer",
+        )
         
         # Get options with defaults
         self._debug_logging = entry.options.get("debug_logging", False)
         self._auto_load_presets = entry.options.get("auto_load_presets", True)
+        self._force_preset_load = entry.options.get(CONF_FORCE_PRESET_LOAD, False)
         scan_interval_off = entry.options.get("scan_interval_off", 60)
         scan_interval_on = entry.options.get("scan_interval_on", 15)
+        self._push_updates = entry.options.get("push_updates", True)
+        self._scan_interval_push = entry.options.get("scan_interval_push", DEFAULT_SCAN_INTERVAL_PUSH)
+
+        # Per-field poll policy; core fields are always read
+        self._poll_tiers = {
+            field: tier if field in CORE_POLL_FIELDS else entry.options.get(f"poll_{field}", tier)
+            for field, tier in DEFAULT_POLL_TIERS.items()
+        }
+        self._poll_every_n = max(1, entry.options.get(CONF_POLL_EVERY_N, DEFAULT_POLL_EVERY_N))
+        self._poll_cycle = 0  # detail cycles since the radio was last seen powering on
+        self._polled_since_power_on: set[str] = set()
         
-        # Use appropriate scan interval based on power state
-        # Will be updated dynamically
-        self._scan_interval_off = scan_interval_off
-        self._scan_interval_on = scan_interval_on
+        # Poll interval adapts to activity; ON/OFF/push intervals are the starting points
+        self._scheduler = PollScheduler(
+            interval_min=entry.options.get(CONF_SCAN_INTERVAL_MIN, DEFAULT_SCAN_INTERVAL_MIN),
+            interval_max=entry.options.get(CONF_SCAN_INTERVAL_MAX, DEFAULT_SCAN_INTERVAL_MAX),
+            interval_on=scan_interval_on,
+            interval_off=scan_interval_off,
+            interval_push=self._scan_interval_push,
+        )
 
         super().__init__(
             hass,
@@ -91,20 +289,33 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
         """Return True only when the latest coordinator data says power is ON."""
         return bool(self.data and self.data.get("power") is True)
 
-    def _update_scan_interval(self, radio_on: bool) -> None:
-        """Update scan interval based on current power state.
-        
-        Args:
-            radio_on: Current radio power state (from probe, not self.data)
+    def _update_scan_interval(self, data: Optional[dict[str, Any]]) -> None:
+        """Set the next poll interval from the latest data (not the old self.data).
+
+        The interval is stretched or shortened to this radio's phase slot so
+        radios on the same interval don't poll in lockstep.
         """
-        if radio_on:
-            new_interval = timedelta(seconds=self._scan_interval_on)
+        interval = self._scheduler.next_interval(data, push_active=self.api.notify_listener_active)
+        if interval != self._base_interval:
+            self._log_debug("Scan interval changed to %s seconds", interval)
+            self._base_interval = interval
+        self.update_interval = timedelta(seconds=self._fleet.next_delay(self.entry.entry_id, interval))
+
+    def _schedule_unreachable_retry(self) -> None:
+        """Poll again when the open circuit lets a probe through, instead of on the normal schedule.
+
+        The session is kept: if the radio only dropped off the network
+        briefly, it is still valid when the radio comes back.
+        """
+        self._reset_poll_tiers()
+        self._scheduler.reset()
+        self._base_interval = None
+        circuit = self.api.circuit
+        if circuit.is_open:
+            interval = max(circuit.retry_in, self._scheduler.interval_min)
         else:
-            new_interval = timedelta(seconds=self._scan_interval_off)
-        
-        if self.update_interval != new_interval:
-            self._log_info("Scan interval changed to %s seconds", new_interval.total_seconds())
-            self.update_interval = new_interval
+            interval = self._scheduler.interval_min
+        self.update_interval = timedelta(seconds=interval)
 
     async def _probe_power(self, *, context: str, allow_session_create: bool) -> tuple[bool, str]:
         """Probe radio power state with explicit logging."""
@@ -122,88 +333,374 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
         self._log_info("Power probe result: context=%s power=%s status=%s", context, power, status)
         return power == "1", status
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    def _fields_due(self) -> list[str]:
+        """Return the detail fields whose poll tier says to read them this cycle."""
+        due = []
+        for field, tier in self._poll_tiers.items():
+            if tier == POLL_TIER_ALWAYS:
+                due.append(field)
+            elif tier == POLL_TIER_EVERY_N and self._poll_cycle % self._poll_every_n == 0:
+                due.append(field)
+            elif tier == POLL_TIER_POWER_ON and field not in self._polled_since_power_on:
+                due.append(field)
+        return due
+
+    def _reset_poll_tiers(self) -> None:
+        """Forget per-power-on state so slow fields are read again after the next power-on."""
+        self._poll_cycle = 0
+        self._polled_since_power_on.clear()
+        self._identity_verified = False
+
+    async def _async_load_catalog(self) -> None:
+        """Restore modes, presets and device info saved by a previous run."""
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load cached radio catalog: %s", err)
+            return
+        if not stored:
+            return
+
+        self._radio_id = stored.get("radio_id")
+        self._device_info = stored.get("device_info") or {}
+        self._modes = stored.get("modes") or []
+        self._all_presets = stored.get("presets") or {}
+        self._preset_harvested_at = stored.get("preset_harvested_at") or {}
+        self._catalog_version += 1
+        self._log_info(
+            "Loaded cached catalog: radio_id=%s firmware=%s modes=%d preset_modes=%d",
+            self._radio_id,
+            self._device_info.get("firmware_version"),
+            len(self._modes),
+            len(self._all_presets),
+        )
+
+    @callback
+    def _async_save_catalog(self) -> None:
+        """Schedule a write of the catalogs to Home Assistant storage."""
+        self._catalog_version += 1
+        self._store.async_delay_save(self._catalog_to_store, CATALOG_SAVE_DELAY)
+
+    @property
+    def catalog(self) -> CatalogIndex:
+        """Return mode and preset lookups, rebuilt only after the catalogs changed."""
+        index = self._catalog_index
+        if index is None or index.version != self._catalog_version:
+            index = self._catalog_index = CatalogIndex(self._catalog_version, self._modes, self._all_presets)
+        return index
+
+    @callback
+    def _catalog_to_store(self) -> dict[str, Any]:
+        """Return the catalogs as stored, keyed by radio id and firmware version."""
+        return {
+            "radio_id": self._radio_id,
+            "firmware_version": self._device_info.get("firmware_version"),
+            "device_info": self._device_info,
+            "modes": self._modes,
+            "presets": self._all_presets,
+            "preset_harvested_at": self._preset_harvested_at,
+        }
+
+    async def _async_verify_identity(self, *, context: str) -> None:
+        """Read radioId and firmware; drop cached catalogs if either changed."""
+        info = await self.api.get_values(
+            [NODE_FIRMWARE_VERSION, NODE_FRIENDLY_NAME, NODE_RADIO_ID],
+            context=f"{context}:device_info",
+        )
+        firmware_version = info[NODE_FIRMWARE_VERSION][0]
+        device_model = info[NODE_FRIENDLY_NAME][0]
+        radio_id = info[NODE_RADIO_ID][0]
+        if firmware_version is None and device_model is None:
+            _LOGGER.warning("Could not read device info; context=%s", context)
+            return
+
+        cached = (self._radio_id, self._device_info.get("firmware_version"))
+        if cached != (radio_id, firmware_version) and (self._modes or self._all_presets):
+            self._log_info(
+                "Radio or firmware changed (%s/%s -> %s/%s); discarding cached modes and presets",
+                cached[0], cached[1], radio_id, firmware_version,
+            )
+            self._modes = []
+            self._all_presets = {}
+            self._preset_harvested_at = {}
+
+        self._radio_id = radio_id
+        self._device_info = {
+            "firmware_version": firmware_version,
+            "device_model": device_model,
+        }
+        self._identity_verified = True
+        self._log_info("Device info: model=%s firmware=%s radio_id=%s", device_model, firmware_version, radio_id)
+        self._async_save_catalog()
+
+    @callback
+    def _schedule_preset_harvest(self, mode: Optional[str]) -> None:
+        """Read presets for the mode the radio is in now, in the background.
+
+        Nothing is switched: the radio is already playing this mode, so reading
+        its preset list is inaudible. Each mode is read again at most every
+        PRESET_HARVEST_INTERVAL seconds; a read that failed is retried after
+        PRESET_HARVEST_RETRY_DELAY seconds.
+        """
+        if not self._auto_load_presets or mode not in PRESET_MODES:
+            return
+        if self._harvest_task is not None and not self._harvest_task.done():
+            return
+        harvested_at = self._preset_harvested_at.get(mode)
+        if harvested_at and time.time() - harvested_at < PRESET_HARVEST_INTERVAL:
+            return
+        failed_at = self._preset_harvest_failed_at.get(mode)
+        if failed_at is not None and time.monotonic() - failed_at < PRESET_HARVEST_RETRY_DELAY:
+            return
+        self._harvest_task = self.hass.async_create_background_task(
+            self._async_harvest_presets(mode),
+            f"{DOMAIN} preset harvest {self.entry.entry_id}",
+        )
+
+    async def _async_harvest_presets(self, mode: str) -> bool:
+        """Read the preset list of the current mode and merge it into the catalog."""
+        try:
+            with request_priority(PRIORITY_BACKGROUND):
+                presets = await self.api.get_presets()
+                # The list belongs to whatever mode was active while it was read
+                current_mode, _ = await self.api.get_value(NODE_MODE, context="preset_harvest:mode_check")
+        except ListReadError as err:
+            # Not stamped as harvested: an unread list must not count as an empty one
+            self._preset_harvest_failed_at[mode] = time.monotonic()
+            self._log_info("Could not read presets for mode %s (%s); will retry", mode, err.status)
+            return False
+        except Exception as err:
+            self._preset_harvest_failed_at[mode] = time.monotonic()
+            _LOGGER.warning("Error harvesting presets for mode %s: %s", mode, err)
+            return False
+
+        if current_mode != mode:
+            self._log_debug("Mode changed from %s to %s during preset harvest; discarding", mode, current_mode)
+            return False
+
+        self._preset_harvested_at[mode] = time.time()
+        self._preset_harvest_failed_at.pop(mode, None)
+        if presets:
+            self._all_presets[mode] = presets
+            self._log_info("Harvested %d presets for mode %s", len(presets), mode)
+        self._async_save_catalog()
+        self.async_update_listeners()
+        return True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Work out which fields changed since the last update, then notify the entities.
+
+        Every snapshot is built from the one published before it, so its
+        change mask is already relative to what the entities last saw.
+        """
+        data = self.data
+        previous = self._published
+        if previous is None or data is None or self.last_update_success != self._published_success:
+            self.changed_mask = None
+        else:
+            changed = data.changed if data is not previous else 0
+            if self._catalog_version != self._published_catalog_version:
+                changed |= FIELD_BITS[FIELD_CATALOG]
+            self.changed_mask = changed
+        self._published = data
+        self._published_success = self.last_update_success
+        self._published_catalog_version = self._catalog_version
+        super().async_update_listeners()
+
+    def _overlay_fresh_writes(self, data: dict[str, Any], started: float) -> None:
+        """Keep values confirmed by a SET while this refresh was in flight.
+
+        The refresh may have read those nodes before the write landed. Older
+        writes are dropped: this refresh has already reconciled them.
+        """
+        for field, written_at in list(self._written_at.items()):
+            if written_at <= started:
+                del self._written_at[field]
+            elif self.data and field in self.data:
+                data[field] = self.data[field]
+
+    @callback
+    def async_write_through(self, values: dict[str, Any]) -> None:
+        """Apply values the radio just confirmed, without re-reading the device.
+
+        The next polls come quickly (command burst) and reconcile anything the
+        command changed indirectly, such as station metadata after a mode change.
+        """
+        if not self._radio_is_known_on():
+            return
+        now = time.monotonic()
+        for field in values:
+            self._written_at[field] = now
+        self._scheduler.note_command()
+        self.update_interval = timedelta(seconds=self._scheduler.interval_min)
+        self._log_debug("Write-through: %s", values)
+        self.async_set_updated_data(self.data.replace(values))
+
+    async def async_command_done(self, success: bool, values: dict[str, Any]) -> None:
+        """Show a confirmed command's result at once; refresh instead if it failed."""
+        if success and self._radio_is_known_on():
+            self.async_write_through(values)
+        else:
+            await self.async_refresh_after_command()
+
+    async def _async_set_field(self, field: str, node: str, value: Any) -> str:
+        """SET one node and write the confirmed value through to the coordinator data."""
+        status = await self.api.set_value(node, str(value), context=f"set_{field}:{value}")
+        if status == "FS_OK":
+            self.async_write_through({field: value})
+        return status
+
+    def _start_push_listener(self) -> None:
+        """Start consuming GET_NOTIFIES while the radio is on."""
+        if self._push_updates:
+            self.api.start_notify_listener(self._handle_notifies, self._handle_notify_stopped)
+
+    @callback
+    def _handle_notifies(self, changes: dict[str, Optional[str]]) -> None:
+        """Merge pushed node changes into the coordinator data."""
+        if not self._radio_is_known_on():
+            return
+
+        if NOTIFY_NODE_POWER in changes and changes[NOTIFY_NODE_POWER] != "1":
+            self._log_info("Push update: radio powered off; refreshing")
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        values = {}
+        for node, value in changes.items():
+            field = NOTIFY_FIELDS.get(node)
+            if field is not None:
+                values[field] = decode_field(field, value)
+
+        data = self.data.replace(values)
+        if data.changed:
+            self._log_debug("Push update applied: %s", changes)
+            self.async_set_updated_data(data)
+            self._schedule_preset_harvest(data.mode)
+
+    @callback
+    def _handle_notify_stopped(self) -> None:
+        """Fall back to normal polling when the notify listener ends."""
+        self._log_info("Push updates stopped; returning to polling")
+        self._update_scan_interval(self.data)
+        if self._radio_is_known_on():
+            # Re-arm the schedule with the faster interval right away
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def _async_update_data(self) -> RadioSnapshot:
         """Fetch data from API."""
+        self._fleet.cycle_started(self.entry.entry_id)
+        started = time.monotonic()
+        try:
+            return RadioSnapshot(await self._async_poll(started), self.data)
+        finally:
+            self._fleet.cycle_finished(self.entry.entry_id, time.monotonic() - started)
+
+    async def _async_poll(self, started: float) -> dict[str, Any]:
+        """Poll the radio: power first, then the detail fields that are due."""
         try:
             radio_on, status = await self._probe_power(
                 context="periodic_update_power_check",
                 allow_session_create=True,
             )
 
+            if not radio_on and not self.api.reachable:
+                self._schedule_unreachable_retry()
+                raise UpdateFailed(f"Radio at {self.api.host} is not reachable")
+
             if not radio_on:
                 self._log_info("Radio is OFF/unknown; skipping detailed data and clearing session")
                 await self.api.clear_session(context="periodic_update_power_off_or_unknown")
-                self._update_scan_interval(radio_on)  # Use current state, not old self.data
-                return DEFAULT_OFF_DATA.copy()
+                self._reset_poll_tiers()
+                data = DEFAULT_OFF_DATA.copy()
+                data.update(self._device_info)  # cached identity stays visible while off
+                self._update_scan_interval(data)
+                return data
 
             self._log_info("Radio is ON; fetching detailed playback/status data")
-            self._update_scan_interval(radio_on)  # Use current state, not old self.data
+            if not self._identity_verified:
+                try:
+                    await self._async_verify_identity(context="power_on")
+                except Exception as err:
+                    _LOGGER.warning("Error checking device info after power-on: %s", err)
             
             data = DEFAULT_OFF_DATA.copy()
             data.update({"power": True, "available": True})
 
-            volume, _ = await self.api.get_value("netRemote.sys.audio.volume", context="details:volume")
-            mute, _ = await self.api.get_value("netRemote.sys.audio.mute", context="details:mute")
-            mode, _ = await self.api.get_value("netRemote.sys.mode", context="details:mode")
-            play_status, _ = await self.api.get_value("netRemote.play.status", context="details:play_status")
-            station_name, _ = await self.api.get_value("netRemote.play.info.name", context="details:station_name")
-            station_text, _ = await self.api.get_value("netRemote.play.info.text", context="details:station_text")
-            artist, _ = await self.api.get_value("netRemote.play.info.artist", context="details:artist")
-            album, _ = await self.api.get_value("netRemote.play.info.album", context="details:album")
-            graphic_uri, _ = await self.api.get_value("netRemote.play.info.graphicUri", context="details:graphic_uri")
-            volume_steps, _ = await self.api.get_value("netRemote.sys.caps.volumeSteps", context="details:volume_steps")
-            sleep_timer, _ = await self.api.get_value("netRemote.sys.sleep", context="details:sleep_timer")
-            eq_preset, _ = await self.api.get_value("netRemote.sys.audio.eqPreset", context="details:eq_preset")
-            wifi_rssi, _ = await self.api.get_value("netRemote.sys.net.wlan.rssi", context="details:wifi_rssi")
-            wifi_ssid, _ = await self.api.get_value("netRemote.sys.net.wlan.connectedSSID", context="details:wifi_ssid")
-            ip_address, _ = await self.api.get_value("netRemote.sys.net.ipConfig.address", context="details:ip_address")
-            mac_address, _ = await self.api.get_value("netRemote.sys.net.wlan.macAddress", context="details:mac_address")
-
-            data.update({
-                "volume": int(volume) if volume else 0,
-                "volume_steps": int(volume_steps) if volume_steps else 32,
-                "mute": mute == "1",
-                "mode": mode,
-                "play_status": play_status,
-                "station_name": station_name,
-                "station_text": station_text,
-                "artist": artist,
-                "album": album,
-                "graphic_uri": graphic_uri,
-                "sleep_timer": int(sleep_timer) if sleep_timer else 0,
-                "eq_preset": eq_preset,
-                "wifi_rssi": wifi_rssi,
-                "wifi_ssid": wifi_ssid,
-                "ip_address": ip_address,
-                "mac_address": mac_address,
-            })
+            # Fields not due this cycle keep their last value while the radio stays on
+            previous = self.data if self._radio_is_known_on() else {}
+            due = self._fields_due()
+            values = await self.api.get_values([DETAIL_NODES[field] for field in due], context="details")
+            for field in DETAIL_NODES:
+                if field in due:
+                    value, node_status = values.get(DETAIL_NODES[field], (None, ""))
+                    data[field] = decode_field(field, value)
+                    if node_status in ("FS_OK", "FS_NODE_DOES_NOT_EXIST"):
+                        self._polled_since_power_on.add(field)
+                elif field in previous:
+                    data[field] = previous[field]
+            self._poll_cycle += 1
+            self._log_debug("Polled %d/%d detail fields (cycle %d)", len(due), len(DETAIL_NODES), self._poll_cycle)
 
             if self._device_info:
                 data.update(self._device_info)
+            self._overlay_fresh_writes(data, started)
 
+            self._start_push_listener()
+            self._update_scan_interval(data)
+            self._schedule_preset_harvest(data.get("mode"))
             return data
 
+        except UpdateFailed:
+            raise
         except Exception as err:
             _LOGGER.warning("Error communicating with device: %s", err)
             await self.api.clear_session(context="update_exception")
+            self._reset_poll_tiers()
+            self._scheduler.reset()
             data = DEFAULT_OFF_DATA.copy()
             data["available"] = False
             return data
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator."""
+        if self._harvest_task is not None and not self._harvest_task.done():
+            self._harvest_task.cancel()
+        self._volume_commands.cancel()
+        self._sleep_commands.cancel()
+        self._fleet.unregister(self.entry.entry_id)
         await self.api.close()
 
-    async def async_config_entry_first_refresh(self) -> None:
-        """Perform first refresh and load initial data safely."""
-        self._log_info(
-            "Frontier Silicon: Safe mode active - presets load only when power confirmed ON"
-        )
+    async def async_restore(self) -> None:
+        """Restore the cached catalog and publish placeholder data, without contacting the radio.
 
+        Entities can be set up from this right away. Until async_first_load
+        has polled, last_update_success is False, so every coordinator entity
+        is unavailable instead of showing placeholder values.
+        """
         self._device_info = {}
         self._modes = []
         self._all_presets = {}
         self._presets = []
+        await self._async_load_catalog()
+
+        data = DEFAULT_OFF_DATA.copy()
+        data.update(self._device_info)
+        data["available"] = False
+        self.data = RadioSnapshot(data)
+        self.last_update_success = False
+
+    async def async_first_load(self) -> None:
+        """Check the radio's identity and modes, then run the first poll.
+
+        Runs as a background task of the config entry, so Home Assistant
+        startup never waits for a slow or unreachable radio.
+        """
+        self._log_info(
+            "Frontier Silicon: Safe mode active - presets load only when power confirmed ON"
+        )
+        started = time.monotonic()
 
         radio_on, _ = await self._probe_power(
             context="startup_power_check",
@@ -211,34 +708,42 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
         )
 
         if radio_on:
-            self._log_info("Startup: radio is ON. Loading device info and modes")
+            self._log_info("Startup: radio is ON. Checking device info against the cached catalog")
             try:
-                firmware_version, _ = await self.api.get_value("netRemote.sys.info.version", context="startup:firmware_version")
-                device_model, _ = await self.api.get_value("netRemote.sys.info.friendlyName", context="startup:friendly_name")
-                self._device_info = {
-                    "firmware_version": firmware_version,
-                    "device_model": device_model,
-                }
-                self._log_info("Startup device info: model=%s firmware=%s", device_model, firmware_version)
+                await self._async_verify_identity(context="startup")
             except Exception as err:
                 _LOGGER.warning("Error loading startup device info: %s", err)
-                self._device_info = {}
 
-            try:
-                self._modes = await self.api.get_modes()
-                self._log_info("Startup: loaded %d modes", len(self._modes))
-            except Exception as err:
-                _LOGGER.warning("Startup: error loading modes: %s", err)
-                self._modes = []
+            if not self._modes:
+                try:
+                    self._modes = await self.api.get_modes()
+                    self._log_info("Startup: loaded %d modes", len(self._modes))
+                    self._async_save_catalog()
+                except Exception as err:
+                    _LOGGER.warning("Startup: error loading modes: %s", err)
+                    self._modes = []
         else:
-            self._log_info("Startup: radio is OFF/unknown. No modes, presets or device details will be loaded")
+            self._log_info(
+                "Startup: radio is OFF/unknown. Using cached catalog (%d modes, %d preset modes); nothing read from the radio",
+                len(self._modes),
+                len(self._all_presets),
+            )
             await self.api.clear_session(context="startup_radio_off")
 
-        await super().async_config_entry_first_refresh()
+        await self.async_refresh()
+        self._log_info(
+            "Startup: first load finished in %.2fs (update_success=%s)",
+            time.monotonic() - started,
+            self.last_update_success,
+        )
 
     async def _load_presets_for_mode(self, mode_id: str) -> list[dict[str, str]]:
         """Load presets for a specific mode, preserving current mode.
         
+        Switching modes interrupts playback, so this is only used when the
+        force_preset_load option is enabled. Normally presets are harvested
+        while the radio is already in the mode (see _schedule_preset_harvest).
+
         CRITICAL: This saves and restores the current mode to avoid
         interrupting the user's listening experience!
         """
@@ -279,28 +784,44 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning("Failed to restore mode %s: %s", current_mode, err)
 
     async def get_all_presets(self) -> dict[str, list[dict[str, str]]]:
-        """Get all presets for all modes, guarded by current power state."""
-        if self._all_presets:
-            self._log_debug("Returning cached all-presets (%d modes)", len(self._all_presets))
-            return self._all_presets
-
+        """Re-read presets for the current mode; other modes only with forced loading."""
         if not self._radio_is_known_on():
-            self._log_info(
-                "Preset auto-load skipped: radio is OFF/not confirmed ON"
-            )
+            self._log_info("Preset refresh skipped: radio is OFF/not confirmed ON")
             return self._all_presets
 
-        if not self._auto_load_presets:
-            self._log_info("Preset auto-load disabled by config option")
-            return self._all_presets
+        mode = self.data.get("mode")
+        if mode in PRESET_MODES:
+            await self._async_harvest_presets(mode)
 
-        self._log_info("All presets not cached. Radio confirmed ON, loading presets on demand")
-        self._all_presets = {}
-        for mode in ["0", "3", "4"]:
-            presets = await self._load_presets_for_mode(mode)
+        if self._force_preset_load:
+            await self._async_force_load_presets()
+        return self._all_presets
+
+    async def _async_force_load_presets(self) -> None:
+        """Switch through the preset modes not harvested yet (opt-in, interrupts playback)."""
+        for mode in PRESET_MODES:
+            if mode in self._all_presets:
+                continue
+            with request_priority(PRIORITY_BACKGROUND):
+                presets = await self._load_presets_for_mode(mode)
             if presets:
                 self._all_presets[mode] = presets
-        return self._all_presets
+                self._preset_harvested_at[mode] = time.time()
+                _LOGGER.info("Loaded %d presets for mode %s", len(presets), mode)
+        self._async_save_catalog()
+
+    async def async_load_missing_catalogs(self) -> None:
+        """Load modes not cached yet; presets follow as each mode gets used."""
+        try:
+            if not self._modes:
+                _LOGGER.info("Loading modes after power-on")
+                with request_priority(PRIORITY_BACKGROUND):
+                    self._modes = await self.api.get_modes()
+                self._async_save_catalog()
+            if self._force_preset_load and self._auto_load_presets:
+                await self._async_force_load_presets()
+        except Exception as err:
+            _LOGGER.warning("Error loading catalogs on power-on: %s", err)
 
     async def get_modes(self) -> list[dict[str, str]]:
         """Get available modes, guarded by current power state."""
@@ -311,6 +832,7 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
             return self._modes
         self._log_debug("Modes not cached, fetching from device")
         self._modes = await self.api.get_modes()
+        self._async_save_catalog()
         return self._modes
 
     async def get_presets(self) -> list[dict[str, str]]:
@@ -341,8 +863,42 @@ class FrontierSiliconCoordinator(DataUpdateCoordinator):
             return
         self._log_info("Refreshing modes from device")
         self._modes = await self.api.get_modes()
+        self._async_save_catalog()
         await self.async_request_refresh()
 
+    async def async_refresh_after_command(self) -> None:
+        """Refresh after a user command and keep polling fast for a short while."""
+        self._scheduler.note_command()
+        await self.async_request_refresh()
+
+    @property
+    def volume_target(self) -> int:
+        """Return the volume the radio is heading to: a pending command, else the last reading."""
+        target = self._volume_commands.target
+        if target is not None:
+            return target
+        return self.data.get("volume", 0) if self.data else 0
+
+    async def async_set_volume(self, level: int) -> None:
+        """Set the volume, coalescing rapid changes into the latest level."""
+        volume_steps = self.data.get("volume_steps", 32) if self.data else 32
+        level = max(0, min(int(level), volume_steps))
+        status = await self._volume_commands.async_set(level)
+        if status != "FS_OK":
+            _LOGGER.warning("Setting volume to %s failed: %s", level, status)
+            await self.async_refresh_after_command()
+
+    async def async_step_volume(self, delta: int) -> None:
+        """Change the volume relative to the pending target, not the last poll."""
+        await self.async_set_volume(self.volume_target + delta)
+
+    async def async_set_sleep_timer(self, seconds: int) -> None:
+        """Set the sleep timer, coalescing rapid changes into the latest value."""
+        status = await self._sleep_commands.async_set(seconds)
+        if status != "FS_OK":
+            _LOGGER.warning("Setting sleep timer to %ss failed: %s", seconds, status)
+            await self.async_refresh_after_command()
+
     async def force_power_probe(self) -> None:
         """Manual helper for testing power detection from Home Assistant button."""
         _LOGGER.warning("Manual force power probe requested")
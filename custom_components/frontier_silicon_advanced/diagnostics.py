@@ -0,0 +1,38 @@
+"""Diagnostics support for My Frontier Silicon."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PIN, DOMAIN
+from .coordinator import FrontierSiliconCoordinator, async_get_artwork_cache, async_get_fleet_scheduler
+
+TO_REDACT = {CONF_PIN, "mac_address", "wifi_ssid"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry: request metrics, poll timing and current state."""
+    coordinator: FrontierSiliconCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fleet = async_get_fleet_scheduler(hass)
+    interval = coordinator.update_interval
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "polling": {
+            "update_interval": interval.total_seconds() if interval else None,
+            "last_update_success": coordinator.last_update_success,
+            "push_active": coordinator.api.notify_listener_active,
+            "fleet": fleet.stats().get(entry.entry_id),
+            "fleet_radios": len(fleet.stats()),
+        },
+        "circuit": coordinator.api.circuit.as_dict(),
+        "metrics": coordinator.api.metrics.as_dict(),
+        "artwork": async_get_artwork_cache(hass).stats(),
+        "data": async_redact_data(dict(coordinator.data or {}), TO_REDACT),
+    }
@@ -0,0 +1,142 @@
+"""LAN discovery of Frontier Silicon radios.
+
+Radios answer GET /device (no PIN needed) with a small descriptor naming the
+radio and advertising its /fsapi URL. A subnet scan probes every address with
+bounded concurrency and a short timeout, so a /24 takes a few seconds. PINs
+are then checked for all found radios in parallel. A scan runs on a client
+session of its own (create_scan_session), so probes of dead addresses never
+hold connection slots the configured radios' requests are waiting for.
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from .api import FrontierSiliconAPI
+from .const import (
+    DEFAULT_PORT,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+)
+from .parser import parse_device
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def create_scan_session() -> aiohttp.ClientSession:
+    """Create a short-lived HTTP client for one scan; close it when the scan is done."""
+    # Each address is probed once, so there is nothing to keep alive
+    connector = aiohttp.TCPConnector(limit=DISCOVERY_CONCURRENCY, force_close=True)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class DiscoveredRadio:
+    """A radio that answered the /device probe."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        name: Optional[str],
+        version: Optional[str],
+        radio_id: Optional[str] = None,
+    ) -> None:
+        """Initialize from the probed address and descriptor."""
+        self.host = host
+        self.port = port
+        self.name = name
+        self.version = version
+        self.radio_id = radio_id
+        self.pin_valid: Optional[bool] = None  # None = not checked yet
+
+    @property
+    def unique_id(self) -> str:
+        """Return the config entry unique id: the radio id, else the host.
+
+        Friendly names are not unique (many radios keep their default name).
+        """
+        return self.radio_id or self.host
+
+    def __repr__(self) -> str:
+        return f"DiscoveredRadio({self.host}:{self.port}, {self.name!r})"
+
+
+async def async_probe_host(
+    session: aiohttp.ClientSession,
+    host: str,
+    port: int = DEFAULT_PORT,
+    *,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> Optional[DiscoveredRadio]:
+    """Return the radio at host:port, or None if nothing FSAPI answers there."""
+    url = f"http://{host}/device" if port == 80 else f"http://{host}:{port}/device"
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                return None
+            body = await response.read()
+    except (asyncio.TimeoutError, aiohttp.ClientError, OSError):
+        return None
+
+    device = parse_device(body)
+    if device is None:
+        return None
+
+    # The descriptor names the FSAPI endpoint; follow its port if it differs
+    fsapi = urlparse(device["webfsapi"])
+    radio = DiscoveredRadio(
+        host, fsapi.port or port, device.get("friendlyName"), device.get("version"), device.get("radioId")
+    )
+    _LOGGER.debug("Discovered %s", radio)
+    return radio
+
+
+async def async_scan_network(
+    session: aiohttp.ClientSession,
+    network: str,
+    port: int = DEFAULT_PORT,
+    *,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[DiscoveredRadio]:
+    """Probe every host address in network (CIDR notation) for radios.
+
+    Raises ValueError for an invalid network or one larger than DISCOVERY_MAX_HOSTS.
+    """
+    net = ipaddress.ip_network(network, strict=False)
+    if net.num_addresses > DISCOVERY_MAX_HOSTS + 2:
+        raise ValueError(f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _probe(address: str) -> Optional[DiscoveredRadio]:
+        async with semaphore:
+            return await async_probe_host(session, address, port, timeout=timeout)
+
+    hosts = [str(address) for address in net.hosts()]
+    _LOGGER.info("Scanning %d addresses in %s for radios", len(hosts), net)
+    results = await asyncio.gather(*(_probe(host) for host in hosts))
+    radios = [radio for radio in results if radio is not None]
+    _LOGGER.info("Found %d radio(s) in %s", len(radios), net)
+    return radios
+
+
+async def async_validate_pins(
+    session: aiohttp.ClientSession, radios: list[DiscoveredRadio], pin: str
+) -> None:
+    """Check pin against every radio in parallel; sets each radio's pin_valid."""
+
+    async def _validate(radio: DiscoveredRadio) -> None:
+        api = FrontierSiliconAPI(host=radio.host, port=radio.port, pin=pin, session=session)
+        try:
+            radio.pin_valid = await api.create_session(context="discovery_pin_check") is not None
+        finally:
+            await api.close()
+
+    await asyncio.gather(*(_validate(radio) for radio in radios))
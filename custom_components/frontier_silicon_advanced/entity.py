@@ -0,0 +1,29 @@
+"""Base entity for My Frontier Silicon."""
+from __future__ import annotations
+
+from typing import Optional
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import FrontierSiliconCoordinator
+from .snapshot import field_mask
+
+
+class FrontierSiliconEntity(CoordinatorEntity[FrontierSiliconCoordinator]):
+    """Coordinator entity that only writes its state when a field it shows changed.
+
+    Subclasses list the coordinator data fields they read in _watched_fields
+    (FIELD_CATALOG for the mode and preset lists). None means the entity
+    writes on every update, like a plain CoordinatorEntity.
+    """
+
+    _watched_fields: Optional[frozenset[str]] = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the coordinator reports that none of our fields changed."""
+        changed = self.coordinator.changed_mask
+        if changed is not None and self._watched_fields is not None and not changed & field_mask(self._watched_fields):
+            return
+        super()._handle_coordinator_update()
@@ -0,0 +1,115 @@
+"""Domain-wide poll staggering and request limiting for many radios.
+
+One FleetScheduler lives in hass.data[DOMAIN] and is shared by every
+coordinator. Each radio gets a fixed phase from the golden-ratio sequence,
+which spreads any number of radios evenly over the poll interval without
+knowing the count in advance, and its polls are aligned to that phase. A
+global semaphore caps the device requests in flight across all radios.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+
+class _CycleStats:
+    """Deadline statistics of one radio's poll cycles."""
+
+    __slots__ = ("cycles", "late", "overruns", "lateness_total", "lateness_max", "expected_at", "interval")
+
+    def __init__(self) -> None:
+        self.cycles = 0
+        self.late = 0  # cycles that started more than the tolerance after their slot
+        self.overruns = 0  # cycles that took longer than their interval
+        self.lateness_total = 0.0
+        self.lateness_max = 0.0
+        self.expected_at: Optional[float] = None
+        self.interval = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "cycles": self.cycles,
+            "late": self.late,
+            "overruns": self.overruns,
+            "lateness_mean": round(self.lateness_total / self.cycles, 3) if self.cycles else 0.0,
+            "lateness_max": round(self.lateness_max, 3),
+        }
+
+
+class FleetScheduler:
+    """Stagger poll phases across radios and cap concurrent device requests."""
+
+    def __init__(self, *, max_concurrent_requests: int, late_tolerance: float) -> None:
+        """Initialize the scheduler for the whole integration."""
+        self.request_limiter = asyncio.Semaphore(max_concurrent_requests)
+        self._late_tolerance = late_tolerance
+        self._epoch = time.monotonic()
+        self._slots: dict[str, int] = {}
+        self._stats: dict[str, _CycleStats] = {}
+
+    def register(self, radio_id: str) -> float:
+        """Add a radio and return its phase (0..1); freed slots are reused."""
+        if radio_id not in self._slots:
+            used = set(self._slots.values())
+            self._slots[radio_id] = next(index for index in range(len(used) + 1) if index not in used)
+            self._stats[radio_id] = _CycleStats()
+        return self.phase(radio_id)
+
+    def unregister(self, radio_id: str) -> None:
+        """Remove a radio when its config entry unloads."""
+        self._slots.pop(radio_id, None)
+        self._stats.pop(radio_id, None)
+
+    def phase(self, radio_id: str) -> float:
+        """Return the radio's fraction of the interval its polls are aligned to."""
+        return (self._slots.get(radio_id, 0) * _GOLDEN_RATIO_CONJUGATE) % 1.0
+
+    def next_delay(self, radio_id: str, interval: float) -> float:
+        """Return seconds until the radio's next aligned slot, between 0.5 and 1.5 intervals away.
+
+        Slots sit at epoch + (k + phase) * interval, so radios sharing an
+        interval never poll together however they were started.
+        """
+        now = time.monotonic()
+        offset = self.phase(radio_id) * interval
+        earliest = now - self._epoch + interval / 2
+        slot = ((earliest - offset) // interval + 1) * interval + offset
+        delay = slot - (now - self._epoch)
+        stats = self._stats.get(radio_id)
+        if stats is not None:
+            stats.expected_at = now + delay
+            stats.interval = interval
+        return delay
+
+    def cycle_started(self, radio_id: str) -> float:
+        """Record a poll starting; returns how late it is against its slot (seconds)."""
+        now = time.monotonic()
+        stats = self._stats.get(radio_id)
+        if stats is None or stats.expected_at is None:
+            return 0.0
+        lateness = max(0.0, now - stats.expected_at)
+        stats.expected_at = None
+        stats.cycles += 1
+        stats.lateness_total += lateness
+        stats.lateness_max = max(stats.lateness_max, lateness)
+        if lateness > self._late_tolerance:
+            stats.late += 1
+            _LOGGER.debug("Poll for %s started %.2fs after its slot", radio_id, lateness)
+        return lateness
+
+    def cycle_finished(self, radio_id: str, duration: float) -> None:
+        """Record how long a poll took against its interval."""
+        stats = self._stats.get(radio_id)
+        if stats is not None and stats.interval and duration > stats.interval:
+            stats.overruns += 1
+            _LOGGER.debug("Poll for %s took %.2fs, longer than its %.0fs interval", radio_id, duration, stats.interval)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-radio phase and deadline statistics."""
+        return {radio_id: {"phase": round(self.phase(radio_id), 3), **stats.as_dict()} for radio_id, stats in self._stats.items()}
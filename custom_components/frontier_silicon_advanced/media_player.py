@@ -3,24 +3,35 @@ import logging
 from typing import Any
 
 from homeassistant.components.media_player import (
+    BrowseMedia,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
+from homeassistant.components.media_player.errors import BrowseError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .browse_media import async_browse_nav, parse_nav_item_id
 from .const import (
     DOMAIN,
+    FIELD_CATALOG,
+    NAV_CACHE_MAX_PAGES,
+    NAV_CACHE_TTL,
+    NAV_PAGE_SIZE,
+    NAV_READY_TIMEOUT,
     PLAY_STATUS_PLAYING,
     PLAY_STATUS_PAUSED,
     PLAY_STATUS_STOPPED,
     PLAY_STATUS_BUFFERING,
 )
-from .coordinator import FrontierSiliconCoordinator
+from .coordinator import FrontierSiliconCoordinator, async_get_artwork_cache
+from .entity import FrontierSiliconEntity
+from .navigator import NavNavigator
+from .snapshot import FIELD_BITS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,11 +46,16 @@ async def async_setup_entry(
     async_add_entities([FrontierSiliconMediaPlayer(coordinator, entry)])
 
 
-class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class FrontierSiliconMediaPlayer(FrontierSiliconEntity, MediaPlayerEntity):
     """Representation of a Frontier Silicon device."""
 
     _attr_has_entity_name = True
     _attr_name = None
+    _watched_fields = frozenset({
+        "available", "power", "play_status", "volume", "volume_steps", "mute",
+        "station_name", "artist", "station_text", "album", "graphic_uri", "mode",
+        FIELD_CATALOG,
+    })
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -57,6 +73,13 @@ class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             manufacturer="Frontier Silicon",
             model="Internet Radio",
         )
+        self._navigator = NavNavigator(
+            coordinator.api,
+            page_size=NAV_PAGE_SIZE,
+            cache_ttl=NAV_CACHE_TTL,
+            max_pages=NAV_CACHE_MAX_PAGES,
+            ready_timeout=NAV_READY_TIMEOUT,
+        )
 
         # Supported features
         self._attr_supported_features = (
@@ -66,6 +89,8 @@ class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             | MediaPlayerEntityFeature.TURN_ON
             | MediaPlayerEntityFeature.TURN_OFF
             | MediaPlayerEntityFeature.SELECT_SOURCE
+            | MediaPlayerEntityFeature.BROWSE_MEDIA
+            | MediaPlayerEntityFeature.PLAY_MEDIA
             | MediaPlayerEntityFeature.PLAY
             | MediaPlayerEntityFeature.PAUSE
             | MediaPlayerEntityFeature.STOP
@@ -76,7 +101,7 @@ class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data.get("available", False)
+        return super().available and self.coordinator.data.get("available", False)
 
     @property
     def state(self) -> MediaPlayerState:
@@ -136,31 +161,28 @@ class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Image url of current playing media."""
         return self.coordinator.data.get("graphic_uri")
 
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Serve the artwork through Home Assistant from the shared art cache."""
+        url = self.media_image_url
+        if not url:
+            return None, None
+        image = await async_get_artwork_cache(self.hass).async_get(url)
+        if image is None:
+            return None, None
+        return image
+
     @property
     def source(self) -> str | None:
         """Name of the current input source."""
         mode_id = self.coordinator.data.get("mode")
         if mode_id is None:
             return None
-        
-        # Get mode name from cached modes
-        if hasattr(self.coordinator, "_modes"):
-            for mode in self.coordinator._modes:
-                if mode.get("key") == mode_id:
-                    return mode.get("label") or mode.get("name")
-        
-        return f"Mode {mode_id}"
+        return self.coordinator.catalog.mode_label(mode_id)
 
     @property
     def source_list(self) -> list[str] | None:
         """List of available input sources."""
-        if not hasattr(self.coordinator, "_modes"):
-            return None
-        
-        return [
-            mode.get("label") or mode.get("name") or f"Mode {mode.get('key')}"
-            for mode in self.coordinator._modes
-        ]
+        return self.coordinator.catalog.source_list
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -181,111 +203,111 @@ class FrontierSiliconMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Turn the media player on."""
         await self.coordinator.api.power_on()
         
-        # If device info and presets weren't loaded at startup (radio was off), load them now
-        if not self.coordinator._device_info:
-            _LOGGER.info("Loading device info after first power-on")
-            try:
-                firmware_version, _ = await self.coordinator.api.get_value("netRemote.sys.info.version")
-                device_model, _ = await self.coordinator.api.get_value("netRemote.sys.info.friendlyName")
-                self.coordinator._device_info = {
-                    "firmware_version": firmware_version,
-                    "device_model": device_model,
-                }
-                _LOGGER.info("Device: %s, Firmware: %s", device_model, firmware_version)
-            except Exception as err:
-                _LOGGER.warning("Error loading device info on power-on: %s", err)
-        
-        if not self.coordinator._all_presets:
-            _LOGGER.info("Loading presets after first power-on")
-            try:
-                # Load modes
-                self.coordinator._modes = await self.coordinator.api.get_modes()
-                
-                # Load presets for all modes
-                import asyncio
-                for mode in ["0", "3", "4"]:  # Internet Radio, DAB+, FM
-                    mode_presets = await self.coordinator._load_presets_for_mode(mode)
-                    if mode_presets:
-                        self.coordinator._all_presets[mode] = mode_presets
-                        _LOGGER.info("Loaded %d presets for mode %s", len(mode_presets), mode)
-            except Exception as err:
-                _LOGGER.warning("Error loading presets on power-on: %s", err)
-        
-        await self.coordinator.async_request_refresh()
+        # Modes and presets missing from the cache are loaded on first power-on
+        await self.coordinator.async_load_missing_catalogs()
+
+        await self.coordinator.async_refresh_after_command()
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
         await self.coordinator.api.power_off()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         volume_steps = self.coordinator.data.get("volume_steps", 32)
         target_volume = int(volume * volume_steps)
         
-        await self.coordinator.api.set_volume(target_volume)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_volume(target_volume)
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
-        current_volume = self.coordinator.data.get("volume", 0)
         volume_steps = self.coordinator.data.get("volume_steps", 32)
         
-        if current_volume < volume_steps:
-            await self.coordinator.api.set_volume(current_volume + 1)
-            await self.coordinator.async_request_refresh()
+        # Step from the pending target so held keys don't repeat the same level
+        if self.coordinator.volume_target < volume_steps:
+            await self.coordinator.async_step_volume(1)
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
-        current_volume = self.coordinator.data.get("volume", 0)
-        
-        if current_volume > 0:
-            await self.coordinator.api.set_volume(current_volume - 1)
-            await self.coordinator.async_request_refresh()
+        if self.coordinator.volume_target > 0:
+            await self.coordinator.async_step_volume(-1)
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute (true) or unmute (false) media player."""
         if mute:
-            await self.coordinator.api.mute()
+            success = await self.coordinator.api.mute()
         else:
-            await self.coordinator.api.unmute()
-        await self.coordinator.async_request_refresh()
+            success = await self.coordinator.api.unmute()
+        await self.coordinator.async_command_done(success, {"mute": mute})
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        # Find mode ID from name
-        if hasattr(self.coordinator, "_modes"):
-            for mode in self.coordinator._modes:
-                mode_name = mode.get("label") or mode.get("name")
-                if mode_name == source:
-                    mode_id = mode.get("key")
-                    await self.coordinator.api.set_mode(mode_id)
-                    await self.coordinator.async_request_refresh()
-                    return
-        
-        _LOGGER.error("Source %s not found", source)
+        mode_id = self.coordinator.catalog.mode_keys.get(source)
+        if mode_id is None:
+            _LOGGER.error("Source %s not found", source)
+            return
+        success = await self.coordinator.api.set_mode(mode_id)
+        await self.coordinator.async_command_done(success, {"mode": mode_id})
 
     async def async_media_play(self) -> None:
         """Send play command."""
-        await self.coordinator.api.play()
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.play()
+        await self.coordinator.async_command_done(success, {"play_status": PLAY_STATUS_PLAYING})
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        await self.coordinator.api.pause()
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.pause()
+        await self.coordinator.async_command_done(success, {"play_status": PLAY_STATUS_PAUSED})
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        await self.coordinator.api.stop()
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.stop()
+        await self.coordinator.async_command_done(success, {"play_status": PLAY_STATUS_STOPPED})
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
         await self.coordinator.api.next_track()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command()
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         await self.coordinator.api.previous_track()
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_after_command()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop cached browse pages when the radio's mode changed; they list the old mode's menu."""
+        changed = self.coordinator.changed_mask
+        if changed is None or changed & FIELD_BITS["mode"]:
+            self._navigator.clear()
+        super()._handle_coordinator_update()
+
+    async def async_browse_media(
+        self,
+        media_content_type: str | None = None,
+        media_content_id: str | None = None,
+    ) -> BrowseMedia:
+        """Browse the radio's station directory for its current mode, one page at a time."""
+        if not self.coordinator.data.get("power"):
+            raise BrowseError("Turn the radio on to browse its stations")
+        return await async_browse_nav(
+            self._navigator,
+            self.coordinator.catalog,
+            self.coordinator.data.get("mode"),
+            media_content_id,
+        )
+
+    async def async_play_media(self, media_type: str, media_id: str, **kwargs: Any) -> None:
+        """Play an item picked in the media browser."""
+        item = parse_nav_item_id(media_id)
+        if item is None:
+            raise HomeAssistantError(f"Unsupported media id: {media_id}")
+        mode, path, key = item
+        try:
+            success = await self._navigator.async_play(mode, path, key)
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+        if not success:
+            _LOGGER.warning("Radio did not accept playing %s", media_id)
+        await self.coordinator.async_refresh_after_command()
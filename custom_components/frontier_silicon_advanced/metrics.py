@@ -0,0 +1,181 @@
+"""Per-device request metrics for FSAPI radios.
+
+Counts and latency histograms are kept per endpoint (GET, SET, GET_MULTIPLE,
+CREATE_SESSION...) and per request context, together with counters for
+outcome statuses, timeouts, nodes read or written and session creations (each
+of which may wake the radio). GET_NOTIFIES long-polls wait for up to their
+whole window by design, so they get histograms of their own and their
+timeouts are not counted as timeouts; the overall latency and timeout
+figures describe ordinary requests only. Everything is plain counters, so
+recording costs a few dict updates; the numbers back the diagnostics
+download and the diagnostic sensors.
+"""
+from __future__ import annotations
+
+import bisect
+import time
+from typing import Any, Iterable, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+STATUS_TIMEOUT = "TIMEOUT"
+STATUS_CONNECTION_ERROR = "CONNECTION_ERROR"
+STATUS_CIRCUIT_OPEN = "CIRCUIT_OPEN"  # not sent: the device is considered unreachable
+
+
+class LatencyHistogram:
+    """Bucketed request latencies with count, sum and max."""
+
+    __slots__ = ("buckets", "count", "total", "maximum")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the given fraction of requests."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.maximum
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": round(self.maximum, 4),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class _KeyStats:
+    """Latency and outcome counts of one endpoint or context."""
+
+    __slots__ = ("latency", "statuses")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.statuses: dict[str, int] = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self.latency.as_dict(), "statuses": dict(self.statuses)}
+
+
+def context_key(context: str) -> str:
+    """Strip per-call detail from a context: "set_volume:12" -> "set_volume".
+
+    CREATE_SESSION contexts name their caller ("CREATE_SESSION:poll"), which
+    is kept because it tells what woke the radio.
+    """
+    parts = context.split(":")
+    if parts[0] == "CREATE_SESSION" and len(parts) > 1:
+        return f"{parts[0]}:{parts[1]}"
+    return parts[0]
+
+
+class RequestMetrics:
+    """Request counters and latency histograms of one radio."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.started_at = time.time()
+        self._endpoints: dict[str, _KeyStats] = {}
+        self._long_polls: dict[str, _KeyStats] = {}  # endpoint -> stats of its long-polls
+        self._contexts: dict[str, _KeyStats] = {}
+        self._nodes: dict[str, int] = {}
+        self._session_creations: dict[str, int] = {}
+        self.requests = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.short_circuited = 0  # requests skipped while the circuit was open
+
+    def record(
+        self,
+        endpoint: str,
+        context: str,
+        seconds: float,
+        status: str,
+        nodes: Iterable[str] = (),
+        *,
+        long_poll: bool = False,
+    ) -> None:
+        """Record one finished request; status is the FSAPI status or a transport outcome."""
+        self.requests += 1
+        if status == STATUS_TIMEOUT:
+            if not long_poll:  # a long-poll timing out just means nothing changed
+                self.timeouts += 1
+        elif status == STATUS_CONNECTION_ERROR:
+            self.errors += 1
+        endpoints = self._long_polls if long_poll else self._endpoints
+        for stats in (
+            endpoints.setdefault(endpoint, _KeyStats()),
+            self._contexts.setdefault(context_key(context), _KeyStats()),
+        ):
+            stats.latency.observe(seconds)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        for node in nodes:
+            self._nodes[node] = self._nodes.get(node, 0) + 1
+
+    def record_short_circuit(self) -> None:
+        """Count a request that was not sent because the circuit was open."""
+        self.short_circuited += 1
+
+    def record_session_creation(self, context: str) -> None:
+        """Count a CREATE_SESSION by the context that triggered it."""
+        key = context_key(context)
+        self._session_creations[key] = self._session_creations.get(key, 0) + 1
+
+    @property
+    def session_creations(self) -> int:
+        """Return the number of sessions created (radio wake-ups, potentially)."""
+        return sum(self._session_creations.values())
+
+    def latency(self) -> LatencyHistogram:
+        """Return the latency histogram of all requests except long-polls."""
+        merged = LatencyHistogram()
+        for stats in self._endpoints.values():
+            merged.merge(stats.latency)
+        return merged
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as plain data for diagnostics."""
+        uptime = max(time.time() - self.started_at, 1.0)
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "requests": self.requests,
+            "requests_per_minute": round(self.requests * 60 / uptime, 2),
+            "timeouts": self.timeouts,
+            "connection_errors": self.errors,
+            "short_circuited": self.short_circuited,
+            "session_creations": self.session_creations,
+            "session_creations_by_context": dict(self._session_creations),
+            "latency": self.latency().as_dict(),
+            "endpoints": {key: stats.as_dict() for key, stats in sorted(self._endpoints.items())},
+            "long_polls": {key: stats.as_dict() for key, stats in sorted(self._long_polls.items())},
+            "contexts": {key: stats.as_dict() for key, stats in sorted(self._contexts.items())},
+            "nodes": dict(sorted(self._nodes.items(), key=lambda item: -item[1])),
+        }
@@ -0,0 +1,169 @@
+"""Paged, cached access to a radio's navigation tree (netRemote.nav.list).
+
+The radio's menu is stateful: LIST_GET_NEXT lists whichever directory the
+device is in, and moving around takes one SET per level. NavNavigator reads
+one page of one directory at a time and caches it for a short while, so
+going back and forth in the media browser costs nothing after the first
+visit. Pages are keyed by mode: before an uncached page is read, the radio's
+mode is checked (the menu lists whatever mode is active), then navigation is
+reset to the root and replayed down the requested path.
+
+Only the next page of the directory just listed, in the same mode and
+within the cache lifetime, is read without replaying the path, and only if
+nothing wrote a menu node since: the API counts those writes
+(nav_generation), so preset reads and preset selection invalidate the
+position. Someone using the radio's own menu in that window cannot be seen;
+playing an item therefore always replays the path first, so a wrong
+directory can cost a wrong listing but never a wrong station.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import logging
+import time
+from typing import Any, Optional
+
+from .api import FrontierSiliconAPI
+from .const import (
+    ENDPOINT_MODE,
+    ENDPOINT_NAV_LIST,
+    ENDPOINT_NAV_NAVIGATE,
+    ENDPOINT_NAV_SELECT_ITEM,
+    ENDPOINT_NAV_STATE,
+    ENDPOINT_NAV_STATUS,
+    PRIORITY_INTERACTIVE,
+)
+from .request_scheduler import request_priority
+
+_LOGGER = logging.getLogger(__name__)
+
+NAV_STATUS_READY = "1"
+
+
+class NavPage:
+    """One page of a directory listing."""
+
+    __slots__ = ("items", "more", "expires_at")
+
+    def __init__(self, items: list[dict[str, Any]], more: bool, expires_at: float) -> None:
+        self.items = items
+        self.more = more  # a full page came back, so there may be more items after it
+        self.expires_at = expires_at
+
+
+class NavNavigator:
+    """Browse and play from one radio's nav.list, one cached page at a time."""
+
+    def __init__(
+        self,
+        api: FrontierSiliconAPI,
+        *,
+        page_size: int,
+        cache_ttl: float,
+        max_pages: int,
+        ready_timeout: float,
+    ) -> None:
+        """Initialize with an empty page cache."""
+        self._api = api
+        self._page_size = page_size
+        self._cache_ttl = cache_ttl
+        self._max_pages = max_pages
+        self._ready_timeout = ready_timeout
+        self._pages: OrderedDict[tuple[str, tuple[str, ...], int], NavPage] = OrderedDict()
+        self._titles: dict[tuple[str, tuple[str, ...]], str] = {}
+        self._lock = asyncio.Lock()  # the device has one navigation position
+        # (mode, path, monotonic time, API nav_generation) navigation was left at
+        self._position: Optional[tuple[str, tuple[str, ...], float, int]] = None
+
+    def title(self, mode: str, path: tuple[str, ...]) -> Optional[str]:
+        """Return the name of the directory at path, if it was seen in a listing."""
+        return self._titles.get((mode, path))
+
+    async def async_get_page(self, mode: str, path: tuple[str, ...], start: int = -1) -> NavPage:
+        """Return the page of the directory at path that follows item key start."""
+        cache_key = (mode, path, start)
+        page = self._pages.get(cache_key)
+        if page is not None and page.expires_at > time.monotonic():
+            self._pages.move_to_end(cache_key)
+            return page
+
+        async with self._lock:
+            with request_priority(PRIORITY_INTERACTIVE):
+                current_mode, _ = await self._api.get_value(ENDPOINT_MODE, context="browse:mode")
+                if current_mode != mode:
+                    # Listing now would return the other mode's menu under this mode's id
+                    self.clear()
+                    raise ValueError(f"The radio switched to another mode ({current_mode}); browse again")
+                await self._async_navigate(mode, path)
+                items = await self._api.list_get_next(
+                    ENDPOINT_NAV_LIST,
+                    self._page_size,
+                    start=start,
+                    context=f"browse:{'/'.join(path) or 'root'}",
+                    typed=True,
+                )
+
+        page = NavPage(items, len(items) >= self._page_size, time.monotonic() + self._cache_ttl)
+        self._pages[cache_key] = page
+        while len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+        for item in items:
+            if item.get("name"):
+                self._titles[(mode, path + (item["key"],))] = item["name"]
+        return page
+
+    async def async_play(self, mode: str, path: tuple[str, ...], key: str) -> bool:
+        """Play the item keyed key in the directory at path, switching to mode first if needed."""
+        async with self._lock:
+            with request_priority(PRIORITY_INTERACTIVE):
+                current_mode, _ = await self._api.get_value(ENDPOINT_MODE, context="browse_play:mode")
+                if current_mode != mode:
+                    _LOGGER.info("Switching to mode %s to play a browsed item", mode)
+                    self.clear()
+                    if not await self._api.set_mode(mode):
+                        return False
+                # Never trust the remembered position here: selecting in the wrong directory plays the wrong item
+                self._position = None
+                await self._async_navigate(mode, path)
+                status = await self._api.set_value(ENDPOINT_NAV_SELECT_ITEM, key, context=f"browse_play:{key}")
+        return status == "FS_OK"
+
+    def clear(self) -> None:
+        """Forget every cached page and the navigation position (e.g. after the radio's mode changed)."""
+        self._pages.clear()
+        self._titles.clear()
+        self._position = None
+
+    async def _async_navigate(self, mode: str, path: tuple[str, ...]) -> None:
+        """Reset navigation to the root directory, then enter each directory of path."""
+        if self._position is not None:
+            position_mode, position, at, generation = self._position
+            if (
+                position_mode == mode
+                and position == path
+                and generation == self._api.nav_generation
+                and time.monotonic() - at < self._cache_ttl
+            ):
+                return
+        self._position = None
+        generation = self._api.nav_generation + 2 + len(path)  # after the writes below, if no one else writes
+        await self._api.set_value(ENDPOINT_NAV_STATE, "0", context="browse:nav_off")
+        await self._api.set_value(ENDPOINT_NAV_STATE, "1", context="browse:nav_on")
+        await self._async_wait_ready()
+        for key in path:
+            status = await self._api.set_value(ENDPOINT_NAV_NAVIGATE, key, context=f"browse:navigate:{key}")
+            if status != "FS_OK":
+                raise ValueError(f"Could not open directory {key} (status {status})")
+            await self._async_wait_ready()
+        if self._api.nav_generation == generation:
+            self._position = (mode, path, time.monotonic(), generation)
+
+    async def _async_wait_ready(self) -> None:
+        """Wait until the radio has loaded the directory (nav.status ready), if it reports one."""
+        deadline = time.monotonic() + self._ready_timeout
+        while True:
+            status, _ = await self._api.get_value(ENDPOINT_NAV_STATUS, context="browse:nav_status")
+            if status is None or status == NAV_STATUS_READY or time.monotonic() > deadline:
+                return
+            await asyncio.sleep(0.1)
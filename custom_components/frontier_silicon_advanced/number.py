@@ -6,10 +6,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FrontierSiliconCoordinator
+from .entity import FrontierSiliconEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ async def async_setup_entry(
     ])
 
 
-class FrontierSiliconSleepTimer(CoordinatorEntity, NumberEntity):
+class FrontierSiliconSleepTimer(FrontierSiliconEntity, NumberEntity):
     """Number entity for sleep timer."""
 
     _attr_has_entity_name = True
@@ -37,6 +37,7 @@ class FrontierSiliconSleepTimer(CoordinatorEntity, NumberEntity):
     _attr_native_step = 5
     _attr_native_unit_of_measurement = "min"
     _attr_mode = NumberMode.SLIDER
+    _watched_fields = frozenset({"sleep_timer"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -51,16 +52,9 @@ class FrontierSiliconSleepTimer(CoordinatorEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current sleep timer value in minutes."""
-        sleep_value = self.coordinator.data.get("sleep_timer")
-        if sleep_value is not None:
-            try:
-                # API returns seconds, convert to minutes for display
-                seconds = int(sleep_value)
-                minutes = round(seconds / 60.0)
-                return float(minutes)
-            except (ValueError, TypeError):
-                pass
-        return 0
+        # API returns seconds, convert to minutes for display
+        seconds = self.coordinator.data.get("sleep_timer") or 0
+        return float(round(seconds / 60.0))
 
     @property
     def icon(self) -> str:
@@ -78,8 +72,5 @@ class FrontierSiliconSleepTimer(CoordinatorEntity, NumberEntity):
         
         _LOGGER.info("Setting sleep timer to: %d minutes (%d seconds)", minutes, seconds)
         
-        # Set sleep timer (value in seconds)
-        await self.coordinator.api.set_value("netRemote.sys.sleep", str(seconds))
-        
-        # Refresh coordinator immediately
-        await self.coordinator.async_request_refresh()
+        # Set sleep timer (value in seconds); slider drags collapse into the last value
+        await self.coordinator.async_set_sleep_timer(seconds)
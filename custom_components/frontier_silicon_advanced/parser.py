@@ -0,0 +1,172 @@
+"""Fast bytes-level parser for FSAPI XML responses.
+
+FSAPI replies are small, flat and machine-generated, so they are scanned
+directly on the response bytes with precompiled patterns instead of
+building an ElementTree. Values come back typed: integers for the
+u8/u16/u32/s8/s16/s32/e8 types and strings for c8_array. Empty elements
+are returned as None, matching the ElementTree-based parser this replaces.
+Each body is decoded once and scanned in a single regex pass.
+
+This module has no dependencies outside the standard library so it can be
+benchmarked on its own (see benchmarks/bench_parser.py).
+"""
+from html import unescape
+import re
+from typing import Any, Iterator, Optional
+
+STATUS_PARSE_ERROR = "XML_PARSE_ERROR"
+STATUS_UNKNOWN = "UNKNOWN"
+
+# Scalars: <value><u8>1</u8></value>; group 1 is set for c8_array (text), otherwise the
+# type is numeric. Empty values (<c8_array></c8_array> or <c8_array/>) match with no text.
+_TYPE = r"<(?:(c8_array)|[us](?:8|16|32)|e8)(?:\s*/>|>([^<]*)<)"
+_ROOT_RE = re.compile(rb"<fsapi(?:GetMultiple)?Response\b")
+_STATUS_RE = re.compile(r"<status>\s*([^<]*?)\s*</status>")
+_SESSION_ID_RE = re.compile(r"<sessionId>\s*([^<]*?)\s*</sessionId>")
+_VALUE_RE = re.compile(r"<value>\s*" + _TYPE)
+# One pass over a list body: item starts and item fields, in document order
+_LIST_TOKEN_RE = re.compile(r"<item(?:\s+key=\"([^\"]*)\")?\s*>|<field\s+name=\"([^\"]*)\"\s*>\s*" + _TYPE)
+_MULTIPLE_RE = re.compile(r"<fsapiResponse>(.*?)</fsapiResponse>", re.S)
+_NODE_RE = re.compile(r"<node>\s*([^<]*?)\s*</node>")
+_NOTIFY_RE = re.compile(r"<notify\s+node=\"([^\"]*)\"\s*>(.*?)</notify>", re.S)
+_LISTEND_RE = re.compile(rb"<listend\s*/>")
+_DEVICE_ROOT_RE = re.compile(rb"<netRemote\b")
+_DEVICE_FIELD_RE = re.compile(r"<(friendlyName|version|webfsapi|radioId)>\s*([^<]*?)\s*</\1>")
+
+
+def _decode(body: bytes) -> str:
+    """Decode a response body once; all scanning happens on the decoded text."""
+    return body.decode("utf-8", "replace")
+
+
+def _unescape(text: str) -> str:
+    """Resolve XML entities; the cheap replace chain covers everything but numeric refs."""
+    if "&#" in text:
+        return unescape(text)
+    return (
+        text.replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+        .replace("&apos;", "'")
+        .replace("&amp;", "&")
+    )
+
+
+def _typed(is_text: Optional[str], raw: Optional[str]) -> Any:
+    """Convert raw element text to its FSAPI type; None for empty values."""
+    if not raw:
+        return None
+    if is_text:
+        return _unescape(raw) if "&" in raw else raw
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def is_fsapi(body: bytes) -> bool:
+    """Return True if the body looks like an FSAPI XML response."""
+    return _ROOT_RE.search(body) is not None
+
+
+def parse_status(body: Optional[bytes]) -> str:
+    """Return the top-level <status> of a response."""
+    if not body or not is_fsapi(body):
+        return STATUS_PARSE_ERROR
+    match = _STATUS_RE.search(_decode(body))
+    if match is None or not match.group(1):
+        return STATUS_UNKNOWN
+    return match.group(1)
+
+
+def parse_session_id(body: bytes) -> Optional[str]:
+    """Return the sessionId of a CREATE_SESSION response."""
+    match = _SESSION_ID_RE.search(_decode(body))
+    if match is None or not match.group(1):
+        return None
+    return match.group(1)
+
+
+def _value(text: str) -> Any:
+    """Return the typed scalar inside the first <value> element of decoded text."""
+    match = _VALUE_RE.search(text)
+    if match is None:
+        return None
+    return _typed(match.group(1), match.group(2))
+
+
+def parse_value(body: bytes) -> Any:
+    """Return the typed scalar inside the first <value> element."""
+    return _value(_decode(body))
+
+
+def parse_multiple(body: bytes) -> dict[str, tuple[Any, str]]:
+    """Parse a GET_MULTIPLE response into {node: (value, status)}."""
+    results = {}
+    for match in _MULTIPLE_RE.finditer(_decode(body)):
+        chunk = match.group(1)
+        node = _NODE_RE.search(chunk)
+        if node is None or not node.group(1):
+            continue
+        status = _STATUS_RE.search(chunk)
+        results[node.group(1)] = (_value(chunk), status.group(1) if status else STATUS_UNKNOWN)
+    return results
+
+
+def parse_notifies(body: bytes) -> dict[str, Any]:
+    """Parse a GET_NOTIFIES response into {lower-case node: value}."""
+    return {match.group(1).lower(): _value(match.group(2)) for match in _NOTIFY_RE.finditer(_decode(body))}
+
+
+def iter_list_items(body: bytes) -> Iterator[dict[str, Any]]:
+    """Yield LIST_GET_NEXT items one at a time as {"key": ..., field: value}.
+
+    The item key is always a string; fields with empty values are omitted.
+    """
+    item: Optional[dict[str, Any]] = None
+    for match in _LIST_TOKEN_RE.finditer(_decode(body)):
+        key, name, is_text, raw = match.groups("")
+        if not name:
+            # A missing key is reported as ""; only keyed items carry "key"
+            if item is not None:
+                yield item
+            item = {"key": key} if key else {}
+            continue
+        if item is None or not raw:
+            continue
+        if is_text:
+            item[name] = _unescape(raw) if "&" in raw else raw
+        else:
+            try:
+                item[name] = int(raw)
+            except ValueError:
+                pass
+    if item is not None:
+        yield item
+
+
+def parse_list_end(body: bytes) -> bool:
+    """Return True if a LIST_GET_NEXT response reached the end of the list."""
+    return _LISTEND_RE.search(body) is not None
+
+
+def parse_device(body: bytes) -> Optional[dict[str, str]]:
+    """Parse the /device descriptor into {friendlyName, version, webfsapi, ...}.
+
+    Returns None unless the body is a descriptor that advertises an FSAPI URL.
+    """
+    if _DEVICE_ROOT_RE.search(body) is None:
+        return None
+    fields = {
+        name: _unescape(value) if "&" in value else value
+        for name, value in _DEVICE_FIELD_RE.findall(_decode(body))
+        if value
+    }
+    return fields if "webfsapi" in fields else None
+
+
+def as_text(value: Any) -> Optional[str]:
+    """Render a typed value the way FSAPI sent it (None stays None)."""
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
@@ -0,0 +1,133 @@
+"""Per-device request ordering for FSAPI radios.
+
+The radios' web servers handle one request at a time, so every request for a
+device goes through one RequestScheduler: a single slot handed out by
+priority (interactive commands, then state refreshes, then background catalog
+loads) with a minimum spacing between request starts. An interactive request
+preempts a background request in flight; the background request is cancelled
+and re-queued behind it, so commands never wait for a preset list download.
+
+The priority of a request comes from the caller's context (see
+request_priority), so tasks only need to declare it once.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Iterator, Optional, TypeVar
+
+from .const import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, PRIORITY_REFRESH
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_PRIORITY: ContextVar[int] = ContextVar("fsapi_request_priority", default=PRIORITY_REFRESH)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Run the requests made inside the block (and tasks started from it) at priority."""
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def current_priority() -> int:
+    """Return the request priority of the calling context."""
+    return _PRIORITY.get()
+
+
+class RequestScheduler:
+    """Hand out one device's request slot by priority, with rate limiting and preemption."""
+
+    def __init__(self, *, min_interval: float = 0.0) -> None:
+        """Initialize; min_interval is the minimum time in seconds between request starts."""
+        self._min_interval = min_interval
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._busy = False
+        self._last_start = 0.0
+        self._current: Optional[tuple[int, asyncio.Task]] = None
+        self._preempted: Optional[asyncio.Task] = None
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for the slot."""
+        return len(self._waiters)
+
+    async def run(self, factory: Callable[[], Awaitable[_T]], priority: Optional[int] = None) -> _T:
+        """Run factory() when the slot is free; background work is retried if preempted."""
+        if priority is None:
+            priority = current_priority()
+        while True:
+            await self._acquire(priority)
+            task = asyncio.ensure_future(factory())
+            self._current = (priority, task)
+            try:
+                return await task
+            except asyncio.CancelledError:
+                if task is not self._preempted or asyncio.current_task().cancelling():
+                    raise
+                _LOGGER.debug("FSAPI background request preempted by a command; re-queued")
+            finally:
+                if self._preempted is task:
+                    self._preempted = None
+                self._current = None
+                self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for the slot, then for the rate limit."""
+        if priority == PRIORITY_INTERACTIVE:
+            self._preempt_background()
+
+        if self._busy or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            entry = (priority, next(self._order), waiter)
+            heapq.heappush(self._waiters, entry)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was granted just as we were cancelled: pass it on
+                    self._release()
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+        else:
+            self._busy = True
+
+        delay = self._last_start + self._min_interval - time.monotonic()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release()
+                raise
+        self._last_start = time.monotonic()
+
+    def _release(self) -> None:
+        """Give the slot to the highest-priority waiter, or mark it free."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
+
+    def _preempt_background(self) -> None:
+        """Cancel a background request in flight so an interactive one can go next."""
+        if self._current is None or self._preempted is not None:
+            return
+        priority, task = self._current
+        if priority == PRIORITY_BACKGROUND and not task.done():
+            self._preempted = task
+            task.cancel()
@@ -0,0 +1,93 @@
+"""Activity-adaptive poll interval for Frontier Silicon radios."""
+from __future__ import annotations
+
+import time
+from typing import Any, Mapping, Optional
+
+from .const import (
+    ACTIVITY_FIELDS,
+    COMMAND_BURST_SECONDS,
+    PLAYING_MAX_BACKOFF,
+    POLL_BACKOFF_FACTOR,
+    PLAY_STATUS_PAUSED,
+    PLAY_STATUS_STOPPED,
+    STATIC_MODES,
+)
+
+
+class PollScheduler:
+    """Pick the next poll interval from what the radio has been doing.
+
+    - Right after a command: poll at the minimum interval for a short burst so
+      the result (new station, metadata) shows up quickly.
+    - On and changing (track, station text, volume...): normal ON interval.
+    - Playing but unchanged: back off gently, to at most PLAYING_MAX_BACKOFF
+      times the ON interval, so the next track is still picked up.
+    - Paused, stopped or in a static mode such as AUX: back off exponentially.
+    - Off: back off exponentially from the OFF interval.
+    - Push updates active: the push safety-net interval.
+
+    Every interval is clamped to [interval_min, interval_max].
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_min: float,
+        interval_max: float,
+        interval_on: float,
+        interval_off: float,
+        interval_push: float,
+    ) -> None:
+        """Initialize the scheduler with intervals in seconds."""
+        self.interval_min = interval_min
+        self.interval_max = max(interval_min, interval_max)
+        self.interval_on = interval_on
+        self.interval_off = interval_off
+        self.interval_push = interval_push
+        self._signature: Optional[tuple] = None
+        self._idle_cycles = 0
+        self._off_cycles = 0
+        self._burst_until = 0.0
+
+    def note_command(self) -> None:
+        """Poll quickly for a while after a user command."""
+        self._burst_until = time.monotonic() + COMMAND_BURST_SECONDS
+        self._idle_cycles = 0
+        self._off_cycles = 0
+
+    def reset(self) -> None:
+        """Forget activity history (e.g. after the radio became unreachable)."""
+        self._signature = None
+        self._idle_cycles = 0
+        self._off_cycles = 0
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.interval_max, max(self.interval_min, seconds))
+
+    def next_interval(self, data: Optional[Mapping[str, Any]], *, push_active: bool) -> float:
+        """Record the latest data and return seconds until the next poll."""
+        data = data or {}
+        radio_on = data.get("power") is True
+        signature = tuple(data.get(field) for field in ACTIVITY_FIELDS)
+        changed = signature != self._signature
+        self._signature = signature
+
+        idle = data.get("play_status") in (PLAY_STATUS_PAUSED, PLAY_STATUS_STOPPED) or data.get("mode") in STATIC_MODES
+        if radio_on:
+            self._off_cycles = 0
+            self._idle_cycles = 0 if changed else self._idle_cycles + 1
+        else:
+            self._idle_cycles = 0
+            self._off_cycles = 0 if changed else self._off_cycles + 1
+
+        if time.monotonic() < self._burst_until:
+            return self.interval_min
+        if radio_on and push_active:
+            return self._clamp(self.interval_push)
+        if radio_on:
+            interval = self.interval_on * POLL_BACKOFF_FACTOR ** self._idle_cycles
+            if not idle:
+                interval = min(interval, self.interval_on * PLAYING_MAX_BACKOFF)
+            return self._clamp(interval)
+        return self._clamp(self.interval_off * POLL_BACKOFF_FACTOR ** self._off_cycles)
@@ -5,27 +5,16 @@ import re
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, FIELD_CATALOG
 from .coordinator import FrontierSiliconCoordinator
+from .entity import FrontierSiliconEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Mode ID to name mapping
-MODE_NAMES = {
-    "0": "Radio",
-    "1": "Spotify",
-    "2": "Music",
-    "3": "DAB+",
-    "4": "FM",
-    "5": "Bluetooth",
-    "6": "AUX",
-}
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,11 +40,12 @@ async def async_setup_entry(
     ])
 
 
-class FrontierSiliconMultiModePresetSelect(CoordinatorEntity, SelectEntity):
+class FrontierSiliconMultiModePresetSelect(FrontierSiliconEntity, SelectEntity):
     """Select entity for choosing presets across all modes."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "preset"
+    _watched_fields = frozenset({"mode", "station_name", FIELD_CATALOG})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -66,47 +56,19 @@ class FrontierSiliconMultiModePresetSelect(CoordinatorEntity, SelectEntity):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
         )
-        self._preset_map: dict[str, tuple[str, str]] = {}  # {display_name: (mode_id, preset_key)}
-        self._update_preset_map()
-
-    @callback
-    def _update_preset_map(self) -> None:
-        """Update the preset mapping from all modes."""
-        self._preset_map = {}
-        
-        if hasattr(self.coordinator, "_all_presets"):
-            for mode_id, presets in self.coordinator._all_presets.items():
-                mode_name = MODE_NAMES.get(mode_id, f"Mode {mode_id}")
-                
-                for preset in presets:
-                    preset_key = preset.get("key", "")
-                    preset_name = preset.get("name", "").strip()
-                    
-                    # Only include named presets (exclude empty)
-                    if preset_name and preset_name.lower() not in ["unnamed", "", " "]:
-                        # Format: [Radio] 1LIVE
-                        display_name = f"[{mode_name}] {preset_name}"
-                        self._preset_map[display_name] = (mode_id, preset_key)
 
     @property
     def options(self) -> list[str]:
-        """Return list of available presets across all modes."""
-        self._update_preset_map()
-        return sorted(list(self._preset_map.keys()))
+        """Return list of available presets across all modes, e.g. "[Radio] 1LIVE"."""
+        return self.coordinator.catalog.preset_options
 
     @property
     def current_option(self) -> str | None:
         """Return the current preset."""
         current_mode = self.coordinator.data.get("mode")
         current_station = self.coordinator.data.get("station_name")
-        
         if current_mode and current_station:
-            mode_name = MODE_NAMES.get(current_mode, f"Mode {current_mode}")
-            # Try to find matching preset
-            for display_name, (mode_id, _) in self._preset_map.items():
-                if mode_id == current_mode and current_station in display_name:
-                    return display_name
-        
+            return self.coordinator.catalog.preset_for_station(current_mode, current_station)
         return None
 
     @property
@@ -117,11 +79,12 @@ class FrontierSiliconMultiModePresetSelect(CoordinatorEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Select a preset from any mode."""
         # Parse: "[Radio] 1LIVE" -> mode_id, preset_key
-        if option not in self._preset_map:
+        preset = self.coordinator.catalog.presets_by_option.get(option)
+        if preset is None:
             _LOGGER.error("Preset %s not found in map", option)
             return
         
-        mode_id, preset_key = self._preset_map[option]
+        mode_id, preset_key = preset
         
         _LOGGER.info("Selecting preset: %s (mode: %s, key: %s)", option, mode_id, preset_key)
         
@@ -137,19 +100,15 @@ class FrontierSiliconMultiModePresetSelect(CoordinatorEntity, SelectEntity):
         await self.coordinator.api.select_preset(preset_key)
         
         # Refresh
-        await self.coordinator.async_request_refresh()
-
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await super().async_update()
-        self._update_preset_map()
+        await self.coordinator.async_refresh_after_command()
 
 
-class FrontierSiliconModeSelect(CoordinatorEntity, SelectEntity):
+class FrontierSiliconModeSelect(FrontierSiliconEntity, SelectEntity):
     """Select entity for choosing input mode."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "mode"
+    _watched_fields = frozenset({"mode", FIELD_CATALOG})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -160,26 +119,11 @@ class FrontierSiliconModeSelect(CoordinatorEntity, SelectEntity):
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
         )
-        self._mode_map: dict[str, str] = {}
-        self._update_mode_map()
-
-    @callback
-    def _update_mode_map(self) -> None:
-        """Update the mode mapping."""
-        if hasattr(self.coordinator, "_modes"):
-            self._mode_map = {}
-            for mode in self.coordinator._modes:
-                key = mode.get("key", "")
-                name = mode.get("label") or mode.get("name", "")
-                
-                if name:
-                    self._mode_map[name] = key
 
     @property
     def options(self) -> list[str]:
         """Return list of available modes."""
-        self._update_mode_map()
-        return list(self._mode_map.keys())
+        return self.coordinator.catalog.source_list
 
     @property
     def current_option(self) -> str | None:
@@ -187,13 +131,7 @@ class FrontierSiliconModeSelect(CoordinatorEntity, SelectEntity):
         mode_id = self.coordinator.data.get("mode")
         if mode_id is None:
             return None
-        
-        # Find mode name from ID
-        for name, key in self._mode_map.items():
-            if key == mode_id:
-                return name
-        
-        return None
+        return self.coordinator.catalog.mode_labels.get(mode_id)
 
     @property
     def icon(self) -> str:
@@ -222,25 +160,21 @@ class FrontierSiliconModeSelect(CoordinatorEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Select a mode."""
-        mode_key = self._mode_map.get(option)
+        mode_key = self.coordinator.catalog.mode_keys.get(option)
         if mode_key is not None:
             _LOGGER.info("Switching to mode: %s (key: %s)", option, mode_key)
-            await self.coordinator.api.set_mode(mode_key)
-            await self.coordinator.async_request_refresh()
+            success = await self.coordinator.api.set_mode(mode_key)
+            await self.coordinator.async_command_done(success, {"mode": mode_key})
         else:
             _LOGGER.error("Mode %s not found", option)
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await super().async_update()
-        self._update_mode_map()
-
 
-class FrontierSiliconEQSelect(CoordinatorEntity, SelectEntity):
+class FrontierSiliconEQSelect(FrontierSiliconEntity, SelectEntity):
     """Select entity for choosing EQ preset."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "equalizer"
+    _watched_fields = frozenset({"eq_preset"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -270,10 +204,7 @@ class FrontierSiliconEQSelect(CoordinatorEntity, SelectEntity):
         """Return the current EQ preset."""
         eq_value = self.coordinator.data.get("eq_preset")
         if eq_value is not None:
-            try:
-                return f"EQ Preset {int(eq_value)}"
-            except (ValueError, TypeError):
-                pass
+            return f"EQ Preset {eq_value}"
         return None
 
     @property
@@ -288,7 +219,7 @@ class FrontierSiliconEQSelect(CoordinatorEntity, SelectEntity):
         if match:
             eq_number = match.group(1)
             _LOGGER.info("Setting EQ preset to: %s", eq_number)
-            await self.coordinator.api.set_value("netRemote.sys.audio.eqPreset", eq_number)
-            await self.coordinator.async_request_refresh()
+            status = await self.coordinator.api.set_value("netRemote.sys.audio.eqPreset", eq_number)
+            await self.coordinator.async_command_done(status == "FS_OK", {"eq_preset": int(eq_number)})
         else:
             _LOGGER.error("Could not parse EQ preset: %s", option)
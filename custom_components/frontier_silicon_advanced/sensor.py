@@ -1,18 +1,26 @@
 """Sensor platform for My Frontier Silicon."""
 import logging
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, FIELD_CATALOG
 from .coordinator import FrontierSiliconCoordinator
+from .entity import FrontierSiliconEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Request metric sensors: key -> (icon, unit)
+REQUEST_METRIC_SENSORS = {
+    "requests_total": ("mdi:swap-horizontal", None),
+    "request_timeouts": ("mdi:timer-alert-outline", None),
+    "session_creations": ("mdi:alarm-bell", None),
+    "request_latency_p95": ("mdi:timer-outline", "s"),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,14 +41,19 @@ async def async_setup_entry(
         FrontierSiliconFirmwareVersionSensor(coordinator, entry),
         FrontierSiliconDeviceModelSensor(coordinator, entry),
         FrontierSiliconVolumePercentSensor(coordinator, entry),
+        *(
+            FrontierSiliconRequestMetricSensor(coordinator, entry, key)
+            for key in REQUEST_METRIC_SENSORS
+        ),
     ])
 
 
-class FrontierSiliconModeSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconModeSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing the current mode."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "current_mode"
+    _watched_fields = frozenset({"mode", FIELD_CATALOG})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -58,14 +71,7 @@ class FrontierSiliconModeSensor(CoordinatorEntity, SensorEntity):
         mode_id = self.coordinator.data.get("mode")
         if mode_id is None:
             return None
-        
-        # Get mode name from cached modes
-        if hasattr(self.coordinator, "_modes"):
-            for mode in self.coordinator._modes:
-                if mode.get("key") == mode_id:
-                    return mode.get("label") or mode.get("name")
-        
-        return f"Mode {mode_id}"
+        return self.coordinator.catalog.mode_label(mode_id)
 
     @property
     def icon(self) -> str:
@@ -93,11 +99,12 @@ class FrontierSiliconModeSensor(CoordinatorEntity, SensorEntity):
         return "mdi:source"
 
 
-class FrontierSiliconStationSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconStationSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing the current station/track info."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "current_station"
+    _watched_fields = frozenset({"station_name", "station_text", "artist", "album"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -136,7 +143,7 @@ class FrontierSiliconStationSensor(CoordinatorEntity, SensorEntity):
         return "mdi:music-circle"
 
 
-class FrontierSiliconWiFiSignalSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconWiFiSignalSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing WiFi signal strength."""
 
     _attr_has_entity_name = True
@@ -144,6 +151,7 @@ class FrontierSiliconWiFiSignalSensor(CoordinatorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
     _attr_native_unit_of_measurement = "dBm"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"wifi_rssi"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -157,29 +165,8 @@ class FrontierSiliconWiFiSignalSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        """Return the WiFi signal strength."""
-        rssi = self.coordinator.data.get("wifi_rssi")
-        if rssi:
-            try:
-                rssi_int = int(rssi)
-                
-                # Skip if 0 (invalid/not available)
-                if rssi_int == 0:
-                    return None
-                
-                # Convert from unsigned to signed if value > 127
-                # (Some APIs return RSSI as unsigned 8-bit: 0-255)
-                if rssi_int > 127:
-                    rssi_int = rssi_int - 256
-                
-                # Sanity check: RSSI should be negative
-                if rssi_int > 0:
-                    rssi_int = -rssi_int
-                
-                return rssi_int
-            except (ValueError, TypeError):
-                pass
-        return None
+        """Return the WiFi signal strength (already signed dBm, see snapshot.py)."""
+        return self.coordinator.data.get("wifi_rssi")
 
     @property
     def icon(self) -> str:
@@ -196,12 +183,13 @@ class FrontierSiliconWiFiSignalSensor(CoordinatorEntity, SensorEntity):
         return "mdi:wifi-strength-outline"
 
 
-class FrontierSiliconIPAddressSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconIPAddressSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing IP address."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "ip_address"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"ip_address"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -215,16 +203,8 @@ class FrontierSiliconIPAddressSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        """Return the IP address."""
-        ip_int = self.coordinator.data.get("ip_address")
-        if ip_int:
-            try:
-                # Convert integer to IP address (e.g., 168299294 -> 10.8.11.30)
-                ip_num = int(ip_int)
-                return f"{(ip_num >> 24) & 0xFF}.{(ip_num >> 16) & 0xFF}.{(ip_num >> 8) & 0xFF}.{ip_num & 0xFF}"
-            except (ValueError, TypeError):
-                pass
-        return None
+        """Return the IP address (decoded from the radio's integer form when polled)."""
+        return self.coordinator.data.get("ip_address")
 
     @property
     def icon(self) -> str:
@@ -232,12 +212,13 @@ class FrontierSiliconIPAddressSensor(CoordinatorEntity, SensorEntity):
         return "mdi:ip-network"
 
 
-class FrontierSiliconMACAddressSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconMACAddressSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing MAC address."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "mac_address"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"mac_address"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -260,12 +241,13 @@ class FrontierSiliconMACAddressSensor(CoordinatorEntity, SensorEntity):
         return "mdi:network"
 
 
-class FrontierSiliconSSIDSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconSSIDSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing connected WiFi SSID."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "wifi_ssid"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"wifi_ssid"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -288,13 +270,14 @@ class FrontierSiliconSSIDSensor(CoordinatorEntity, SensorEntity):
         return "mdi:wifi"
 
 
-class FrontierSiliconSleepRemainingSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconSleepRemainingSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing remaining sleep time."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "sleep_remaining"
     _attr_native_unit_of_measurement = "min"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"sleep_timer"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -309,15 +292,9 @@ class FrontierSiliconSleepRemainingSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return the remaining sleep time in minutes."""
-        sleep_seconds = self.coordinator.data.get("sleep_timer")
-        if sleep_seconds:
-            try:
-                seconds = int(sleep_seconds)
-                if seconds > 0:
-                    minutes = round(seconds / 60.0)
-                    return minutes
-            except (ValueError, TypeError):
-                pass
+        seconds = self.coordinator.data.get("sleep_timer")
+        if seconds:
+            return round(seconds / 60.0)
         return None
 
     @property
@@ -332,25 +309,21 @@ class FrontierSiliconSleepRemainingSensor(CoordinatorEntity, SensorEntity):
         """Return additional attributes."""
         attrs = {}
         
-        sleep_seconds = self.coordinator.data.get("sleep_timer")
-        if sleep_seconds:
-            try:
-                seconds = int(sleep_seconds)
-                if seconds > 0:
-                    attrs["seconds_remaining"] = seconds
-                    attrs["formatted"] = f"{seconds // 60}:{seconds % 60:02d}"
-            except (ValueError, TypeError):
-                pass
+        seconds = self.coordinator.data.get("sleep_timer")
+        if seconds:
+            attrs["seconds_remaining"] = seconds
+            attrs["formatted"] = f"{seconds // 60}:{seconds % 60:02d}"
         
         return attrs
 
 
-class FrontierSiliconFirmwareVersionSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconFirmwareVersionSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing firmware version."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "firmware_version"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"firmware_version"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -373,12 +346,13 @@ class FrontierSiliconFirmwareVersionSensor(CoordinatorEntity, SensorEntity):
         return "mdi:chip"
 
 
-class FrontierSiliconDeviceModelSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconDeviceModelSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing device model."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "device_model"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _watched_fields = frozenset({"device_model"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -401,12 +375,13 @@ class FrontierSiliconDeviceModelSensor(CoordinatorEntity, SensorEntity):
         return "mdi:radio"
 
 
-class FrontierSiliconVolumePercentSensor(CoordinatorEntity, SensorEntity):
+class FrontierSiliconVolumePercentSensor(FrontierSiliconEntity, SensorEntity):
     """Sensor showing volume as percentage."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "volume_percent"
     _attr_native_unit_of_measurement = "%"
+    _watched_fields = frozenset({"volume", "volume_steps"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -447,3 +422,46 @@ class FrontierSiliconVolumePercentSensor(CoordinatorEntity, SensorEntity):
             return "mdi:volume-medium"
         else:
             return "mdi:volume-high"
+
+
+class FrontierSiliconRequestMetricSensor(FrontierSiliconEntity, SensorEntity):
+    """Diagnostic sensor exposing one of the radio's request metrics (disabled by default)."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry, key: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_icon, self._attr_native_unit_of_measurement = REQUEST_METRIC_SENSORS[key]
+        if key == "request_latency_p95":
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+        )
+
+    @property
+    def available(self) -> bool:
+        """Metrics are kept locally, so they stay available while the radio is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> int | float | None:
+        """Return the metric value."""
+        metrics = self.coordinator.api.metrics
+        if self._key == "requests_total":
+            return metrics.requests
+        if self._key == "request_timeouts":
+            return metrics.timeouts
+        if self._key == "session_creations":
+            return metrics.session_creations
+        return metrics.latency().percentile(0.95)
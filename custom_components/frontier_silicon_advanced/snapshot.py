@@ -0,0 +1,164 @@
+"""Immutable, typed snapshot of a radio's state.
+
+The coordinator publishes one RadioSnapshot per update instead of a plain
+dict. Raw FSAPI strings are decoded once, when a poll or push arrives, so
+entities read ready-to-show values (a signed RSSI, a dotted IP address)
+however often Home Assistant asks. Each snapshot also carries a bitmask of
+the fields that differ from the snapshot it was built from, so deciding
+which entities to write is a couple of integer ANDs.
+
+Snapshots are read-only mappings: snapshot["volume"] and snapshot.get("mode")
+work like they did on the dict.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterator, Mapping, Optional
+
+from .const import FIELD_CATALOG
+
+SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "power",
+    "available",
+    "volume",
+    "volume_steps",
+    "mute",
+    "mode",
+    "play_status",
+    "station_name",
+    "station_text",
+    "artist",
+    "album",
+    "graphic_uri",
+    "sleep_timer",
+    "eq_preset",
+    "wifi_rssi",
+    "wifi_ssid",
+    "ip_address",
+    "mac_address",
+    "firmware_version",
+    "device_model",
+)
+
+# One bit per field; FIELD_CATALOG marks a change of the mode and preset catalogs
+FIELD_BITS: dict[str, int] = {
+    field: 1 << index for index, field in enumerate(SNAPSHOT_FIELDS + (FIELD_CATALOG,))
+}
+ALL_FIELDS_MASK = (1 << len(FIELD_BITS)) - 1
+
+_FIELD_SET = frozenset(SNAPSHOT_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def field_mask(fields: frozenset[str]) -> int:
+    """Return the bitmask of a set of field names."""
+    mask = 0
+    for field in fields:
+        mask |= FIELD_BITS[field]
+    return mask
+
+
+def mask_fields(mask: int) -> frozenset[str]:
+    """Return the field names set in a bitmask."""
+    return frozenset(field for field, bit in FIELD_BITS.items() if mask & bit)
+
+
+def _to_int(value: Optional[str], default: Optional[int]) -> Optional[int]:
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def _decode_rssi(value: Optional[str]) -> Optional[int]:
+    """Return the RSSI in dBm; some firmwares report it as an unsigned byte."""
+    rssi = _to_int(value, 0)
+    if rssi == 0:
+        return None  # not available
+    if rssi > 127:
+        rssi -= 256
+    return -abs(rssi)
+
+
+def _decode_ip(value: Optional[str]) -> Optional[str]:
+    """Return an IPv4 address reported as an integer (168299294 -> 10.8.11.30) in dotted form."""
+    if not value:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    return f"{(number >> 24) & 0xFF}.{(number >> 16) & 0xFF}.{(number >> 8) & 0xFF}.{number & 0xFF}"
+
+
+def decode_field(field: str, value: Optional[str]) -> Any:
+    """Convert a raw FSAPI value into the snapshot representation of field."""
+    if field in ("volume", "sleep_timer"):
+        return _to_int(value, 0)
+    if field == "volume_steps":
+        return _to_int(value, 32)
+    if field == "mute":
+        return value == "1"
+    if field == "eq_preset":
+        return _to_int(value, None)
+    if field == "wifi_rssi":
+        return _decode_rssi(value)
+    if field == "ip_address":
+        return _decode_ip(value)
+    return value
+
+
+class RadioSnapshot(Mapping[str, Any]):
+    """Decoded radio state at one point in time, plus what changed since the previous one."""
+
+    __slots__ = SNAPSHOT_FIELDS + ("changed",)
+
+    def __init__(self, values: Mapping[str, Any], previous: Optional[RadioSnapshot] = None) -> None:
+        """Build from decoded values (missing fields are None), comparing against previous."""
+        unknown = values.keys() - _FIELD_SET
+        if unknown:
+            raise KeyError(f"Unknown snapshot fields: {sorted(unknown)}")
+        changed = 0 if previous is not None else ALL_FIELDS_MASK
+        for field in SNAPSHOT_FIELDS:
+            value = values.get(field)
+            object.__setattr__(self, field, value)
+            if previous is not None and getattr(previous, field) != value:
+                changed |= FIELD_BITS[field]
+        object.__setattr__(self, "changed", changed)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RadioSnapshot is immutable; use replace()")
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in _FIELD_SET:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SNAPSHOT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(SNAPSHOT_FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RadioSnapshot):
+            return all(getattr(self, field) == getattr(other, field) for field in SNAPSHOT_FIELDS)
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RadioSnapshot({self.as_dict()!r}, changed={self.changed_fields!r})"
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Return the names of the fields that differ from the previous snapshot."""
+        return mask_fields(self.changed)
+
+    def replace(self, values: Mapping[str, Any]) -> RadioSnapshot:
+        """Return a new snapshot with values applied; its change mask is relative to this one."""
+        return RadioSnapshot({**self.as_dict(), **values}, self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields as a plain dict."""
+        return {field: getattr(self, field) for field in SNAPSHOT_FIELDS}
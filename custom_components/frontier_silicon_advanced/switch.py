@@ -6,10 +6,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FrontierSiliconCoordinator
+from .entity import FrontierSiliconEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,11 +28,12 @@ async def async_setup_entry(
     ])
 
 
-class FrontierSiliconBluetoothSwitch(CoordinatorEntity, SwitchEntity):
+class FrontierSiliconBluetoothSwitch(FrontierSiliconEntity, SwitchEntity):
     """Switch to quickly enable Bluetooth mode."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "bluetooth_mode"
+    _watched_fields = frozenset({"mode"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -58,21 +59,22 @@ class FrontierSiliconBluetoothSwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on Bluetooth mode."""
         _LOGGER.info("Switching to Bluetooth mode")
-        await self.coordinator.api.set_mode("5")
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.set_mode("5")
+        await self.coordinator.async_command_done(success, {"mode": "5"})
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off Bluetooth mode (switch to Internet Radio)."""
         _LOGGER.info("Switching from Bluetooth to Internet Radio")
-        await self.coordinator.api.set_mode("0")
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.set_mode("0")
+        await self.coordinator.async_command_done(success, {"mode": "0"})
 
 
-class FrontierSiliconSpotifySwitch(CoordinatorEntity, SwitchEntity):
+class FrontierSiliconSpotifySwitch(FrontierSiliconEntity, SwitchEntity):
     """Switch to quickly enable Spotify mode."""
 
     _attr_has_entity_name = True
     _attr_translation_key = "spotify_mode"
+    _watched_fields = frozenset({"mode"})
 
     def __init__(
         self, coordinator: FrontierSiliconCoordinator, entry: ConfigEntry
@@ -98,11 +100,11 @@ class FrontierSiliconSpotifySwitch(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on Spotify mode."""
         _LOGGER.info("Switching to Spotify mode")
-        await self.coordinator.api.set_mode("1")
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.set_mode("1")
+        await self.coordinator.async_command_done(success, {"mode": "1"})
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off Spotify mode (switch to Internet Radio)."""
         _LOGGER.info("Switching from Spotify to Internet Radio")
-        await self.coordinator.api.set_mode("0")
-        await self.coordinator.async_request_refresh()
+        success = await self.coordinator.api.set_mode("0")
+        await self.coordinator.async_command_done(success, {"mode": "0"})
@@ -0,0 +1,285 @@
+"""HTTP transports for the FSAPI client: live, recording and replaying.
+
+FrontierSiliconAPI sends every request through a transport's get(), which
+returns the HTTP status and body or raises the aiohttp/asyncio error the
+request failed with. HttpTransport talks to the radio. RecordingTransport
+wraps another transport and appends each exchange, with its timing, to a
+gzipped JSON-lines capture; ReplayTransport serves a capture back, so a
+quirky radio's traffic can be attached to a ticket and replayed offline.
+
+Captures are masked as they are written: the PIN and session id in URLs,
+session ids in CREATE_SESSION answers, and the values of the nodes in
+MASKED_NODES (MAC address, Wi-Fi network, radio id) wherever they appear.
+Replay matches requests on the masked URL path, so it works against any
+host, PIN or session.
+
+Capture format: one JSON object per line. The first line is a header
+({"fsapi_capture": 1, "started": <unix time>}); every other line is one
+exchange:
+
+    {"t": 1.234, "ms": 38.1, "ctx": "details", "url": "/fsapi/GET_MULTIPLE?...",
+     "http": 200, "body": "<fsapiGetMultipleResponse>..."}
+
+or, for a failed request, "err" ("timeout", "disconnected", "connection")
+instead of "http" and "body". "t" is seconds since the capture started and
+"ms" the time the request took.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Awaitable, Callable, Optional, Protocol
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
+
+import aiohttp
+
+from .parser import parse_device, parse_multiple, parse_notifies, parse_value
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_FORMAT_VERSION = 1
+MASK = "****"
+
+# Nodes whose values identify the owner's network or device
+MASKED_NODES = frozenset(
+    {
+        "netremote.sys.net.wlan.macaddress",
+        "netremote.sys.net.wlan.connectedssid",
+        "netremote.sys.info.radioid",
+    }
+)
+_MIN_MASKED_LENGTH = 3  # shorter values would mask unrelated text
+
+_URL_SECRET_RE = re.compile(r"\b(pin|sid)=[^&]*")
+_SESSION_ID_RE = re.compile(rb"<sessionId>[^<]*</sessionId>")
+
+ERROR_TIMEOUT = "timeout"
+ERROR_DISCONNECTED = "disconnected"
+ERROR_CONNECTION = "connection"
+
+
+class Transport(Protocol):
+    """Sends one GET request to a radio."""
+
+    async def get(self, url: str, timeout: float, context: str) -> tuple[int, bytes]:
+        """Return (HTTP status, body); the body is empty unless the status is 200."""
+
+    async def async_close(self) -> None:
+        """Release whatever the transport holds open."""
+
+
+class HttpTransport:
+    """Transport over an aiohttp client session."""
+
+    def __init__(self, get_session: Callable[[], Awaitable[aiohttp.ClientSession]]) -> None:
+        """Initialize; get_session returns the HTTP client to send requests with."""
+        self._get_session = get_session
+
+    async def get(self, url: str, timeout: float, context: str) -> tuple[int, bytes]:
+        """Send the request to the radio."""
+        session = await self._get_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                return response.status, b""
+            return response.status, await response.read()
+
+    async def async_close(self) -> None:
+        """Nothing to release: the client session belongs to the API."""
+
+
+def mask_url(url: str) -> str:
+    """Return the path and query of url with the PIN and session id masked."""
+    parts = urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return _URL_SECRET_RE.sub(lambda match: f"{match.group(1)}={MASK}", path)
+
+
+def _masked_values(path: str, body: bytes) -> list[str]:
+    """Return the values of MASKED_NODES found in a response to path."""
+    endpoint = path.split("?", 1)[0]
+    if endpoint.endswith("/device"):
+        device = parse_device(body) or {}
+        return [device["radioId"]] if "radioId" in device else []
+    if "/GET_MULTIPLE" in endpoint:
+        return [
+            str(value)
+            for node, (value, _) in parse_multiple(body).items()
+            if node.lower() in MASKED_NODES and value is not None
+        ]
+    if "/GET_NOTIFIES" in endpoint:
+        return [str(value) for node, value in parse_notifies(body).items() if node in MASKED_NODES and value is not None]
+    if "/GET/" in endpoint and endpoint.rsplit("/", 1)[-1].lower() in MASKED_NODES:
+        value = parse_value(body)
+        return [str(value)] if value is not None else []
+    return []
+
+
+def _encode_error(err: BaseException) -> str:
+    if isinstance(err, asyncio.TimeoutError):
+        return ERROR_TIMEOUT
+    if isinstance(err, aiohttp.ServerDisconnectedError):
+        return ERROR_DISCONNECTED
+    return ERROR_CONNECTION
+
+
+def _decode_error(code: str) -> BaseException:
+    if code == ERROR_TIMEOUT:
+        return asyncio.TimeoutError()
+    if code == ERROR_DISCONNECTED:
+        return aiohttp.ServerDisconnectedError()
+    return aiohttp.ClientConnectionError("connection error (replayed)")
+
+
+class RecordingTransport:
+    """Transport that records the exchanges of another one to a masked capture file."""
+
+    def __init__(self, inner: Transport, path: str, *, max_exchanges: int, flush_every: int = 50) -> None:
+        """Initialize; the capture is written to path (gzipped JSON lines) in the background."""
+        self._inner = inner
+        self._path = path
+        self._max_exchanges = max_exchanges
+        self._flush_every = flush_every
+        self._started = time.monotonic()
+        self._pending: list[str] = [
+            json.dumps({"fsapi_capture": CAPTURE_FORMAT_VERSION, "started": round(time.time(), 3)})
+        ]
+        self._secrets: set[bytes] = set()  # escaped MASKED_NODES values seen so far
+        self._flush_task: Optional[asyncio.Task] = None
+        self.exchanges = 0
+
+    @property
+    def inner(self) -> Transport:
+        """Return the transport the requests are actually sent with."""
+        return self._inner
+
+    async def get(self, url: str, timeout: float, context: str) -> tuple[int, bytes]:
+        """Send the request through the inner transport and record the exchange."""
+        started = time.monotonic()
+        try:
+            status, body = await self._inner.get(url, timeout, context)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            self._record(url, context, started, {"err": _encode_error(err)})
+            raise
+        self._record(url, context, started, {"http": status, "body": self._mask_body(url, body)})
+        return status, body
+
+    def _mask_body(self, url: str, body: bytes) -> str:
+        """Return body as text with session ids and MASKED_NODES values replaced."""
+        if body:
+            for value in _masked_values(urlsplit(url).path, body):
+                if len(value) >= _MIN_MASKED_LENGTH:
+                    self._secrets.add(escape(value).encode())
+            body = _SESSION_ID_RE.sub(f"<sessionId>{MASK}</sessionId>".encode(), body)
+            for secret in self._secrets:
+                body = body.replace(secret, MASK.encode())
+        return body.decode("utf-8", "surrogateescape")
+
+    def _record(self, url: str, context: str, started: float, result: dict[str, Any]) -> None:
+        """Queue one exchange for the capture file."""
+        if self.exchanges >= self._max_exchanges:
+            return
+        self.exchanges += 1
+        if self.exchanges == self._max_exchanges:
+            _LOGGER.warning("FSAPI capture %s reached %d exchanges; recording stopped", self._path, self._max_exchanges)
+        now = time.monotonic()
+        line = {
+            "t": round(started - self._started, 3),
+            "ms": round((now - started) * 1000, 1),
+            "ctx": context,
+            "url": mask_url(url),
+            **result,
+        }
+        self._pending.append(json.dumps(line, ensure_ascii=False))
+        if len(self._pending) >= self._flush_every and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.get_running_loop().create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Append the queued lines to the capture file from the executor."""
+        lines, self._pending = self._pending, []
+        if lines:
+            await asyncio.get_running_loop().run_in_executor(None, self._append, lines)
+
+    def _append(self, lines: list[str]) -> None:
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        # Each flush is one gzip member; gzip readers read them back as one stream
+        with gzip.open(self._path, "at", encoding="utf-8", errors="surrogateescape") as capture:
+            capture.write("\n".join(lines) + "\n")
+
+    async def async_close(self) -> None:
+        """Write what is left of the capture and close the inner transport."""
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._async_flush()
+        _LOGGER.info("FSAPI capture written to %s (%d exchanges)", self._path, self.exchanges)
+        await self._inner.async_close()
+
+
+def load_capture(path: str) -> list[dict[str, Any]]:
+    """Return the exchanges of a capture file, in the order they were recorded."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="surrogateescape") as capture:
+        lines = [json.loads(line) for line in capture if line.strip()]
+    if not lines or lines[0].get("fsapi_capture") != CAPTURE_FORMAT_VERSION:
+        raise ValueError(f"{path} is not an FSAPI capture (version {CAPTURE_FORMAT_VERSION})")
+    return lines[1:]
+
+
+class ReplayExhausted(aiohttp.ClientConnectionError):
+    """The capture has no (more) answers for a request."""
+
+
+class ReplayTransport:
+    """Transport that answers from a capture instead of a radio.
+
+    Each masked URL gets its recorded answers in the order they were
+    captured, so a replay is deterministic whatever the host, PIN or
+    session. With realtime=True every answer takes as long as it did when
+    recorded. Once a URL's answers run out the request fails like an
+    unreachable radio, or, with repeat=True, its answers start over.
+    """
+
+    def __init__(self, exchanges: list[dict[str, Any]], *, realtime: bool = False, repeat: bool = False) -> None:
+        """Initialize from the exchanges returned by load_capture."""
+        self._realtime = realtime
+        self._repeat = repeat
+        self._recorded: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for exchange in exchanges:
+            self._recorded[exchange["url"]].append(exchange)
+        self._queues: dict[str, deque[dict[str, Any]]] = {
+            url: deque(answers) for url, answers in self._recorded.items()
+        }
+        self.served = 0
+        self.missed = 0
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> ReplayTransport:
+        """Load a capture file (blocking; call it from the executor inside Home Assistant)."""
+        return cls(load_capture(path), **kwargs)
+
+    async def get(self, url: str, timeout: float, context: str) -> tuple[int, bytes]:
+        """Serve the next recorded answer for url."""
+        key = mask_url(url)
+        queue = self._queues.get(key)
+        if queue is not None and not queue and self._repeat:
+            queue.extend(self._recorded[key])
+        if not queue:
+            self.missed += 1
+            raise ReplayExhausted(f"no recorded answer for {key}")
+
+        exchange = queue.popleft()
+        self.served += 1
+        if self._realtime:
+            await asyncio.sleep(min(exchange["ms"] / 1000, timeout))
+        if "err" in exchange:
+            raise _decode_error(exchange["err"])
+        return exchange["http"], exchange.get("body", "").encode("utf-8", "surrogateescape")
+
+    async def async_close(self) -> None:
+        """Nothing to release."""
@@ -0,0 +1,89 @@
+"""Preset harvest against the FSAPI simulator (needs a Home Assistant dev environment)."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+from fsapi_simulator import SimulatedRadio  # noqa: E402
+from homeassistant.const import CONF_HOST, CONF_PORT  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.frontier_silicon_advanced.const import CONF_PIN  # noqa: E402
+from custom_components.frontier_silicon_advanced.coordinator import FrontierSiliconCoordinator  # noqa: E402
+
+
+async def _harvest(preset_count: int) -> tuple[bool, dict]:
+    radio = SimulatedRadio(preset_count=preset_count, seed=1)
+    runner, port = await radio.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = SimpleNamespace(
+            entry_id="preset_harvest",
+            title="Simulated Radio",
+            data={CONF_HOST: "127.0.0.1", CONF_PORT: port, CONF_PIN: radio.pin},
+            options={"push_updates": False},
+        )
+        coordinator = FrontierSiliconCoordinator(hass, entry)
+        try:
+            stored = await coordinator._async_harvest_presets("0")
+            return stored, coordinator._all_presets
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+
+async def _harvest_while_unreachable() -> tuple[list[bool], dict, dict]:
+    radio = SimulatedRadio(preset_count=10, seed=1)
+    runner, port = await radio.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = SimpleNamespace(
+            entry_id="preset_harvest_unreachable",
+            title="Simulated Radio",
+            data={CONF_HOST: "127.0.0.1", CONF_PORT: port, CONF_PIN: radio.pin},
+            options={"push_updates": False},
+        )
+        coordinator = FrontierSiliconCoordinator(hass, entry)
+        try:
+            await coordinator.api.create_session()
+            radio.drop_rate = 1.0  # the preset list read times out
+            stored = [await coordinator._async_harvest_presets("0")]
+            harvested_at = dict(coordinator._preset_harvested_at)
+            radio.drop_rate = 0.0
+            stored.append(await coordinator._async_harvest_presets("0"))
+            return stored, harvested_at, coordinator._all_presets
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+
+def test_harvest_stores_presets_of_current_mode() -> None:
+    stored, presets = asyncio.run(_harvest(10))
+    assert stored is True
+    assert len(presets["0"]) == 10
+
+
+def test_harvest_reads_lists_longer_than_one_page() -> None:
+    stored, presets = asyncio.run(_harvest(150))
+    assert stored is True
+    assert len(presets["0"]) == 150
+
+
+def test_failed_harvest_is_not_recorded_as_empty() -> None:
+    stored, harvested_at, presets = asyncio.run(_harvest_while_unreachable())
+    assert stored == [False, True]
+    assert "0" not in harvested_at
+    assert len(presets["0"]) == 10
@@ -0,0 +1,398 @@
+"""Local FSAPI device simulator with latency and fault injection.
+
+Emulates the /fsapi endpoints this integration uses (CREATE_SESSION, GET,
+GET_MULTIPLE, SET, LIST_GET_NEXT and GET_NOTIFIES) and the /device
+descriptor used by discovery, well enough to run the coordinator and the
+config flow's subnet scan offline and count what they send.
+
+Run a standalone radio:
+
+    python tools/fsapi_simulator.py --port 8080 --latency 0.05 --drop-rate 0.05
+
+or embed SimulatedRadio in a script (see tools/poll_harness.py).
+Only aiohttp is required.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from html import escape
+import random
+import time
+from typing import Any, Optional
+
+from aiohttp import web
+
+TEXT = "c8_array"
+
+# node -> (FSAPI type, initial value)
+DEFAULT_NODES: dict[str, tuple[str, Any]] = {
+    "netRemote.sys.power": ("u8", 1),
+    "netRemote.sys.mode": ("u32", 0),
+    "netRemote.sys.audio.volume": ("u8", 12),
+    "netRemote.sys.audio.mute": ("u8", 0),
+    "netRemote.sys.audio.eqPreset": ("u8", 0),
+    "netRemote.sys.caps.volumeSteps": ("u8", 32),
+    "netRemote.sys.sleep": ("u32", 0),
+    "netRemote.sys.info.friendlyName": (TEXT, "Simulated Radio"),
+    "netRemote.sys.info.version": (TEXT, "ir-mmi-FS2026-0500-0052.V2.12.29c.EX65933-1A22"),
+    "netRemote.sys.info.radioId": (TEXT, "002261A1B2C3"),
+    "netRemote.sys.net.wlan.rssi": ("u8", 200),
+    "netRemote.sys.net.wlan.connectedSSID": (TEXT, "SimulatedWiFi"),
+    "netRemote.sys.net.wlan.macAddress": (TEXT, "00:22:61:A1:B2:C3"),
+    "netRemote.sys.net.ipConfig.address": ("u32", 3232235877),
+    "netRemote.play.status": ("u8", 2),
+    "netRemote.play.control": ("u8", 0),
+    "netRemote.play.info.name": (TEXT, "Simulated FM"),
+    "netRemote.play.info.text": (TEXT, "Now playing: track 0"),
+    "netRemote.play.info.artist": (TEXT, ""),
+    "netRemote.play.info.album": (TEXT, ""),
+    "netRemote.play.info.graphicUri": (TEXT, ""),
+    "netRemote.nav.state": ("u8", 0),
+    "netRemote.nav.action.selectPreset": ("u32", 0),
+    "netRemote.nav.action.navigate": ("u32", 0),
+    "netRemote.nav.action.selectItem": ("u32", 0),
+}
+
+DEFAULT_MODES = [
+    {"id": "IR", "label": "Internet radio", "selectable": 1},
+    {"id": "Podcasts", "label": "Podcasts", "selectable": 1},
+    {"id": "Spotify", "label": "Spotify", "selectable": 1},
+    {"id": "DAB", "label": "DAB", "selectable": 1},
+    {"id": "FM", "label": "FM", "selectable": 1},
+    {"id": "Bluetooth", "label": "Bluetooth", "selectable": 1},
+    {"id": "AUXIN", "label": "Audio in", "selectable": 1},
+]
+
+
+def _typed_xml(value_type: str, value: Any) -> str:
+    if value_type == TEXT:
+        return f"<{TEXT}>{escape(str(value), quote=False)}</{TEXT}>"
+    return f"<{value_type}>{int(value)}</{value_type}>"
+
+
+def _node_xml(value_type: str, value: Any) -> str:
+    return f"<value>{_typed_xml(value_type, value)}</value>"
+
+
+def _response(status: str, body: str = "") -> web.Response:
+    return web.Response(
+        text=f'<?xml version="1.0" encoding="UTF-8"?>\n<fsapiResponse>\n<status>{status}</status>\n{body}</fsapiResponse>\n',
+        content_type="text/xml",
+    )
+
+
+class SimulatedRadio:
+    """In-memory Frontier Silicon radio served over aiohttp."""
+
+    def __init__(
+        self,
+        *,
+        pin: str = "1234",
+        power: bool = True,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        invalid_sid_rate: float = 0.0,
+        node_blocked_rate: float = 0.0,
+        session_timeout: float = 600.0,
+        notify_window: float = 10.0,
+        get_multiple: bool = True,
+        preset_count: int = 10,
+        nav_size: int = 250,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Configure the simulated device.
+
+        latency/jitter: seconds added to every response.
+        drop_rate: share of requests that never get an answer (the client times out).
+        invalid_sid_rate / node_blocked_rate: share of session requests answered
+        with FS_INVALID_SID / FS_NODE_BLOCKED.
+        """
+        self.pin = pin
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.invalid_sid_rate = invalid_sid_rate
+        self.node_blocked_rate = node_blocked_rate
+        self.session_timeout = session_timeout
+        self.notify_window = notify_window
+        self.get_multiple = get_multiple
+        self._random = random.Random(seed)
+
+        self.nodes: dict[str, list[Any]] = {node: [t, v] for node, (t, v) in DEFAULT_NODES.items()}
+        self.nodes["netRemote.sys.power"][1] = 1 if power else 0
+        self.modes = [dict(mode) for mode in DEFAULT_MODES]
+        self.presets: dict[int, list[dict[str, Any]]] = {
+            mode: [{"name": f"{self.modes[mode]['label']} preset {i + 1}", "type": 1} for i in range(preset_count)]
+            for mode in (0, 3, 4)
+        }
+        self.nav_list = [{"name": f"Station {i:04d}", "type": 1, "subtype": 0} for i in range(nav_size)]
+
+        self.session_id: Optional[str] = None
+        self.session_last_used = 0.0
+        self._changes: dict[str, Any] = {}
+        self._changed = asyncio.Event()
+
+        self.requests: Counter[str] = Counter()
+        self.sessions_created = 0
+
+    # ---- state helpers -------------------------------------------------
+
+    @property
+    def power(self) -> bool:
+        return bool(self.nodes["netRemote.sys.power"][1])
+
+    def set_node(self, node: str, value: Any) -> None:
+        """Change a node value and queue it for GET_NOTIFIES."""
+        entry = self.nodes.setdefault(node, [TEXT, ""])
+        value = value if entry[0] == TEXT else int(value)
+        if entry[1] == value:
+            return
+        entry[1] = value
+        self._changes[node.lower()] = value
+        self._changed.set()
+
+    def reset_counts(self) -> None:
+        self.requests.clear()
+        self.sessions_created = 0
+
+    def _lists(self, node: str) -> Optional[list[dict[str, Any]]]:
+        if node == "netRemote.sys.caps.validModes":
+            return self.modes
+        if node == "netRemote.nav.presets":
+            return self.presets.get(self.nodes["netRemote.sys.mode"][1], [])
+        if node == "netRemote.nav.list":
+            return self.nav_list
+        return None
+
+    # ---- request plumbing ----------------------------------------------
+
+    async def _delay(self) -> None:
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _faults(self, request: web.Request, *, session: bool = True) -> Optional[web.Response]:
+        """Apply latency and fault injection; return a response to short-circuit."""
+        await self._delay()
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            # Never answer: the client sees a timeout, like an unplugged radio
+            await asyncio.sleep(3600)
+        if request.query.get("pin") != self.pin:
+            return web.Response(status=403)
+        if not session:
+            return None
+        sid = request.query.get("sid")
+        expired = time.monotonic() - self.session_last_used > self.session_timeout
+        if sid is None or sid != self.session_id or expired:
+            return _response("FS_INVALID_SID")
+        if self.invalid_sid_rate and self._random.random() < self.invalid_sid_rate:
+            self.session_id = None
+            return _response("FS_INVALID_SID")
+        self.session_last_used = time.monotonic()
+        if self.node_blocked_rate and self._random.random() < self.node_blocked_rate:
+            return _response("FS_NODE_BLOCKED")
+        return None
+
+    async def handle_device(self, request: web.Request) -> web.Response:
+        """Serve the device descriptor radios expose for discovery (no PIN needed)."""
+        self.requests["device"] += 1
+        await self._delay()
+        name = escape(str(self.nodes["netRemote.sys.info.friendlyName"][1]), quote=False)
+        version = escape(str(self.nodes["netRemote.sys.info.version"][1]), quote=False)
+        radio_id = escape(str(self.nodes["netRemote.sys.info.radioId"][1]), quote=False)
+        return web.Response(
+            text=(
+                '<?xml version="1.0" encoding="UTF-8"?>\n<netRemote>\n'
+                f"<friendlyName>{name}</friendlyName>\n<version>{version}</version>\n"
+                f"<radioId>{radio_id}</radioId>\n"
+                f"<webfsapi>http://{request.host}/fsapi</webfsapi>\n</netRemote>\n"
+            ),
+            content_type="text/xml",
+        )
+
+    async def handle_create_session(self, request: web.Request) -> web.Response:
+        self.requests["CREATE_SESSION"] += 1
+        if (fault := await self._faults(request, session=False)) is not None:
+            return fault
+        self.sessions_created += 1
+        self.session_id = str(self._random.randint(1, 2**31))
+        self.session_last_used = time.monotonic()
+        return _response("FS_OK", f"<sessionId>{self.session_id}</sessionId>\n")
+
+    async def handle_get(self, request: web.Request) -> web.Response:
+        self.requests["GET"] += 1
+        if (fault := await self._faults(request)) is not None:
+            return fault
+        node = self.nodes.get(request.match_info["node"])
+        if node is None:
+            return _response("FS_NODE_DOES_NOT_EXIST")
+        return _response("FS_OK", _node_xml(*node) + "\n")
+
+    async def handle_get_multiple(self, request: web.Request) -> web.Response:
+        self.requests["GET_MULTIPLE"] += 1
+        if not self.get_multiple:
+            await self._delay()
+            return web.Response(status=404)
+        if (fault := await self._faults(request)) is not None:
+            return fault
+        parts = []
+        for path in request.query.getall("node", []):
+            node = self.nodes.get(path)
+            if node is None:
+                parts.append(f"<fsapiResponse><node>{path}</node><status>FS_NODE_DOES_NOT_EXIST</status></fsapiResponse>")
+            else:
+                parts.append(f"<fsapiResponse><node>{path}</node><status>FS_OK</status>{_node_xml(*node)}</fsapiResponse>")
+        return web.Response(
+            text='<?xml version="1.0" encoding="UTF-8"?>\n<fsapiGetMultipleResponse>\n'
+            + "\n".join(parts)
+            + "\n</fsapiGetMultipleResponse>\n",
+            content_type="text/xml",
+        )
+
+    async def handle_set(self, request: web.Request) -> web.Response:
+        self.requests["SET"] += 1
+        if (fault := await self._faults(request)) is not None:
+            return fault
+        path = request.match_info["node"]
+        if path not in self.nodes:
+            return _response("FS_NODE_DOES_NOT_EXIST")
+        value = request.query.get("value", "")
+        if self.nodes[path][0] != TEXT and not value.lstrip("-").isdigit():
+            return _response("FS_FAIL")
+        if path == "netRemote.nav.action.selectPreset":
+            presets = self.presets.get(self.nodes["netRemote.sys.mode"][1], [])
+            if int(value) < len(presets):
+                self.set_node("netRemote.play.info.name", presets[int(value)]["name"])
+        elif path == "netRemote.nav.action.selectItem" and int(value) < len(self.nav_list):
+            self.set_node("netRemote.play.info.name", self.nav_list[int(value)]["name"])
+        elif path == "netRemote.play.control":
+            status = {"0": 0, "1": 2, "2": 3}.get(value)
+            if status is not None:
+                self.set_node("netRemote.play.status", status)
+        self.set_node(path, value)
+        return _response("FS_OK")
+
+    async def handle_list_get_next(self, request: web.Request) -> web.Response:
+        self.requests["LIST_GET_NEXT"] += 1
+        if (fault := await self._faults(request)) is not None:
+            return fault
+        items = self._lists(request.match_info["node"])
+        if items is None:
+            return _response("FS_NODE_DOES_NOT_EXIST")
+        start = int(request.match_info["start"]) + 1
+        max_items = int(request.query.get("maxItems", "20"))
+        page = items[start:start + max_items]
+        if not page and start:
+            return _response("FS_LIST_END")
+        body = []
+        for key, item in enumerate(page, start):
+            fields = "".join(
+                f'<field name="{name}">{_typed_xml(TEXT if isinstance(value, str) else "u8", value)}</field>'
+                for name, value in item.items()
+            )
+            body.append(f'<item key="{key}">{fields}</item>\n')
+        if start + max_items >= len(items):
+            body.append("<listend/>\n")
+        return _response("FS_OK", "".join(body))
+
+    async def handle_get_notifies(self, request: web.Request) -> web.Response:
+        self.requests["GET_NOTIFIES"] += 1
+        if (fault := await self._faults(request)) is not None:
+            return fault
+        if not self._changes:
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), self.notify_window)
+            except asyncio.TimeoutError:
+                return _response("FS_TIMEOUT")
+        changes, self._changes = self._changes, {}
+        body = "".join(
+            f'<notify node="{node}">{_node_xml(self._type_of(node), value)}</notify>\n'
+            for node, value in changes.items()
+        )
+        return _response("FS_OK", body)
+
+    def _type_of(self, lower_node: str) -> str:
+        for node, (value_type, _) in self.nodes.items():
+            if node.lower() == lower_node:
+                return value_type
+        return TEXT
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/device", self.handle_device)
+        app.router.add_get("/fsapi/CREATE_SESSION", self.handle_create_session)
+        app.router.add_get("/fsapi/GET_MULTIPLE", self.handle_get_multiple)
+        app.router.add_get("/fsapi/GET_NOTIFIES", self.handle_get_notifies)
+        app.router.add_get("/fsapi/GET/{node}", self.handle_get)
+        app.router.add_get("/fsapi/SET/{node}", self.handle_set)
+        app.router.add_get("/fsapi/LIST_GET_NEXT/{node}/{start}", self.handle_list_get_next)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, int]:
+        """Serve the radio; returns the runner and the bound port."""
+        # Cancel handlers whose client gave up, so dropped requests do not outlive the test
+        runner = web.AppRunner(self.make_app(), handler_cancellation=True)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner, runner.addresses[0][1]
+
+    async def tick_metadata(self, interval: float) -> None:
+        """Change the station text every interval seconds, like a live broadcast."""
+        track = 0
+        while True:
+            await asyncio.sleep(interval)
+            track += 1
+            self.set_node("netRemote.play.info.text", f"Now playing: track {track}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--pin", default="1234")
+    parser.add_argument("--off", action="store_true", help="start with the radio powered off")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency, up to this many seconds")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of requests never answered")
+    parser.add_argument("--invalid-sid-rate", type=float, default=0.0, help="share answered FS_INVALID_SID")
+    parser.add_argument("--node-blocked-rate", type=float, default=0.0, help="share answered FS_NODE_BLOCKED")
+    parser.add_argument("--session-timeout", type=float, default=600.0)
+    parser.add_argument("--no-get-multiple", action="store_true", help="reject GET_MULTIPLE like older firmware")
+    parser.add_argument("--metadata-interval", type=float, default=0.0, help="change station text every N seconds")
+    return parser.parse_args()
+
+
+async def _main() -> None:
+    args = _parse_args()
+    radio = SimulatedRadio(
+        pin=args.pin,
+        power=not args.off,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        invalid_sid_rate=args.invalid_sid_rate,
+        node_blocked_rate=args.node_blocked_rate,
+        session_timeout=args.session_timeout,
+        get_multiple=not args.no_get_multiple,
+    )
+    runner, port = await radio.start(args.host, args.port)
+    print(f"Simulated FSAPI radio on http://{args.host}:{port}/fsapi (pin {args.pin})")
+    if args.metadata_interval:
+        asyncio.create_task(radio.tick_metadata(args.metadata_interval))
+    try:
+        while True:
+            await asyncio.sleep(60)
+            print(f"requests: {dict(radio.requests)}; sessions created: {radio.sessions_created}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
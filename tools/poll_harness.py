@@ -0,0 +1,149 @@
+"""Run FrontierSiliconCoordinator against the FSAPI simulator and report cost per poll.
+
+Needs a Home Assistant development environment (the coordinator imports
+homeassistant); the radio itself is simulated by tools/fsapi_simulator.py.
+
+    python tools/poll_harness.py --cycles 20 --latency 0.03
+    python tools/poll_harness.py --cycles 20 --latency 0.03 --no-get-multiple --drop-rate 0.1
+    python tools/poll_harness.py --cycles 20 --replay capture.jsonl.gz --realtime
+
+Each cycle calls the coordinator's refresh directly (no waiting for the
+update interval) and prints its wall time and the requests the radio saw.
+--record saves the traffic as a masked capture; --replay answers from a
+capture (e.g. one recorded with the capture_traffic option on a real radio)
+instead of the simulator, at the recorded latency with --realtime.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+from fsapi_simulator import SimulatedRadio  # noqa: E402
+from homeassistant.const import CONF_HOST, CONF_PORT  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.frontier_silicon_advanced.const import CONF_PIN  # noqa: E402
+from custom_components.frontier_silicon_advanced.coordinator import FrontierSiliconCoordinator  # noqa: E402
+from custom_components.frontier_silicon_advanced.transport import (  # noqa: E402
+    RecordingTransport,
+    ReplayTransport,
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--invalid-sid-rate", type=float, default=0.0)
+    parser.add_argument("--node-blocked-rate", type=float, default=0.0)
+    parser.add_argument("--off", action="store_true", help="simulate a radio that is powered off")
+    parser.add_argument("--no-get-multiple", action="store_true")
+    parser.add_argument("--push", action="store_true", help="enable the GET_NOTIFIES listener")
+    parser.add_argument("--option", action="append", default=[], metavar="KEY=VALUE", help="extra entry option")
+    parser.add_argument("--record", metavar="PATH", help="write a masked capture (.jsonl.gz) of the traffic")
+    parser.add_argument("--replay", metavar="PATH", help="answer from a capture instead of the simulator")
+    parser.add_argument("--realtime", action="store_true", help="replay at the recorded latency")
+    return parser.parse_args()
+
+
+def _option_value(raw: str):
+    if raw.lower() in ("true", "false"):
+        return raw.lower() == "true"
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    radio = SimulatedRadio(
+        power=not args.off,
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        invalid_sid_rate=args.invalid_sid_rate,
+        node_blocked_rate=args.node_blocked_rate,
+        get_multiple=not args.no_get_multiple,
+        seed=1,
+    )
+    if args.replay:
+        replay = ReplayTransport.from_file(args.replay, realtime=args.realtime)
+    else:
+        replay = None
+        runner, port = await radio.start()
+
+    options = {"push_updates": args.push}
+    for item in args.option:
+        key, _, value = item.partition("=")
+        options[key] = _option_value(value)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = SimpleNamespace(
+            entry_id="poll_harness",
+            title="Simulated Radio",
+            data={CONF_HOST: "127.0.0.1", CONF_PORT: port if replay is None else 80, CONF_PIN: radio.pin},
+            options=options,
+        )
+        coordinator = FrontierSiliconCoordinator(hass, entry)
+        if replay is not None:
+            coordinator.api.transport = replay
+        elif args.record:
+            coordinator.api.transport = RecordingTransport(
+                coordinator.api.transport, args.record, max_exchanges=1_000_000
+            )
+
+        latencies = []
+        totals = []
+        print(f"{'cycle':>5} {'ms':>8} {'requests':>9}  breakdown")
+        try:
+            for cycle in range(1, args.cycles + 1):
+                radio.reset_counts()
+                sent = coordinator.api.metrics.requests
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                elapsed = (time.perf_counter() - start) * 1000
+                latencies.append(elapsed)
+                if replay is not None:
+                    count = coordinator.api.metrics.requests - sent
+                    breakdown = f"replayed={replay.served} unanswered={replay.missed}"
+                else:
+                    count = sum(radio.requests.values())
+                    breakdown = ", ".join(f"{name}={n}" for name, n in sorted(radio.requests.items()))
+                    if radio.sessions_created:
+                        breakdown += f" (sessions created: {radio.sessions_created})"
+                totals.append(count)
+                print(f"{cycle:>5} {elapsed:>8.1f} {count:>9}  {breakdown}")
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+            if replay is None:
+                await runner.cleanup()
+
+    print()
+    print(
+        f"cycle latency ms: mean={statistics.mean(latencies):.1f} "
+        f"p50={_percentile(latencies, 50):.1f} p95={_percentile(latencies, 95):.1f} max={max(latencies):.1f}"
+    )
+    print(f"requests per cycle: mean={statistics.mean(totals):.1f} max={max(totals)} total={sum(totals)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(_parse_args()))